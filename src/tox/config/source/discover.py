@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -24,6 +25,9 @@ SOURCE_TYPES: tuple[type[Source], ...] = (
     LegacyToml,
     TomlTox,
 )
+# sources parsed earlier by this process (such as the tox daemon), reused while the content of their file is unchanged
+_LOADED: OrderedDict[tuple[type[Source], Path], tuple[bytes, Source]] = OrderedDict()
+_KEEP_LOADED = 16
 
 
 def discover_source(config_file: Path | None, root_dir: Path | None) -> Source:
@@ -46,7 +50,7 @@ def discover_source(config_file: Path | None, root_dir: Path | None) -> Source:
             if not candidate.exists():
                 continue
             try:
-                src = src_type(candidate)
+                src = _load(src_type, candidate)
                 break
             except MissingRequiredConfigKeyError:
                 continue
@@ -68,7 +72,7 @@ def _locate_source() -> Source | None:
             candidate: Path = base / src_type.FILENAME
             if candidate.exists():
                 try:
-                    return src_type(candidate)
+                    return _load(src_type, candidate)
                 except MissingRequiredConfigKeyError as exc:
                     msg = f"{src_type.__name__} skipped loading {candidate.resolve()} due to {exc}"
                     logging.info(msg)
@@ -86,7 +90,7 @@ def _load_exact_source(config_file: Path) -> Source:
     exact_match = [s for s in SOURCE_TYPES if config_file.name == s.FILENAME]  # pragma: no cover
     for src_type in exact_match or SOURCE_TYPES:  # pragma: no branch
         try:
-            return src_type(config_file)
+            return _load(src_type, config_file)
         except MissingRequiredConfigKeyError:  # ruff:ignore[try-except-in-loop]
             pass
         except ValueError as exc:
@@ -96,6 +100,22 @@ def _load_exact_source(config_file: Path) -> Source:
     raise HandledError(msg)
 
 
+def _load(src_type: type[Source], path: Path) -> Source:
+    key = src_type, path.absolute()
+    try:
+        content = path.read_bytes()  # compared, as the modification time may not change between quick edits
+    except OSError:
+        return src_type(path)  # gone meanwhile, let the source tell
+    if (loaded := _LOADED.get(key)) is not None and loaded[0] == content:
+        _LOADED.move_to_end(key)
+        return loaded[1]
+    source = src_type(path)
+    _LOADED[key] = content, source
+    if len(_LOADED) > _KEEP_LOADED:
+        _LOADED.popitem(last=False)
+    return source
+
+
 def _create_default_source(root_dir: Path | None) -> Source:
     if root_dir is None:  # if set use that
         empty = Path.cwd()
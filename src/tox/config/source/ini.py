@@ -95,7 +95,8 @@ class IniSource(Source):
             if section.is_test_env:
                 register_factors(section.names)
                 for name in section.names:
-                    self._section_mapping[name].append(section.key)
+                    if section.key not in (mapped := self._section_mapping[name]):  # sources are reused
+                        mapped.append(section.key)
                     yield name
         # add all conditional markers that are not part of the explicitly defined sections
         for section in self.sections():
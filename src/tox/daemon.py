@@ -0,0 +1,181 @@
+"""Hand a tox invocation over to a running ``tox daemon``, skipping the interpreter start and import costs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tox.version import version
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+#: set to a non-empty value to always run in the invoking process
+DISABLE_ENV = "TOX_NO_DAEMON"
+#: the kinds of frames the daemon sends back
+STDOUT, STDERR, EXIT = b"o", b"e", b"x"
+#: the kind of frame the daemon asks the value of an environment variable with, and the client answers with
+ENV = b"v"
+_HEADER = struct.Struct("!cI")
+_LENGTH = struct.Struct("!I")
+
+
+def socket_path() -> Path:
+    """:returns: where the daemon for this interpreter and tox version listens"""
+    digest = hashlib.sha256(f"{sys.executable}\n{version}".encode()).hexdigest()[:16]
+    root = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()  # pragma: win32 cover
+    return Path(root) / f"tox-{user}" / f"{digest}.sock"
+
+
+def private(path: Path, kind: Callable[[int], bool]) -> bool:
+    """Check that no other user can use a path, so nobody else can pose as the daemon or talk to it.
+
+    :param path: the path
+    :param kind: checks the type of the file from its mode, such as :func:`stat.S_ISDIR`
+
+    :returns: whether the path is of the kind, owned by us and neither the group nor others have permissions on it
+    """
+    if not hasattr(os, "getuid"):  # pragma: win32 cover # the temporary folder is per user already
+        return True
+    try:
+        info = path.lstat()
+    except OSError:
+        return False
+    return kind(info.st_mode) and info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+
+def forward(args: Sequence[str]) -> int | None:
+    """Run an invocation within the daemon, streaming its output to our standard output and error.
+
+    The daemon gets the names of our environment variables and asks for the values the invocation reads, one at a time.
+
+    :param args: the command line arguments
+
+    :returns: the exit code, ``None`` when no daemon is listening and the invocation should run in this process
+
+    """
+    if os.environ.get(DISABLE_ENV) or not hasattr(socket, "AF_UNIX") or (args and args[0] == "daemon"):
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+    if not (private(path.parent, stat.S_ISDIR) and private(path, stat.S_ISSOCK)):
+        sys.stderr.write(f"ignore tox daemon socket {path} as other users can access it\n")
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(path))
+    except OSError:  # a daemon that did not clean up after itself
+        client.close()
+        return None
+    with client:
+        request = {
+            "args": list(args),
+            "cwd": str(Path.cwd()),
+            "env": list(os.environ),
+            "tty": [sys.stdout.isatty(), sys.stderr.isatty()],
+        }
+        send_request(client, request)
+        try:
+            return _receive(client, answer=True)
+        except KeyboardInterrupt:
+            client.shutdown(socket.SHUT_WR)  # the daemon interrupts the run, wait for it to tear down
+            return _receive(client, answer=False)
+
+
+def send_request(connection: socket.socket, request: dict[str, Any]) -> None:
+    """Send an invocation to the daemon.
+
+    :param connection: the connection to the daemon
+    :param request: the invocation
+    """
+    payload = json.dumps(request).encode()
+    connection.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def receive_request(connection: socket.socket) -> dict[str, Any]:
+    """Receive an invocation from a client.
+
+    :param connection: the connection to the client
+
+    :returns: the invocation
+    """
+    (length,) = _LENGTH.unpack(_read(connection, _LENGTH.size))
+    return json.loads(_read(connection, length))
+
+
+def send_frame(connection: socket.socket, kind: bytes, payload: bytes) -> None:
+    """Send a piece of the outcome of an invocation to the client, or an environment variable to the daemon.
+
+    :param connection: the connection to the other side
+    :param kind: what the payload is
+    :param payload: the payload
+    """
+    connection.sendall(_HEADER.pack(kind, len(payload)) + payload)
+
+
+def receive_frame(connection: socket.socket) -> tuple[bytes, bytes]:
+    """Receive what :func:`send_frame` sent.
+
+    :param connection: the connection to the other side
+
+    :returns: the kind and the payload
+
+    :raises ConnectionError: the other side hung up
+    """
+    kind, length = _HEADER.unpack(_read(connection, _HEADER.size))
+    return kind, _read(connection, length)
+
+
+def _receive(connection: socket.socket, *, answer: bool) -> int:
+    streams = {STDOUT: sys.stdout, STDERR: sys.stderr}
+    while True:
+        try:
+            kind, payload = receive_frame(connection)
+        except ConnectionError:
+            sys.stderr.write("tox daemon went away before the run finished\n")
+            return -2
+        if kind == EXIT:
+            return int(payload)
+        if kind == ENV:
+            if answer:  # after we hung up the daemon takes the variables it did not get as unset
+                name = json.loads(payload)
+                send_frame(connection, ENV, json.dumps([name, os.environ.get(name)]).encode())
+            continue
+        stream = streams[kind]
+        stream.buffer.write(payload)
+        stream.flush()
+
+
+def _read(connection: socket.socket, length: int) -> bytes:
+    data = bytearray()
+    while len(data) < length:
+        if not (chunk := connection.recv(length - len(data))):
+            raise ConnectionResetError
+        data.extend(chunk)
+    return bytes(data)
+
+
+__all__ = (
+    "DISABLE_ENV",
+    "ENV",
+    "EXIT",
+    "STDERR",
+    "STDOUT",
+    "forward",
+    "private",
+    "receive_frame",
+    "receive_request",
+    "send_frame",
+    "send_request",
+    "socket_path",
+)
@@ -40,6 +40,8 @@ class Plugin:
     def _register_plugins(self, inline: ModuleType | None) -> None:
         from tox.session import state  # ruff:ignore[import-outside-top-level]
         from tox.session.cmd import (  # ruff:ignore[import-outside-top-level]
+            cache,
+            daemon,
             depends,
             devenv,
             exec_,
@@ -50,6 +52,7 @@ class Plugin:
             schema,
             show_config,
             version_flag,
+            watch,
         )
 
         self.inline_module = inline
@@ -73,6 +76,9 @@ class Plugin:
             list_env,
             man,
             depends,
+            daemon,
+            watch,
+            cache,
             parallel,
             sequential,
             package_api,
@@ -9,15 +9,20 @@ import sys
 import time
 from typing import TYPE_CHECKING
 
-from tox.config.cli.parse import get_options
-from tox.report import HandledError, ToxHandler
-from tox.session.state import State
-
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from tox.session.state import State
+
 
 def run(args: Sequence[str] | None = None) -> None:
+    if args is None:  # invoked from the command line, a running daemon saves us from importing the rest of tox
+        from tox.daemon import forward  # ruff:ignore[import-outside-top-level]
+
+        if (forwarded := forward(sys.argv[1:])) is not None:
+            raise SystemExit(forwarded)
+    from tox.report import HandledError, ToxHandler  # ruff:ignore[import-outside-top-level]
+
     try:
         with ToxHandler.patch_thread():
             result = main(sys.argv[1:] if args is None else args)
@@ -51,6 +56,9 @@ def main(args: Sequence[str]) -> int:
 
 def setup_state(args: Sequence[str]) -> State:
     """Setup the state object of this run."""
+    from tox.config.cli.parse import get_options  # ruff:ignore[import-outside-top-level]
+    from tox.session.state import State  # ruff:ignore[import-outside-top-level]
+
     start = time.monotonic()
     # parse CLI arguments
     options = get_options(*args)
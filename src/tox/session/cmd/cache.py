@@ -0,0 +1,72 @@
+"""List and prune the wheels the wheelhouse keeps."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from tox.config.cli.parser import CORE
+from tox.plugin import impl
+from tox.tox_env.python.pip.wheelhouse import Wheelhouse, add_wheelhouse_dir_to_core
+
+if TYPE_CHECKING:
+    from tox.config.cli.parser import ToxParser
+    from tox.session.state import State
+    from tox.tox_env.python.pip.wheelhouse import Wheel
+
+
+@impl
+def tox_add_option(parser: ToxParser) -> None:
+    our = parser.add_command(
+        "cache",
+        [],
+        "list or prune the wheels the wheelhouse keeps",
+        cache,
+        inherit=frozenset({CORE}),
+    )
+    our.add_argument("--prune", action="store_true", help="remove the wheels instead of listing them")
+    our.add_argument(
+        "--older-than",
+        dest="cache_older_than",
+        metavar="days",
+        type=float,
+        default=None,
+        of_type=float | None,
+        help="only the wheels the wheelhouse took more than these many days ago",
+    )
+    our.add_argument(
+        "cache_projects",
+        nargs="*",
+        metavar="project",
+        default=[],
+        of_type=list[str],
+        help="only the wheels of these projects",
+    )
+
+
+def cache(state: State) -> int:
+    core = state.conf.core
+    add_wheelhouse_dir_to_core(core)
+    wheelhouse = Wheelhouse(core["wheelhouse_dir"])
+    options = state.conf.options
+    older_than = None if options.cache_older_than is None else options.cache_older_than * 24 * 3600
+    if options.prune:
+        removed = wheelhouse.prune(older_than, options.cache_projects)
+        print(f"removed {len(removed)} wheel(s) ({_size(removed)}) from {wheelhouse.root}")  # ruff:ignore[print]
+        return 0
+    wheels = wheelhouse.select(older_than, options.cache_projects)
+    now = time.time()
+    for wheel in wheels:
+        days = (now - wheel.added) / (24 * 3600)
+        print(f"{wheel.path.name}  {_size([wheel])}  {days:.1f} days old")  # ruff:ignore[print]
+    print(f"{len(wheels)} wheel(s) ({_size(wheels)}) in {wheelhouse.root}")  # ruff:ignore[print]
+    return 0
+
+
+def _size(wheels: list[Wheel]) -> str:
+    size = float(sum(wheel.size for wheel in wheels))
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:  # ruff:ignore[magic-value-comparison]
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
@@ -0,0 +1,305 @@
+"""Serve tox invocations from one long-running process to skip the interpreter start and import costs of each."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import queue
+import signal
+import socket
+import stat
+import sys
+import threading
+import traceback
+from collections.abc import MutableMapping
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NoReturn, cast
+
+from python_discovery import PythonInfo, _cached_py_info  # ruff:ignore[import-private-name]
+
+import tox.run
+from tox.config.cli.parser import CORE
+from tox.daemon import ENV, EXIT, STDERR, STDOUT, private, receive_frame, receive_request, send_frame, socket_path
+from tox.plugin import impl
+from tox.report import HandledError, setup_report
+from tox.tox_env import api as tox_env_api
+from tox.tox_env.python.pip.wheelhouse import clear_resolved
+from tox.tox_env.python.virtual_env.interpreter_cache import signature
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from python_discovery import PyInfoCache
+
+    from tox.config.cli.parser import ToxParser
+    from tox.session.state import State
+
+LOGGER = logging.getLogger(__name__)
+
+_SERVING = threading.Event()
+# the signature of the interpreters python-discovery knew after the previous invocation
+_PROBED: dict[Path, list[int] | None] = {}
+
+
+@impl
+def tox_add_option(parser: ToxParser) -> None:
+    parser.add_command(
+        "daemon",
+        [],
+        "serve tox invocations from a long-running background process",
+        daemon,
+        inherit=frozenset({CORE}),
+    )
+
+
+def daemon(state: State) -> int:
+    if not hasattr(socket, "AF_UNIX"):  # pragma: win32 cover
+        msg = "the tox daemon needs unix sockets, not available on this platform"
+        raise HandledError(msg)
+    if _SERVING.is_set():
+        msg = "cannot start a tox daemon from within the tox daemon"
+        raise HandledError(msg)
+    path = socket_path()
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not private(path.parent, stat.S_ISDIR):  # clients would send their environment variables to whoever owns it
+        msg = f"refuse to serve from {path.parent} as it is not a folder only you can access"
+        raise HandledError(msg)
+    if _listening(path):
+        msg = f"a tox daemon already listens on {path}"
+        raise HandledError(msg)
+    path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    path.chmod(0o600)
+    server.listen()
+    LOGGER.warning("tox daemon listens on %s, stop it with CTRL+C", path)
+    _SERVING.set()
+    try:
+        _accept(server, state)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        _SERVING.clear()
+        server.close()
+        path.unlink(missing_ok=True)
+
+
+def _listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def _accept(server: socket.socket, state: State) -> NoReturn:
+    _remember_discovery()
+    while True:
+        connection, _ = server.accept()
+        with connection:
+            _reset_discovery()
+            clear_resolved()  # references move between invocations
+            code, args = _serve(connection)
+            _remember_discovery()
+        setup_report(state.conf.options.verbosity, state.conf.options.is_colored)  # the run replaced our logging
+        LOGGER.warning("served tox %s with exit code %s", " ".join(args), code)
+
+
+def _serve(connection: socket.socket) -> tuple[int, list[str]]:
+    request = receive_request(connection)
+    args: list[str] = request["args"]
+    client = _Client(connection)
+    code = -2
+    try:
+        with _invocation(request, client):
+            code = client.run(args)
+    except KeyboardInterrupt:  # the interrupt landed after the run completed
+        pass
+    with suppress(OSError):
+        send_frame(connection, EXIT, str(code).encode())
+    return code, args
+
+
+@contextmanager
+def _invocation(request: dict[str, Any], client: _Client) -> Iterator[None]:
+    """Take over the working directory, the environment variables and the standard streams of the client."""
+    stdout, stderr = (_stream(client, kind, tty) for kind, tty in zip((STDOUT, STDERR), request["tty"], strict=True))
+    saved = sys.stdout, sys.stderr, sys.stdin, Path.cwd(), os.environ, tox_env_api._CWD  # ruff:ignore[private-member-access]
+    try:
+        os.chdir(request["cwd"])
+        # os.getenv and whoever reads os.environ at call time see the variables of the client, asked for on first use;
+        # the process environment stays the daemon's, so subprocesses get them only when passed as env
+        setattr(os, "environ", _Environ(request["env"], client.getenv))  # ruff:ignore[set-attr-with-constant]
+        tox_env_api._CWD = Path(request["cwd"])  # ruff:ignore[private-member-access]
+        with Path(os.devnull).open(encoding="utf-8") as stdin:  # the user's terminal stays with the client
+            sys.stdout, sys.stderr, sys.stdin = stdout, stderr, stdin
+            yield
+    finally:
+        for stream in (stdout, stderr):
+            stream.flush()
+        sys.stdout, sys.stderr, sys.stdin, cwd, os.environ, tox_env_api._CWD = saved  # ruff:ignore[private-member-access]
+        os.chdir(cwd)
+
+
+def _run(args: list[str]) -> int:
+    try:
+        tox.run.run(args)
+    except SystemExit as exception:
+        if exception.code is None or isinstance(exception.code, int):
+            return exception.code or 0
+        print(exception.code, file=sys.stderr)  # ruff:ignore[print]
+    except Exception:  # ruff:ignore[blind-except] # what the interpreter would print for a crashed tox
+        traceback.print_exc()
+    return 1
+
+
+class _KeepOnDisk:
+    """A python-discovery cache that keeps its entries on disk, those are validated against the interpreter."""
+
+    def py_info_clear(self) -> None:
+        """Keep the entries."""
+
+
+def _reset_discovery() -> None:
+    """Forget the interpreters changed since the previous invocation, and where interpreters were found."""
+    known = _cached_py_info._CACHE  # ruff:ignore[private-member-access]
+    kept = {
+        path: info
+        for path, info in known.items()
+        if isinstance(info, PythonInfo) and path in _PROBED and signature(path) == _PROBED[path]
+    }
+    PythonInfo.clear_cache(cast("PyInfoCache", _KeepOnDisk()))  # the PATH searched may differ for the next client
+    known.update(kept)
+
+
+def _remember_discovery() -> None:
+    """Note the state of the interpreters discovery knows, to tell which ones changed by the next invocation."""
+    _PROBED.clear()
+    _PROBED.update((path, signature(path)) for path in _cached_py_info._CACHE)  # ruff:ignore[private-member-access]
+
+
+class _Client:
+    """The ``tox`` process that handed over the invocation, at the other end of the connection."""
+
+    def __init__(self, connection: socket.socket) -> None:
+        self._sending = threading.Lock()
+        self._connection = connection
+        self._answers: queue.Queue[tuple[str, str | None] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._running = False
+        self._main = threading.get_ident()
+
+    def run(self, args: list[str]) -> int:
+        """Run the invocation, interrupting it as a CTRL+C would when the client hangs up."""
+        with self._lock:
+            self._running = True
+        threading.Thread(target=self._listen, name="tox-daemon-client", daemon=True).start()
+        code = _run(args)
+        with self._lock:
+            self._running = False
+        return code
+
+    def getenv(self, name: str) -> str | None:
+        """:returns: the value of an environment variable of the client, ``None`` if unset or the client went away"""
+        try:
+            self.send(ENV, json.dumps(name).encode())
+        except OSError:
+            return None
+        while (answer := self._answers.get()) is not None:
+            if answer[0] == name:  # drop the answers of questions an interrupt abandoned
+                return answer[1]
+        self._answers.put(None)  # the client hung up, tell the next asking too
+        return None
+
+    def send(self, kind: bytes, payload: bytes) -> None:
+        """Send a frame to the client.
+
+        :param kind: what the payload is
+        :param payload: the payload
+        """
+        with self._sending:
+            send_frame(self._connection, kind, payload)
+
+    def _listen(self) -> None:  # the client hangs up on CTRL+C
+        with suppress(OSError):
+            while True:
+                kind, payload = receive_frame(self._connection)
+                if kind == ENV:
+                    name, value = json.loads(payload)
+                    self._answers.put((name, value))
+        self._answers.put(None)
+        with self._lock:
+            if self._running:
+                signal.pthread_kill(self._main, signal.SIGINT)
+
+
+class _Environ(MutableMapping[str, str]):
+    """The environment variables of the client: all names are known upfront, values are asked for when first read."""
+
+    def __init__(self, names: list[str], fetch: Callable[[str], str | None]) -> None:
+        self._names = dict.fromkeys(names)
+        self._values: dict[str, str] = {}
+        self._fetch = fetch
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> str:
+        with self._lock:
+            if key not in self._values:
+                if key not in self._names or (value := self._fetch(key)) is None:
+                    raise KeyError(key)
+                self._values[key] = value
+            return self._values[key]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        with self._lock:
+            self._names[key] = None
+            self._values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._names[key]
+            self._values.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._names))
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def copy(self) -> dict[str, str]:
+        return dict(self)
+
+
+def _stream(client: _Client, kind: bytes, tty: bool) -> io.TextIOWrapper:  # ruff:ignore[boolean-type-hint-positional-argument]
+    channel = _Channel(client, kind, tty)
+    return io.TextIOWrapper(channel, encoding="utf-8", errors="replace", line_buffering=True, write_through=True)
+
+
+class _Channel(io.BufferedIOBase):
+    """One of the standard streams of the client."""
+
+    def __init__(self, client: _Client, kind: bytes, tty: bool) -> None:  # ruff:ignore[boolean-type-hint-positional-argument]
+        super().__init__()
+        self.name = f"<tox daemon {'stdout' if kind == STDOUT else 'stderr'}>"
+        self._client, self._kind, self._tty = client, kind, tty
+
+    @staticmethod
+    def writable() -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def write(self, data: Any) -> int:
+        payload = bytes(data)
+        if payload:
+            with suppress(OSError):  # the client went away, the run gets interrupted
+                self._client.send(self._kind, payload)
+        return len(payload)
@@ -29,7 +29,8 @@ def depends(state: State) -> int:
     order, todo = run_order(state, to_run_list)
     print(f"Execution order: {', '.join(order)}")  # ruff:ignore[print]
 
-    deps: dict[str, list[str]] = {k: [o for o in order if o in v] for k, v in todo.items()}
+    position = {env: at for at, env in enumerate(order)}
+    deps: dict[str, list[str]] = {k: sorted(v, key=position.__getitem__) for k, v in todo.items()}
     deps["ALL"] = to_run_list
 
     def _handle(at: int, env: str) -> None:
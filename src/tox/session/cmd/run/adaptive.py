@@ -0,0 +1,89 @@
+"""Follow the load of the machine with the number of environments run at once."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from tox.util.cpu import read_load
+
+if TYPE_CHECKING:
+    from tox.session.cmd.run.slots import Slots
+    from tox.util.cpu import Load
+
+logger = logging.getLogger(__name__)
+
+#: the ``--parallel`` value asking to follow the load of the machine
+ADAPTIVE_VALUE = -1
+#: seconds between two decisions, the pressure averages span ten seconds so reacting faster would overshoot
+INTERVAL = 2.0
+#: memory stall share (percent) from which we halve the parallelism, swapping slows down every environment
+MEMORY_HIGH = 10.0
+#: CPU stall share (percent) from which we run one environment less
+CPU_HIGH = 40.0
+#: CPU stall share (percent) below which we may run one environment more
+CPU_LOW = 10.0
+#: load average per CPU from which we run one environment less, when the kernel does not report pressure stalls
+LOAD_HIGH = 1.5
+
+
+class AdaptiveLimit:
+    """Raise or lower the parallel slots while environments run, running environments are never stopped."""
+
+    def __init__(self, ceiling: int) -> None:
+        """:param ceiling: the most slots we ever hand out"""
+        self.ceiling = ceiling
+        self._next = 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(ceiling={self.ceiling})"
+
+    def update(self, slots: Slots) -> None:
+        """Resize the slots to the current load, at most once every :data:`INTERVAL` seconds.
+
+        :param slots: the slots to resize
+        """
+        if (now := time.monotonic()) < self._next:
+            return
+        self._next = now + INTERVAL
+        load = read_load()
+        target, reason = self.decide(slots.total, slots.busy, load)
+        if target != slots.total:
+            logger.info("adaptive parallel %d -> %d: %s (%r)", slots.total, target, reason, load)
+            slots.total = target
+
+    def decide(self, current: int, busy: int, load: Load) -> tuple[int, str]:
+        """Pick the parallel slots for the given load, moving one step at a time unless memory runs out.
+
+        :param current: the slots we have now
+        :param busy: the slots taken by running environments
+        :param load: the load of the machine
+
+        :returns: the new number of slots and why we picked it
+
+        """
+        ceiling = min(self.ceiling, load.cpus)
+        if current > ceiling:
+            return ceiling, f"only {load.cpus} usable CPUs"
+        if load.memory_pressure is not None and load.memory_pressure >= MEMORY_HIGH:
+            return max(1, current // 2), f"memory pressure {load.memory_pressure:.1f}%"
+        if load.cpu_pressure is not None:
+            if load.cpu_pressure >= CPU_HIGH:
+                return max(1, current - 1), f"CPU pressure {load.cpu_pressure:.1f}%"
+            idle = load.cpu_pressure < CPU_LOW
+        elif load.load_average is not None:
+            if load.load_average >= LOAD_HIGH:
+                return max(1, current - 1), f"load average {load.load_average:.2f} per CPU"
+            idle = load.load_average < 1
+        else:
+            idle = True
+        if idle and busy >= current < ceiling:  # only grow when all slots are in use
+            return current + 1, "spare CPU capacity"
+        return current, "steady"
+
+
+__all__ = (
+    "ADAPTIVE_VALUE",
+    "AdaptiveLimit",
+)
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import time
 from argparse import Action, ArgumentError, ArgumentParser, Namespace
-from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, ThreadPoolExecutor
-from concurrent.futures import wait as wait_futures
-from fnmatch import fnmatchcase
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from fnmatch import translate
 from pathlib import Path
+from queue import Empty, SimpleQueue
 from signal import SIGINT, Handlers, signal
 from threading import Event, Thread
 from typing import TYPE_CHECKING, Any, cast
@@ -21,13 +22,19 @@ from colorama import Fore
 from tox.execute import Outcome
 from tox.journal import write_journal
 from tox.report import HandledError
+from tox.session.cmd.run.adaptive import ADAPTIVE_VALUE, INTERVAL, AdaptiveLimit
+from tox.session.cmd.run.discover import discover_base_pythons
+from tox.session.cmd.run.history import DurationHistory
+from tox.session.cmd.run.jobserver import POLL, jobserver
+from tox.session.cmd.run.shard import Shard, partition
 from tox.session.cmd.run.single import ToxEnvRunResult, run_one
+from tox.session.cmd.run.slots import Slots
 from tox.tox_env.errors import Fail
-from tox.util.graph import stable_topological_sort
+from tox.util.graph import ReadySet, critical_path, stable_topological_sort
 from tox.util.spinner import MISS_DURATION, Spinner
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Collection, Sequence
 
     from tox.config.types import EnvList
     from tox.session.state import State
@@ -121,6 +128,24 @@ def env_run_create_flags(parser: ArgumentParser, mode: str) -> None:
             dest="fail_fast",
             help="stop execution after the first environment failure",
         )
+        parser.add_argument(
+            "--cached",
+            action="store_true",
+            default=False,
+            dest="cached",
+            help="do not run the commands of environments whose cache_inputs, configuration, installed packages and "
+            "environment variables are unchanged since their last successful run",
+        )
+        parser.add_argument(
+            "--shard",
+            dest="shard",
+            metavar="k/n",
+            type=Shard,
+            of_type=Shard | None,
+            default=None,
+            help="run only the k-th of n parts of the selected environments, split by recorded durations keeping"
+            " depends together",
+        )
     if mode not in {"devenv", "depends"}:
         parser.add_argument(
             "--develop",
@@ -192,6 +217,8 @@ def _get_outcome_message(run: ToxEnvRunResult) -> tuple[str, int]:
         msg, color = "NOT AVAILABLE", Fore.YELLOW
     elif run.skipped:
         msg, color = "SKIP", Fore.YELLOW
+    elif run.cached:
+        msg, color = "CACHED", Fore.GREEN
     elif run.code == Outcome.OK:
         msg, color = "OK", Fore.GREEN
     elif run.ignore_outcome:
@@ -222,14 +249,24 @@ def _print_unused(is_colored: bool, section: str, unused: list[str]) -> None:  #
     print(f"{Fore.YELLOW if is_colored else ''}{msg}{Fore.RESET if is_colored else ''}")  # ruff:ignore[print]
 
 
-def execute(state: State, max_workers: int | None, has_spinner: bool, live: bool) -> int:  # ruff:ignore[boolean-type-hint-positional-argument]
+def execute(
+    state: State,
+    max_workers: int | None,
+    *,
+    has_spinner: bool,
+    live: bool,
+    select: Collection[str] | None = None,
+) -> int:
     interrupt, done = Event(), Event()
     results: list[ToxEnvRunResult] = []
     future_to_env: dict[Future[ToxEnvRunResult], ToxEnv] = {}
-    state.envs.ensure_only_run_env_is_active()
-    to_run_list: list[str] = list(state.envs.iter())
-    for name in to_run_list:
-        cast("RunToxEnv", state.envs[name]).mark_active()
+    # finished futures (via done callbacks) and wake-up calls (None) for the scheduler thread
+    completions: SimpleQueue[Future[ToxEnvRunResult] | None] = SimpleQueue()
+    history = DurationHistory(state.conf.core["work_dir"])
+    to_run_list = _to_run(state, select, history)
+    if to_run_list is None:
+        return Outcome.OK
+    adaptive = getattr(state.conf.options, "parallel", None) == ADAPTIVE_VALUE
 
     scheduler_error: list[BaseException] = []
 
@@ -243,12 +280,15 @@ def execute(state: State, max_workers: int | None, has_spinner: bool, live: bool
                 to_run_list,
                 results,
                 future_to_env,
+                completions,
                 interrupt,
                 done,
                 max_workers,
                 spinner,
                 live,
                 scheduler_error,
+                history,
+                adaptive,
             ),
         )
         thread.start()
@@ -266,6 +306,8 @@ def execute(state: State, max_workers: int | None, has_spinner: bool, live: bool
                 # if cannot be canceled and not done -> still runs
                 if canceled is False and not future.done():  # pragma: no branch
                     tox_env.interrupt()
+            # wake up the scheduler blocked on the next completion, so it stops tracking the interrupted environments
+            completions.put(None)
             done.wait()
             thread.join()
             return previous, True
@@ -278,6 +320,8 @@ def execute(state: State, max_workers: int | None, has_spinner: bool, live: bool
             raise scheduler_error[0]
     finally:
         ordered_results = _order_results(state, results, to_run_list)
+        if not has_previous:  # an interrupted run does not tell how long the environments take
+            _record_durations(history, results)
         # write the journal
         write_journal(getattr(state.conf.options, "result_json", None), state._journal)  # ruff:ignore[private-member-access]
         # warn about unused config keys
@@ -296,6 +340,30 @@ def execute(state: State, max_workers: int | None, has_spinner: bool, live: bool
     return exit_code
 
 
+def _to_run(state: State, select: Collection[str] | None, history: DurationHistory) -> list[str] | None:
+    """:returns: the environments to run in configuration order, ``None`` when our shard got none of them"""
+    state.envs.ensure_only_run_env_is_active()
+    to_run_list: list[str] = [env for env in state.envs.iter() if select is None or env in select]
+    for name in to_run_list:
+        cast("RunToxEnv", state.envs[name]).mark_active()
+    if (shard := getattr(state.conf.options, "shard", None)) is not None:
+        to_run_list = _select_shard(state, to_run_list, shard, history)
+        if not to_run_list:
+            logger.warning("shard %s has no environments to run", shard)
+            return None
+    return to_run_list
+
+
+def _record_durations(history: DurationHistory, results: list[ToxEnvRunResult]) -> None:
+    for result in results:
+        if not (result.skipped or result.unavailable or result.cached) and result.duration != MISS_DURATION:
+            history.record(result.name, result.duration)
+    try:
+        history.write()
+    except OSError:  # the history only guides scheduling, failing to save it must not fail the run
+        logger.warning("failed to save environment durations to %r", history, exc_info=True)
+
+
 def _order_results(state: State, results: list[ToxEnvRunResult], to_run_list: list[str]) -> list[ToxEnvRunResult]:
     name_to_run = {r.name: r for r in results}
     ordered: list[ToxEnvRunResult] = [
@@ -329,14 +397,28 @@ class ToxSpinner(Spinner):
 
 def _next_completed(
     future_to_env: dict[Future[ToxEnvRunResult], ToxEnv],
+    completions: SimpleQueue[Future[ToxEnvRunResult] | None],
     interrupt: Event,
+    timeout: float | None = None,
 ) -> Future[ToxEnvRunResult] | None:
+    """Wait for the next tracked future to finish.
+
+    :raises Empty: when nothing finished within the timeout and we are not interrupted
+    :returns: the finished future, ``None`` when interrupted
+
+    """
     while True:
-        done_futures, _ = wait_futures(list(future_to_env), timeout=1, return_when=FIRST_COMPLETED)
-        if done_futures:
-            return done_futures.pop()
-        if interrupt.is_set():
-            return None
+        try:  # blocks until a future finishes or the main thread wakes us up
+            future = completions.get(timeout=timeout)
+        except Empty:
+            if interrupt.is_set():  # the main thread wakes us up once the running environments got interrupted
+                continue
+            raise
+        if future is None:
+            if interrupt.is_set():
+                return None
+        elif future in future_to_env:  # futures dropped on interrupt may still report in, ignore those
+            return future
 
 
 def _queue_and_wait(  # ruff:ignore[too-many-arguments]
@@ -344,16 +426,33 @@ def _queue_and_wait(  # ruff:ignore[too-many-arguments]
     to_run_list: list[str],
     results: list[ToxEnvRunResult],
     future_to_env: dict[Future[ToxEnvRunResult], ToxEnv],
+    completions: SimpleQueue[Future[ToxEnvRunResult] | None],
     interrupt: Event,
     done: Event,
     max_workers: int | None,
     spinner: ToxSpinner,
     live: bool,  # ruff:ignore[boolean-type-hint-positional-argument]
     error: list[BaseException],
+    history: DurationHistory,
+    adaptive: bool,  # ruff:ignore[boolean-type-hint-positional-argument]
 ) -> None:
     try:
         try:
-            _do_queue_and_wait(state, to_run_list, results, future_to_env, interrupt, max_workers, spinner, live)
+            # off the main thread, so an interrupt does not abandon the discovery threads
+            discover_base_pythons(state.envs[name] for name in to_run_list)
+            _do_queue_and_wait(
+                state,
+                to_run_list,
+                results,
+                future_to_env,
+                completions,
+                interrupt,
+                max_workers,
+                spinner,
+                live,
+                history,
+                adaptive,
+            )
         except BaseException as exception:  # ruff:ignore[blind-except] # re-raised in the main thread
             error.append(exception)
     finally:
@@ -376,18 +475,30 @@ def _do_queue_and_wait(  # ruff:ignore[complex-structure, too-many-arguments, to
     to_run_list: list[str],
     results: list[ToxEnvRunResult],
     future_to_env: dict[Future[ToxEnvRunResult], ToxEnv],
+    completions: SimpleQueue[Future[ToxEnvRunResult] | None],
     interrupt: Event,
     max_workers: int | None,
     spinner: ToxSpinner,
     live: bool,  # ruff:ignore[boolean-type-hint-positional-argument]
+    history: DurationHistory,
+    adaptive: bool,  # ruff:ignore[boolean-type-hint-positional-argument]
 ) -> None:
     options = state._options  # ruff:ignore[private-member-access]
     with spinner:  # ruff:ignore[too-many-nested-blocks]
         # an unbounded pool (-p all) sizes to the selection; keep at least one worker so an empty
         # selection does not raise ValueError from ThreadPoolExecutor
         max_workers = max(1, len(to_run_list)) if max_workers is None else max_workers
-        completed: set[str] = set()
-        envs_to_run_generator = ready_to_run_envs(state, to_run_list, completed)
+        order, todo = run_order(state, to_run_list)
+        ready = ReadySet(todo, order)
+        slots = Slots(max_workers, state.conf.core["resource_capacity"])
+        limit = AdaptiveLimit(max_workers) if adaptive else None
+        if limit is not None:
+            logger.info("adaptive parallel starts with %d slots", max_workers)
+        priority = None
+        if getattr(options.parsed, "schedule", "config") == "critical-path":
+            priority = schedule_priority(order, todo, history)
+            if priority is None:
+                logger.info("no recorded environment durations yet, scheduling in configuration order")
 
         def _run(tox_env: RunToxEnv) -> ToxEnvRunResult:
             spinner.add(tox_env.conf.name)
@@ -397,17 +508,27 @@ def _do_queue_and_wait(  # ruff:ignore[complex-structure, too-many-arguments, to
                 suspend_display=live is False,
             )
 
-        env_list: list[str] = []
+        env_list: list[str] = []  # ready to run, but waiting for a free worker
         stop_scheduling = False
-        fail_fast_enabled = options.parsed.fail_fast or any(
-            cast("RunToxEnv", state.envs[env]).conf["fail_fast"] for env in to_run_list
-        )
-        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tox-driver") as executor:
+        with (
+            jobserver(getattr(options.parsed, "jobserver", False), max_workers) as tokens,
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tox-driver") as executor,
+        ):
             while True:
-                envs_to_queue = (
-                    env_list[:1] if max_workers == 1 and fail_fast_enabled and not interrupt.is_set() else env_list
-                )
-                for env in envs_to_queue:  # queue all available (or one at a time if sequential + fail-fast)
+                # hand out only what fits into the free slots and resources, so the pick of what runs next happens as
+                # late as possible: fail fast stops without starting more, and higher priority work can overtake
+                if interrupt.is_set():
+                    envs_to_queue, env_list = env_list, []
+                else:
+                    if limit is not None:
+                        limit.update(slots)
+                    confs = [state.envs[env].conf for env in env_list]
+                    envs_to_queue = slots.admit(
+                        ((conf.name, conf["parallel_weight"], conf["resources"]) for conf in confs),
+                        None if tokens is None else tokens.acquire,
+                    )
+                    env_list = [env for env in env_list if env not in envs_to_queue]
+                for env in envs_to_queue:
                     tox_env_to_run = cast("RunToxEnv", state.envs[env])
                     if interrupt.is_set():  # queue the rest as failed upfront
                         tox_env_to_run.teardown()
@@ -415,15 +536,27 @@ def _do_queue_and_wait(  # ruff:ignore[complex-structure, too-many-arguments, to
                         res = ToxEnvRunResult(name=env, skipped=False, code=-2, outcomes=[], duration=MISS_DURATION)
                         future.set_result(res)
                     else:
+                        if tokens is not None:
+                            tox_env_to_run.make_flags = tokens.make_flags
                         future = executor.submit(_run, tox_env_to_run)
                     future_to_env[future] = tox_env_to_run
-                env_list = env_list[len(envs_to_queue) :]
+                    future.add_done_callback(completions.put)
 
                 if not future_to_env:
                     result: ToxEnvRunResult | None = None
                 else:
-                    completed_future = _next_completed(future_to_env, interrupt)
-                    if completed_future is None:
+                    # in adaptive mode wake up regularly, so freed capacity is used without waiting for a completion
+                    timeout = None if limit is None else INTERVAL
+                    if tokens is not None and env_list:  # so are tokens other processes give back to the jobserver
+                        timeout = POLL
+                    woken = False
+                    try:
+                        completed_future = _next_completed(future_to_env, completions, interrupt, timeout)
+                    except Empty:  # nothing finished, go resize the slots and look for tokens
+                        completed_future, woken = None, True
+                    if woken:
+                        result = None
+                    elif completed_future is None:
                         for pending_future, pending_env in list(future_to_env.items()):
                             if not pending_future.cancel() and not pending_future.done():
                                 pending_env.interrupt()
@@ -432,6 +565,9 @@ def _do_queue_and_wait(  # ruff:ignore[complex-structure, too-many-arguments, to
                         result = None
                     else:
                         tox_env_done = future_to_env.pop(completed_future)
+                        slots.release(tox_env_done.conf.name)
+                        if tokens is not None:
+                            tokens.release(tox_env_done.conf.name)
                         try:
                             result = completed_future.result()
                         except CancelledError:
@@ -445,7 +581,7 @@ def _do_queue_and_wait(  # ruff:ignore[complex-structure, too-many-arguments, to
                                 duration=MISS_DURATION,
                             )
                         results.append(result)
-                        completed.add(result.name)
+                        ready.complete(result.name)
                         if (
                             result.code != Outcome.OK
                             and not result.skipped
@@ -459,8 +595,10 @@ def _do_queue_and_wait(  # ruff:ignore[complex-structure, too-many-arguments, to
                             for pending_future in list(future_to_env.keys()):
                                 pending_future.cancel()
 
-                if not interrupt.is_set() and not stop_scheduling and not env_list:
-                    env_list = next(envs_to_run_generator, [])
+                if not interrupt.is_set() and not stop_scheduling:
+                    env_list.extend(ready.pop())
+                    if priority is not None:
+                        env_list.sort(key=lambda e: -priority[e])
                 # if nothing running and nothing more to run we're done
                 final_run = not env_list and not future_to_env
                 if final_run:  # disable report on final env
@@ -469,6 +607,8 @@ def _do_queue_and_wait(  # ruff:ignore[complex-structure, too-many-arguments, to
                     _handle_one_run_done(result, spinner, state, live)
                 if final_run:
                     break
+    if max_workers > 1:  # helps tuning parallel_weight and resource_capacity
+        logger.info("parallel slots busy %.2f of %d on average, %d at peak", slots.average, slots.total, slots.peak)
 
 
 def _handle_one_run_done(
@@ -501,31 +641,63 @@ def _handle_one_run_done(
                 state._options.log_handler.write_out_err(out_err)  # ruff:ignore[private-member-access]
 
 
-def ready_to_run_envs(state: State, to_run: list[str], completed: set[str]) -> Iterator[list[str]]:
-    """Generate tox environments ready to run."""
-    order, todo = run_order(state, to_run)
-    while order:
-        ready_to_run: list[str] = []
-        new_order: list[str] = []
-        for env in order:  # collect next batch of ready to run
-            if todo[env] - completed:
-                new_order.append(env)
-            else:
-                ready_to_run.append(env)
-        order = new_order
-        yield ready_to_run
+def schedule_priority(order: list[str], todo: dict[str, set[str]], history: DurationHistory) -> dict[str, float] | None:
+    """Prioritize environments by the expected duration of the longest chain of work they unlock.
+
+    Environments that never ran are expected to take the average of those that did.
+
+    :param order: the environments to run, in run order
+    :param todo: environment to the environments it depends on
+    :param history: the durations of previous runs
+
+    :returns: environment name to priority (higher runs first), ``None`` when there is no history to go by
+
+    """
+    known = {env: duration for env in order if (duration := history.expected(env)) is not None}
+    if not known:
+        return None
+    average = sum(known.values()) / len(known)
+    return critical_path(todo, order, {env: known.get(env, average) for env in order})
+
+
+def _select_shard(state: State, to_run_list: list[str], shard: Shard, history: DurationHistory) -> list[str]:
+    order, todo = run_order(state, to_run_list)
+    known = {env: duration for env in order if (duration := history.expected(env)) is not None}
+    average = sum(known.values()) / len(known) if known else 1.0  # without any history balance the counts
+    weight = {env: known.get(env, average) for env in order}
+    parts = partition(order, todo, weight, shard.total)
+    if known:
+        predicted = " ".join(f"{at}={sum(weight[e] for e in envs):.1f}s" for at, envs in enumerate(parts, 1))
+    else:
+        predicted = "by count " + " ".join(f"{at}={len(envs)}" for at, envs in enumerate(parts, 1))
+    selected = set(parts[shard.index - 1])
+    logger.warning("shard %s runs %d of %d environments, predicted %s", shard, len(selected), len(order), predicted)
+    return [env for env in to_run_list if env in selected]
 
 
 def run_order(state: State, to_run: list[str]) -> tuple[list[str], dict[str, set[str]]]:
     to_run_set = set(to_run)
+    selected: dict[str, set[str]] = {}  # depends pattern to the environments it selects, resolved once per pattern
     todo: dict[str, set[str]] = {}
     for env in to_run:
         run_env = cast("RunToxEnv", state.envs[env])
-        depends = set(cast("EnvList", run_env.conf["depends"]).envs)
-        todo[env] = {name for dep in depends for name in to_run_set if fnmatchcase(name, dep)} - {env}
+        depends: set[str] = set()
+        for pattern in cast("EnvList", run_env.conf["depends"]).envs:
+            if (names := selected.get(pattern)) is None:
+                names = selected[pattern] = _select(pattern, to_run, to_run_set)
+            depends.update(names)
+        depends.discard(env)
+        todo[env] = depends
     try:
         order = stable_topological_sort(todo)
     except ValueError as exception:
         msg = f"circular dependency detected between environments: {exception}"
         raise HandledError(msg) from exception
     return order, todo
+
+
+def _select(pattern: str, to_run: list[str], to_run_set: set[str]) -> set[str]:
+    if not any(char in pattern for char in "*?["):  # not a glob, a plain name
+        return {pattern} if pattern in to_run_set else set()
+    match = re.compile(translate(pattern)).match
+    return {name for name in to_run if match(name)}
@@ -0,0 +1,54 @@
+"""Resolve the base pythons of the environments to run up front, concurrently and once per distinct discovery."""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from tox.tox_env.python.api import Python
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from tox.tox_env.api import ToxEnv
+
+LOGGER = logging.getLogger(__name__)
+
+
+def discover_base_pythons(envs: Iterable[ToxEnv]) -> None:
+    """Resolve the base python of the environments, so their setup does not probe interpreters one after the other.
+
+    Environments with the same :meth:`~tox.tox_env.python.api.Python.base_python_key` share the interpreter one of them
+    resolved. Failures are left for the setup of the environment to report, as without this stage.
+
+    :param envs: the environments about to run
+    """
+    groups: dict[str, list[Python]] = {}
+    for env in envs:
+        if not isinstance(env, Python) or env._base_python_searched:  # ruff:ignore[private-member-access]
+            continue
+        try:
+            key = env.base_python_key()
+        except Exception as exception:  # ruff:ignore[blind-except] # the setup reports it
+            LOGGER.debug("cannot discover base python of %s up front: %r", env.name, exception)
+            continue
+        if key is not None:
+            groups.setdefault(key, []).append(env)
+    if not groups:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(groups), 32), thread_name_prefix="tox-discover") as executor:
+        list(executor.map(_resolve, (first for first, *_ in groups.values())))
+    for first, *others in groups.values():
+        for env in others:
+            env.share_base_python(first)
+
+
+def _resolve(env: Python) -> None:
+    try:
+        _ = env.base_python
+    except Exception as exception:  # ruff:ignore[blind-except] # missing interpreters skip or fail within the setup
+        LOGGER.debug("base python of %s not found up front: %r", env.name, exception)
+
+
+__all__ = ("discover_base_pythons",)
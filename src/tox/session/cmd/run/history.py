@@ -0,0 +1,68 @@
+"""Remember how long tox environments took to run across invocations."""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+#: weight of the latest run when blending it into the expected duration, older runs fade out geometrically
+SMOOTHING = 0.5
+
+
+class DurationHistory:
+    """Expected run duration of tox environments, persisted in the work directory."""
+
+    def __init__(self, work_dir: Path) -> None:
+        self._path = work_dir / ".tox-durations.json"
+        self._content = self._load()
+        self._updated: dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self._path})"
+
+    def __bool__(self) -> bool:
+        return bool(self._content)
+
+    def _load(self) -> dict[str, float]:
+        try:
+            value = json.loads(self._path.read_text())
+        except (ValueError, OSError):
+            return {}
+        if not isinstance(value, dict):  # a corrupted file means we start over
+            return {}
+        return {
+            k: float(v) for k, v in value.items() if isinstance(v, int | float) and not isinstance(v, bool) and v >= 0
+        }
+
+    def expected(self, name: str) -> float | None:
+        """:returns: the expected run duration of an environment in seconds, ``None`` if it never ran"""
+        return self._content.get(name)
+
+    def record(self, name: str, duration: float) -> None:
+        """Blend a new run duration of an environment into its expected duration.
+
+        :param name: the name of the tox environment
+        :param duration: how long the run took, in seconds
+
+        """
+        previous = self._content.get(name)
+        value = duration if previous is None else SMOOTHING * duration + (1 - SMOOTHING) * previous
+        self._content[name] = self._updated[name] = value
+
+    def write(self) -> None:
+        """Persist the durations recorded by this run, keeping entries other invocations wrote meanwhile."""
+        if not self._updated:
+            return
+        content = {**self._load(), **self._updated}
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self._path.with_name(f"{self._path.name}.{os.getpid()}")
+        temp.write_text(json.dumps(content, sort_keys=True))
+        temp.replace(self._path)  # atomic, so a concurrent reader never sees a half written file
+        self._updated = {}
+
+
+__all__ = ("DurationHistory",)
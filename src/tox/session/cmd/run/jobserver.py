@@ -0,0 +1,157 @@
+"""Share one CPU budget with make and the tools run by the environments through the GNU make jobserver protocol."""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+logger = logging.getLogger(__name__)
+
+#: seconds between two looks for tokens other processes gave back, those do not show up as a completion
+POLL = 0.1
+_AUTH = re.compile(r"--jobserver-(?:auth|fds)=(\S+)")
+
+
+class JobServer:
+    """Tokens of a GNU make jobserver, each running environment beyond the first holds one."""
+
+    def __init__(self, read_fd: int, write_fd: int, make_flags: str | None, folder: Path | None = None) -> None:
+        """Use a jobserver over already opened, non-blocking descriptors.
+
+        :param read_fd: where to take tokens from
+        :param write_fd: where to give tokens back to
+        :param make_flags: the ``MAKEFLAGS`` that let the tools run by the environments join, ``None`` if they cannot
+        :param folder: the folder of the named pipe we created, removed on close
+
+        """
+        self.make_flags = make_flags
+        self._read_fd, self._write_fd = read_fd, write_fd
+        self._implicit: str | None = None  # every jobserver client owns one token without taking it
+        self._held: dict[str, bytes] = {}
+        self._folder = folder
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(make_flags={self.make_flags!r}, held={len(self._held)})"
+
+    @classmethod
+    def join(cls, environ: Mapping[str, str]) -> JobServer | None:
+        """Become a client of the jobserver we run under.
+
+        :param environ: the environment variables tox got started with
+
+        :returns: the jobserver, ``None`` when ``MAKEFLAGS`` does not announce one we can reach
+
+        """
+        make_flags = environ.get("MAKEFLAGS", "")
+        if not (found := _AUTH.findall(make_flags)):
+            return None
+        auth = found[-1]  # make appends, the last one wins
+        try:
+            if auth.startswith("fifo:"):
+                read_fd = os.open(auth[len("fifo:") :], os.O_RDWR | os.O_NONBLOCK)
+                return cls(read_fd, read_fd, make_flags)
+            read, write = (int(i) for i in auth.split(","))
+            # reopen the pipe to get our own non-blocking file description, make blocks on the inherited one
+            read_fd = os.open(f"/proc/self/fd/{read}", os.O_RDONLY | os.O_NONBLOCK)
+            write_fd = os.open(f"/proc/self/fd/{write}", os.O_WRONLY | os.O_NONBLOCK)
+        except (OSError, ValueError) as exception:
+            logger.warning("cannot join the jobserver %s from MAKEFLAGS: %s", auth, exception)
+            return None
+        # the environments run with closed inherited descriptors, so they cannot join a pipe based jobserver
+        return cls(read_fd, write_fd, None)
+
+    @classmethod
+    def create(cls, jobs: int) -> JobServer | None:
+        """Start a jobserver others can join through a named pipe.
+
+        :param jobs: the size of the CPU budget shared by tox and the tools run by the environments
+
+        :returns: the jobserver, ``None`` on platforms without named pipes
+
+        """
+        if not hasattr(os, "mkfifo"):  # pragma: win32 cover
+            logger.warning("the jobserver needs named pipes, not available on this platform")
+            return None
+        folder = Path(tempfile.mkdtemp(prefix="tox-jobserver-"))
+        fifo = folder / "fifo"
+        os.mkfifo(fifo, 0o600)
+        fd = os.open(fifo, os.O_RDWR | os.O_NONBLOCK)
+        os.write(fd, b"+" * (jobs - 1))  # the first job runs on the implicit token
+        return cls(fd, fd, f"-j{jobs} --jobserver-auth=fifo:{fifo}", folder)
+
+    def acquire(self, name: str) -> bool:
+        """Take a token for an environment about to start.
+
+        :param name: the name of the environment
+
+        :returns: ``True`` when the environment may start
+
+        """
+        if self._implicit is None:
+            self._implicit = name
+            return True
+        try:
+            token = os.read(self._read_fd, 1)
+        except BlockingIOError:
+            return False
+        if not token:  # pragma: no cover # all writers closed the pipe
+            return False
+        self._held[name] = token
+        return True
+
+    def release(self, name: str) -> None:
+        """Give back the token of a finished environment, it is fine to release one that never got a token.
+
+        :param name: the name of the environment
+        """
+        if self._implicit == name:
+            self._implicit = None
+        elif (token := self._held.pop(name, None)) is not None:
+            os.write(self._write_fd, token)
+
+    def close(self) -> None:
+        """Give back the tokens still held and stop using the jobserver."""
+        for name in list(self._held):
+            with suppress(OSError):  # the jobserver is gone, nothing to give back to
+                self.release(name)
+        for fd in {self._read_fd, self._write_fd}:
+            os.close(fd)
+        if self._folder is not None:
+            shutil.rmtree(self._folder, ignore_errors=True)
+
+
+@contextmanager
+def jobserver(serve: bool, jobs: int) -> Iterator[JobServer | None]:  # ruff:ignore[boolean-type-hint-positional-argument]
+    """Use the jobserver we run under, otherwise start one when asked to.
+
+    :param serve: start a jobserver when we do not run under one
+    :param jobs: the size of the CPU budget when we start a jobserver
+
+    """
+    server = JobServer.join(os.environ)
+    if server is not None:
+        logger.info("taking a jobserver token for each parallel environment beyond the first")
+    elif serve:
+        server = JobServer.create(jobs)
+        if server is not None:
+            logger.info("serving %d jobserver tokens with MAKEFLAGS=%s", jobs, server.make_flags)
+    try:
+        yield server
+    finally:
+        if server is not None:
+            server.close()
+
+
+__all__ = (
+    "JobServer",
+    "jobserver",
+)
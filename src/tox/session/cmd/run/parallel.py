@@ -7,14 +7,17 @@ from argparse import ArgumentParser, ArgumentTypeError
 from typing import TYPE_CHECKING
 
 from tox.plugin import impl
+from tox.report import HandledError
+from tox.session.cmd.run.adaptive import ADAPTIVE_VALUE
 from tox.session.env_select import CliEnv, register_env_select_flags
 from tox.util.ci import is_ci
-from tox.util.cpu import auto_detect_cpus
+from tox.util.cpu import auto_detect_cpus, usable_cpus
 
 from .common import env_run_create_flags, execute
 
 if TYPE_CHECKING:
     from tox.config.cli.parser import ToxParser
+    from tox.config.sets import ConfigSet
     from tox.session.state import State
 
 logger = logging.getLogger(__name__)
@@ -32,11 +35,31 @@ def tox_add_option(parser: ToxParser) -> None:
     parallel_flags(our, default_parallel=DEFAULT_PARALLEL, default_spinner=is_ci())
 
 
+@impl
+def tox_add_core_config(core_conf: ConfigSet, state: State) -> None:  # ruff:ignore[unused-function-argument]
+    core_conf.add_config(
+        keys=["resource_capacity"],
+        of_type=dict[str, int],
+        default={},
+        desc="how many environments may hold a named resource at the same time (one when not listed)",
+        post_process=_check_resource_capacity,
+    )
+
+
+def _check_resource_capacity(value: dict[str, int]) -> dict[str, int]:
+    if below := sorted(name for name, capacity in value.items() if capacity < 1):
+        msg = f"resource_capacity must be at least 1, got {', '.join(f'{name}={value[name]}' for name in below)}"
+        raise HandledError(msg)
+    return value
+
+
 def parse_num_processes(str_value: str) -> int | None:
     if str_value == "all":
         return None
     if str_value == "auto":
         return auto_detect_cpus()
+    if str_value == "adaptive":
+        return ADAPTIVE_VALUE
     try:
         value = int(str_value)
     except ValueError as exc:
@@ -60,7 +83,7 @@ def parallel_flags(
         "--parallel",
         dest="parallel",
         help="run tox environments in parallel, the argument controls limit: all,"
-        " auto - cpu count, some positive number, zero is turn off",
+        " auto - cpu count, adaptive - follow the load of the machine, some positive number, zero is turn off",
         action="store",
         type=parse_num_processes,
         default=default_parallel,
@@ -81,6 +104,21 @@ def parallel_flags(
         default=default_spinner,
         help="disable the spinner when running in parallel, enabled by default in CI",
     )
+    our.add_argument(
+        "--schedule",
+        dest="schedule",
+        choices=["config", "critical-path"],
+        default="config",
+        help="order to start environments ready to run in: config - as listed, critical-path - longest chain of"
+        " work (by durations recorded in earlier runs) first",
+    )
+    our.add_argument(
+        "--jobserver",
+        action="store_true",
+        dest="jobserver",
+        help="serve a GNU make jobserver the tools run by the environments share the --parallel limit through, when"
+        " not running under one already (that one is always used)",
+    )
 
 
 def run_parallel(state: State) -> int:
@@ -89,9 +127,11 @@ def run_parallel(state: State) -> int:
     if option.no_capture:
         msg = "--no-capture cannot be used with parallel mode"
         raise SystemExit(msg)
+    fixed = 1 if option.parallel == OFF_VALUE else option.parallel
+    max_workers = usable_cpus() if option.parallel == ADAPTIVE_VALUE else fixed
     return execute(
         state,
-        max_workers=1 if option.parallel == OFF_VALUE else option.parallel,
+        max_workers=max_workers,
         has_spinner=option.parallel_no_spinner is False and option.parallel_live is False,
         live=option.parallel_live,
     )
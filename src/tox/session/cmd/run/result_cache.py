@@ -0,0 +1,119 @@
+"""Skip running the commands of an environment whose inputs did not change since its last successful run."""
+
+from __future__ import annotations
+
+import json
+import logging
+from hashlib import sha256
+from typing import TYPE_CHECKING
+
+from tox.config.loader.stringify import stringify
+from tox.tox_env.package import PathPackage
+from tox.version import version
+
+if TYPE_CHECKING:
+    from tox.execute import Outcome
+    from tox.tox_env.package import Package
+    from tox.tox_env.runner import RunToxEnv
+
+LOGGER = logging.getLogger(__name__)
+
+_SECTION = "result"
+#: environment variables that change between runs without changing what the commands do: the random hash seed and the
+#: size of the terminal
+_VOLATILE = frozenset({"PYTHONHASHSEED", "COLUMNS", "LINES"})
+
+
+def fingerprint(tox_env: RunToxEnv) -> str:
+    """Digest everything that decides the outcome of running the commands of a set up environment.
+
+    :param tox_env: the environment
+
+    :returns: the digest
+
+    """
+    config: dict[str, str] = {}
+    for key in tox_env.conf:
+        if key == "set_env":  # part of the environment variables below
+            continue
+        try:
+            config[key] = stringify(tox_env.conf[key])[0]
+        except Exception as exception:  # ruff:ignore[blind-except] # a key that fails to load fails the same way again
+            config[key] = f"# Exception: {exception!r}"
+    env_vars = {k: v for k, v in tox_env.environment_variables.items() if k not in _VOLATILE}
+    if tox_env.make_flags is not None and env_vars.get("MAKEFLAGS") == tox_env.make_flags:
+        del env_vars["MAKEFLAGS"]  # the jobserver moves every run
+    content = {
+        "tox": version,
+        "config": config,
+        "installed": tox_env.installer.installed(),
+        "packages": [_package_digest(package) for package in tox_env.packages],
+        "inputs": _inputs_digest(tox_env),
+        "env": env_vars,
+    }
+    return sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _package_digest(package: Package) -> str:
+    if isinstance(package, PathPackage) and package.path.is_file():
+        return package.sha256 or sha256(package.path.read_bytes()).hexdigest()
+    return str(package)  # a source tree installed in development mode, its files are declared via cache_inputs
+
+
+def _inputs_digest(tox_env: RunToxEnv) -> list[tuple[str, str]]:
+    root = tox_env.core["tox_root"]
+    files = {path for pattern in tox_env.conf["cache_inputs"] for path in root.glob(pattern) if path.is_file()}
+    return [(path.relative_to(root).as_posix(), sha256(path.read_bytes()).hexdigest()) for path in sorted(files)]
+
+
+def replay(tox_env: RunToxEnv, digest: str) -> bool:
+    """Report the commands of the last successful run with the same fingerprint instead of running them.
+
+    :param tox_env: the environment
+    :param digest: the fingerprint of the environment
+
+    :returns: ``True`` when there was such a run
+
+    """
+    record = tox_env.cache.get(_SECTION)
+    if not isinstance(record, dict) or record.get("fingerprint") != digest:
+        return False
+    for command in record.get("commands", []):
+        LOGGER.warning(
+            "cached %s> %s (exit %s in %.2f seconds)",
+            command["run_id"],
+            command["command"],
+            command["retcode"],
+            command["elapsed"],
+        )
+    if tox_env.journal:
+        tox_env.journal["cached"] = record
+    return True
+
+
+def store(tox_env: RunToxEnv, digest: str, outcomes: list[Outcome]) -> None:
+    """Remember a successful run of the commands.
+
+    :param tox_env: the environment
+    :param digest: the fingerprint of the environment the commands ran in
+    :param outcomes: the outcomes of the commands
+
+    """
+    commands = [
+        {
+            "command": outcome.request.shell_cmd_redacted,
+            "retcode": outcome.exit_code,
+            "elapsed": outcome.elapsed,
+            "run_id": outcome.request.run_id,
+        }
+        for outcome in outcomes
+    ]
+    with tox_env.cache.compare({"fingerprint": digest, "commands": commands}, _SECTION):
+        pass
+
+
+__all__ = (
+    "fingerprint",
+    "replay",
+    "store",
+)
@@ -0,0 +1,89 @@
+"""Split the environments to run across machines, balanced by how long they are expected to take."""
+
+from __future__ import annotations
+
+import heapq
+from argparse import ArgumentTypeError
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class Shard:
+    """One part of the environments to run, given as ``<index>/<total>``."""
+
+    def __init__(self, value: str) -> None:
+        """:param value: the specification
+
+        :raises ArgumentTypeError: the specification is not valid
+        """
+        index, _, total = value.partition("/")
+        try:
+            self.index, self.total = int(index), int(total)  #: the part to run, starting with one; the number of parts
+        except ValueError as exception:
+            msg = f"value must be <index>/<total>, is {value!r}"
+            raise ArgumentTypeError(msg) from exception
+        if not 1 <= self.index <= self.total:
+            msg = f"index must be between 1 and {self.total}, is {self.index}"
+            raise ArgumentTypeError(msg)
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.total}"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Shard) and (self.index, self.total) == (other.index, other.total)
+
+    def __hash__(self) -> int:
+        return hash((self.index, self.total))
+
+
+def partition(
+    order: list[str], todo: Mapping[str, set[str]], weight: Mapping[str, float], parts: int
+) -> list[list[str]]:
+    """Split environments into parts of about the same total weight, keeping the ones depending on each other together.
+
+    The result only depends on the arguments, so every machine running one of the parts computes the same split.
+
+    :param order: the environments to split, in run order
+    :param todo: environment to the environments it depends on
+    :param weight: environment to its expected duration
+    :param parts: the number of parts
+
+    :returns: the environments of each part, in run order
+
+    """
+    position = {env: at for at, env in enumerate(order)}
+    group = {env: env for env in order}  # union find over the depends edges
+
+    def _root(env: str) -> str:
+        while group[env] != env:
+            group[env] = group[group[env]]
+            env = group[env]
+        return env
+
+    for env in order:
+        for dependency in todo.get(env, ()):
+            first, second = sorted((_root(env), _root(dependency)), key=position.__getitem__)
+            group[second] = first
+    closures: dict[str, list[str]] = {}
+    for env in order:
+        closures.setdefault(_root(env), []).append(env)
+    # largest first onto the least loaded part, ties broken by position so the split is stable
+    by_size = sorted(closures.values(), key=lambda envs: (-sum(weight[e] for e in envs), position[envs[0]]))
+    load = [(0.0, at) for at in range(parts)]
+    result: list[list[str]] = [[] for _ in range(parts)]
+    for envs in by_size:
+        total, at = heapq.heappop(load)
+        result[at].extend(envs)
+        heapq.heappush(load, (total + sum(weight[e] for e in envs), at))
+    return [sorted(envs, key=position.__getitem__) for envs in result]
+
+
+__all__ = (
+    "Shard",
+    "partition",
+)
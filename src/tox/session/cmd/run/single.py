@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, NamedTuple, cast
 
 from tox.execute.api import Outcome, StdinSource
 from tox.report import HandledError
+from tox.session.cmd.run.result_cache import fingerprint, replay, store
 from tox.tox_env.errors import Fail, Skip
 from tox.tox_env.python.virtual_env.package.pyproject import ToxBackendFailed
 
@@ -30,33 +31,41 @@ class ToxEnvRunResult(NamedTuple):
     ignore_outcome: bool = False
     fail_fast: bool = False
     unavailable: bool = False
+    cached: bool = False
 
 
 def run_one(tox_env: RunToxEnv, no_test: bool, suspend_display: bool) -> ToxEnvRunResult:  # ruff:ignore[boolean-type-hint-positional-argument]
     start_one = time.monotonic()
     name = tox_env.conf.name
     with tox_env.display_context(suspend_display):
-        skipped, code, outcomes = _evaluate(tox_env, no_test)
+        skipped, code, outcomes, cached = _evaluate(tox_env, no_test)
     duration = time.monotonic() - start_one
     return ToxEnvRunResult(
-        name, skipped, code, outcomes, duration, tox_env.conf["ignore_outcome"], tox_env.conf["fail_fast"]
+        name,
+        skipped,
+        code,
+        outcomes,
+        duration,
+        tox_env.conf["ignore_outcome"],
+        tox_env.conf["fail_fast"],
+        cached=cached,
     )
 
 
-def _evaluate(tox_env: RunToxEnv, no_test: bool) -> tuple[bool, int, list[Outcome]]:  # ruff:ignore[boolean-type-hint-positional-argument]
+def _evaluate(tox_env: RunToxEnv, no_test: bool) -> tuple[bool, int, list[Outcome], bool]:  # ruff:ignore[boolean-type-hint-positional-argument]
     try:
         return _run_with_teardown(tox_env, no_test)
     except SystemExit as exception:  # setup command fails (interrupted or via invocation)
-        return False, cast("int", exception.code), []
+        return False, cast("int", exception.code), [], False
 
 
-def _run_with_teardown(tox_env: RunToxEnv, no_test: bool) -> tuple[bool, int, list[Outcome]]:  # ruff:ignore[boolean-type-hint-positional-argument]
-    skipped = False
+def _run_with_teardown(tox_env: RunToxEnv, no_test: bool) -> tuple[bool, int, list[Outcome], bool]:  # ruff:ignore[boolean-type-hint-positional-argument]
+    skipped, cached = False, False
     code: int = 0
     outcomes: list[Outcome] = []
     try:
         tox_env.setup()
-        code, outcomes = run_commands(tox_env, no_test)
+        cached, code, outcomes = _replay_or_run(tox_env, no_test)
     except Skip as exception:
         LOGGER.warning("skipped because %s", exception)
         code = 0
@@ -75,7 +84,17 @@ def _run_with_teardown(tox_env: RunToxEnv, no_test: bool) -> tuple[bool, int, li
         code = 2  # pragma: no cover
     finally:
         tox_env.teardown()
-    return skipped, code, outcomes
+    return skipped, code, outcomes, cached
+
+
+def _replay_or_run(tox_env: RunToxEnv, no_test: bool) -> tuple[bool, int, list[Outcome]]:  # ruff:ignore[boolean-type-hint-positional-argument]
+    digest = fingerprint(tox_env) if getattr(tox_env.options, "cached", False) and not no_test else None
+    if digest is not None and replay(tox_env, digest):
+        return True, 0, []
+    code, outcomes = run_commands(tox_env, no_test)
+    if digest is not None and code == Outcome.OK:
+        store(tox_env, digest, outcomes)
+    return False, code, outcomes
 
 
 def run_commands(tox_env: RunToxEnv, no_test: bool) -> tuple[int, list[Outcome]]:  # ruff:ignore[boolean-type-hint-positional-argument]
@@ -0,0 +1,114 @@
+"""Admission control of tox environments against the parallel slots and the named resources they hold."""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+
+
+class Slots:
+    """Track the slots and resources held by the running environments."""
+
+    def __init__(self, total: int, capacity: Mapping[str, int]) -> None:
+        self.total = total
+        self._capacity = capacity
+        self._busy = 0
+        self._held: dict[str, tuple[int, Sequence[str]]] = {}
+        self._resources_held: Counter[str] = Counter()
+        self.peak = 0
+        self._busy_time = 0.0  # slot-seconds of work done
+        self._start = self._last = time.monotonic()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(total={self.total}, busy={self._busy})"
+
+    @property
+    def busy(self) -> int:
+        """:returns: the slots taken by the running environments"""
+        return self._busy
+
+    def weight(self, weight: int) -> int:
+        """:returns: the slots an environment of the given weight occupies, always fits in an idle pool"""
+        return max(1, min(weight, self.total))
+
+    def fits(self, weight: int, resources: Sequence[str]) -> bool:
+        """:returns: ``True`` when an environment of the given weight and resources could start now"""
+        if self._busy + self.weight(weight) > self.total:
+            return False
+        return all(self._resources_held[i] < self._capacity.get(i, 1) for i in set(resources))
+
+    def acquire(self, name: str, weight: int, resources: Sequence[str]) -> bool:
+        """Start an environment if there are enough free slots and all its resources have free capacity.
+
+        :param name: the name of the environment
+        :param weight: the slots the environment occupies
+        :param resources: the named resources the environment holds while running
+
+        :returns: ``True`` when the environment was admitted
+
+        """
+        if not self.fits(weight, resources):
+            return False
+        weight = self.weight(weight)
+        self._tick()
+        self._busy += weight
+        self.peak = max(self.peak, self._busy)
+        self._held[name] = weight, resources
+        self._resources_held.update(set(resources))
+        return True
+
+    def admit(
+        self,
+        waiting: Iterable[tuple[str, int, Sequence[str]]],
+        gate: Callable[[str], bool] | None = None,
+    ) -> list[str]:
+        """Start the waiting environments that fit, most important first.
+
+        Once one lacks free slots none after it starts, so the slots freed up are kept for it: lighter environments
+        admitted in its place would otherwise keep a heavy environment waiting for as long as they are ready to run.
+        One waiting on its resources only does not hold back the others.
+
+        :param waiting: the name, weight and resources of the environments ready to run, in order of importance
+        :param gate: a further permission to take for an environment about to start
+
+        :returns: the names of the environments admitted
+        """
+        admitted: list[str] = []
+        for name, weight, resources in waiting:
+            if self._busy + self.weight(weight) > self.total:
+                break
+            if self.fits(weight, resources) and (gate is None or gate(name)):
+                self.acquire(name, weight, resources)
+                admitted.append(name)
+        return admitted
+
+    def release(self, name: str) -> None:
+        """Free the slots and resources of an environment, it is fine to release one that was never admitted.
+
+        :param name: the name of the environment
+        """
+        if (held := self._held.pop(name, None)) is None:
+            return
+        weight, resources = held
+        self._tick()
+        self._busy -= weight
+        self._resources_held.subtract(set(resources))
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        self._busy_time += self._busy * (now - self._last)
+        self._last = now
+
+    @property
+    def average(self) -> float:
+        """:returns: the average number of busy slots since the start"""
+        self._tick()
+        elapsed = self._last - self._start
+        return self._busy_time / elapsed if elapsed else float(self._busy)
+
+
+__all__ = ("Slots",)
@@ -0,0 +1,267 @@
+"""Run tox environments, then run the ones affected by file changes again until interrupted."""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import sys
+import time
+from contextlib import contextmanager
+from fnmatch import fnmatch
+from threading import Event, Thread, get_ident
+from typing import TYPE_CHECKING, cast
+
+from tox.execute import Outcome
+from tox.plugin import impl
+from tox.session.env_select import CliEnv, register_env_select_flags
+from tox.util.path import project_files
+
+from .run.common import env_run_create_flags, execute
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from tox.config.cli.parser import ToxParser
+    from tox.session.state import State
+    from tox.tox_env.runner import RunToxEnv
+
+LOGGER = logging.getLogger(__name__)
+
+#: seconds between two scans of the project tree
+POLL = 0.25
+
+
+@impl
+def tox_add_option(parser: ToxParser) -> None:
+    help_msg = "run environments, then again each time files affecting them change"
+    our = parser.add_command("watch", ["w"], help_msg, watch)
+    register_env_select_flags(our, default=CliEnv())
+    env_run_create_flags(our, mode="watch")
+    our.add_argument(
+        "--debounce",
+        dest="debounce",
+        metavar="seconds",
+        type=float,
+        of_type=float,
+        default=0.5,
+        help="wait for this long without further changes before running again",
+    )
+
+
+def watch(state: State) -> int:
+    tree = Tree(state.conf.core["tox_root"], state.conf.core["work_dir"])
+    skip_pkg_install: bool = state.conf.options.skip_pkg_install
+    select: list[str] | None = None  # the first round runs every selected environment
+    while True:
+        state.conf.options.start = time.monotonic()
+        code, changed = _run_until_change(state, select, tree)
+        if not changed:  # nothing changed while running
+            LOGGER.warning("watching %s for changes, stop with CTRL+C", tree.root)
+            try:
+                changed = tree.wait(state.conf.options.debounce)
+            except KeyboardInterrupt:
+                return code
+        if _config_changed(state, changed):
+            from tox.provision import provision  # ruff:ignore[import-outside-top-level] # circular import
+            from tox.run import setup_state  # ruff:ignore[import-outside-top-level] # circular import
+
+            LOGGER.warning("configuration changed, reloading it")
+            state, select = setup_state(state.args), None
+            if (provisioned := provision(state)) is not False:  # the new requirements need a provisioned tox
+                return int(provisioned)
+            state.conf.options.skip_pkg_install = skip_pkg_install
+            continue
+        select, package_changed = affected(state, changed)
+        state.conf.options.skip_pkg_install = skip_pkg_install or not package_changed
+        for name in select:
+            state.envs[name].reset()
+        if not select:
+            LOGGER.warning("changes to %s affect no environment", ", ".join(sorted(_show(tree.root, changed))))
+
+
+def _run_until_change(state: State, select: list[str] | None, tree: Tree) -> tuple[int, set[Path]]:
+    """Run the environments, interrupting them when files change while they run."""
+    changed: set[Path] = set()
+    if select is not None and not select:
+        return Outcome.OK, changed
+    code = Outcome.OK
+    try:
+        with _interrupt_on_change(tree, state.conf.options.debounce, changed):
+            code = execute(state, max_workers=1, has_spinner=False, live=True, select=select)
+    except KeyboardInterrupt:  # our interrupt landed after the run completed, any other one asks us to stop
+        if not changed:
+            raise
+    return code, changed
+
+
+@contextmanager
+def _interrupt_on_change(tree: Tree, debounce: float, changed: set[Path]) -> Iterator[None]:
+    """Interrupt what runs within as a CTRL+C would, once files change.
+
+    :param tree: the project tree
+    :param debounce: how long no further change must happen to consider the changes settled
+    :param changed: where to collect the changed files
+    """
+    stop, main = Event(), get_ident()
+
+    def _poll() -> None:
+        if found := tree.wait(debounce, stop):
+            LOGGER.warning("%s changed, interrupting the run", ", ".join(sorted(_show(tree.root, found))))
+            changed.update(found)
+            if not stop.is_set():
+                _interrupt(main)
+
+    poller = Thread(target=_poll, name="tox-watch", daemon=True)
+    poller.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        poller.join()
+
+
+def _interrupt(thread: int) -> None:
+    if sys.platform == "win32":  # pragma: win32 cover
+        signal.raise_signal(signal.SIGINT)
+    else:
+        signal.pthread_kill(thread, signal.SIGINT)
+
+
+def affected(state: State, changed: set[Path]) -> tuple[list[str], bool]:
+    """Find the environments changed files affect.
+
+    A file affects an environment when it is within its ``change_dir``, matches its ``watch_paths`` or is a source of
+    the package it installs. Files below the ``change_dir`` of any environment other than the tox root are not package
+    sources.
+
+    :param state: the tox state
+    :param changed: the changed files
+
+    :returns: the affected environments in run order and if package sources changed
+    """
+    root: Path = state.conf.core["tox_root"]
+    envs = [cast("RunToxEnv", state.envs[name]) for name in state.envs.iter()]
+    run_dirs = [path for env in envs if (path := cast("Path", env.conf["change_dir"])) != root]
+    not_run = {path for path in changed if not any(path.is_relative_to(run_dir) for run_dir in run_dirs)}
+    result, package_changed = [], False
+    for env in envs:
+        if env.package_env is not None and any(
+            path.is_relative_to(cast("Path", env.package_env.conf["package_root"])) for path in not_run
+        ):
+            package_changed = True
+            result.append(env.name)
+        elif any(_affects(env, root, path) for path in changed):
+            result.append(env.name)
+    return result, package_changed
+
+
+def _affects(env: RunToxEnv, root: Path, path: Path) -> bool:
+    if path.is_relative_to(cast("Path", env.conf["change_dir"])):
+        return True
+    relative = path.relative_to(root).as_posix() if path.is_relative_to(root) else path.as_posix()
+    return any(fnmatch(relative, pattern) for pattern in env.conf["watch_paths"])
+
+
+def _config_changed(state: State, changed: set[Path]) -> bool:
+    return bool({state.conf.src_path, state.conf.core["tox_root"] / "toxfile.py"} & changed)
+
+
+def _show(root: Path, paths: set[Path]) -> list[str]:
+    return [str(path.relative_to(root)) if path.is_relative_to(root) else str(path) for path in paths]
+
+
+class Tree:
+    """The files of a project, honoring the ignore rules of git when the project is a git checkout."""
+
+    def __init__(self, root: Path, work_dir: Path) -> None:
+        """Take the first snapshot of the project tree.
+
+        :param root: the root of the project
+        :param work_dir: the tox working directory, never watched
+        """
+        self.root, self._work_dir = root, work_dir
+        self._listed: list[Path] = []
+        self._folders: dict[Path, int | None] = {}  #: modification time of the folders when we listed their files
+        self._files = self._scan()
+
+    def changes(self) -> set[Path]:
+        """:returns: the files added, removed or modified since the last call"""
+        files, previous = self._scan(), self._files
+        self._files = files
+        return {path for path in files.keys() | previous.keys() if files.get(path) != previous.get(path)}
+
+    def wait(self, debounce: float, stop: Event | None = None) -> set[Path]:
+        """Wait for files to change and settle.
+
+        :param debounce: how long no further change must happen to consider the changes settled
+        :param stop: return early once set
+
+        :returns: the changed files, empty when stopped before any change
+        """
+        stop = stop or Event()
+        changed: set[Path] = set()
+        last = 0.0
+        while not stop.wait(POLL):
+            if found := self.changes():
+                changed |= found
+                last = time.monotonic()
+            elif changed and time.monotonic() - last >= debounce:
+                break
+        return changed
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        result: dict[Path, tuple[int, int]] = {}
+        for path in self._list():
+            try:
+                stat = path.stat()
+            except OSError:  # removed while we look
+                continue
+            result[path] = stat.st_mtime_ns, stat.st_size
+        return result
+
+    def _list(self) -> list[Path]:
+        """List the files of the project again only when files got added to or removed from its folders."""
+        seen = {folder: _modified(folder) for folder in self._folders}  # before listing, to not miss what it races
+        if self._folders and seen == self._folders:
+            return self._listed
+        self._listed = [path for path in project_files(self.root) if not path.is_relative_to(self._work_dir)]
+        folders = {self.root}
+        for path in self._listed:
+            folder = path.parent
+            while folder not in folders and folder.is_relative_to(self.root):
+                folders.add(folder)
+                folder = folder.parent
+        # files showing up in folders without any file yet show as a change of their parent
+        folders.update(
+            folder / entry.name
+            for folder in list(folders)
+            for entry in _sub_folders(folder)
+            if not entry.name.startswith(".") and entry.name != "__pycache__"
+        )
+        folders.discard(self._work_dir)
+        self._folders = {folder: seen[folder] if folder in seen else _modified(folder) for folder in folders}
+        return self._listed
+
+
+def _modified(folder: Path) -> int | None:
+    try:
+        return folder.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _sub_folders(folder: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(folder) as entries:
+            return [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+
+
+__all__ = (
+    "Tree",
+    "affected",
+    "watch",
+)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import fnmatch
+import hashlib
+import json
 import logging
 import os
 import re
@@ -16,8 +18,10 @@ from typing import TYPE_CHECKING, Any, NamedTuple, cast
 from tox.execute.request import ExecuteRequest
 from tox.tox_env.errors import Fail, Recreate, Skip
 from tox.tox_env.info import Info
-from tox.util.path import ensure_cachedir_tag, ensure_empty_dir, ensure_gitignore
+from tox.util.path import ensure_cachedir_tag, ensure_gitignore
 from tox.util.redact import redact_value
+from tox.util.trash import empty_dir, reap
+from tox.version import version
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
@@ -33,6 +37,8 @@ if TYPE_CHECKING:
     from tox.tox_env.installer import Installer
 
 LOGGER = logging.getLogger(__name__)
+# the section of the environment info file holding the fingerprint of the last setup
+_SETUP = "setup"
 
 
 class ToxEnvCreateArgs(NamedTuple):
@@ -73,10 +79,24 @@ class ToxEnv(ABC):  # ruff:ignore[too-many-public-methods]
         self._fully_interrupted = False
         self._allow_interrupted_execution = False
         self._log_id = 0
+        self._make_flags: str | None = None
+        self._cache: Info | None = None
+
+    @property
+    def make_flags(self) -> str | None:
+        """:returns: the ``MAKEFLAGS`` that let the tools run within this environment join the jobserver of tox"""
+        return self._make_flags
+
+    @make_flags.setter
+    def make_flags(self, value: str | None) -> None:
+        self._make_flags, self._env_vars = value, None  # rebuild the environment variables on next access
 
     @property
     def cache(self) -> Info:
-        return Info(self.env_dir)
+        """:returns: the information stored about the environment, changes written at the end of its setup"""
+        if self._cache is None:
+            self._cache = Info(self.env_dir)
+        return self._cache
 
     @staticmethod
     @abstractmethod
@@ -267,19 +287,22 @@ class ToxEnv(ABC):  # ruff:ignore[too-many-public-methods]
             recreate = cast("bool", self.conf["recreate"])
             if recreate:
                 self._clean(transitive=True)
-            try:
-                self._setup_env()
-                self._setup_with_env()
-            except Recreate as exception:  # once we might try over
-                if not recreate:  # pragma: no cover
-                    logging.warning("recreate env because %s", exception.args[0])
-                    self._clean(transitive=False)
-                    self._setup_env()
+            with self.cache.batch():
+                try:
+                    if recreate or not self._setup_unchanged():
+                        self._setup_env()
                     self._setup_with_env()
-            else:
-                self._done_with_setup()
-            finally:
-                self._run_state["setup"] = True
+                except Recreate as exception:  # once we might try over
+                    if not recreate:  # pragma: no cover
+                        logging.warning("recreate env because %s", exception.args[0])
+                        self._clean(transitive=False)
+                        self._setup_env()
+                        self._setup_with_env()
+                else:
+                    self._done_with_setup()
+                    self._store_setup_fingerprint()
+                finally:
+                    self._run_state["setup"] = True
 
     def teardown(self) -> None:
         if not self._run_state["teardown"]:
@@ -294,6 +317,12 @@ class ToxEnv(ABC):  # ruff:ignore[too-many-public-methods]
     def _teardown(self) -> None:  # ruff:ignore[empty-method-without-abstract-decorator] # empty abstract base class
         pass
 
+    def reset(self) -> None:
+        """Forget a previous setup, teardown and interrupt so the environment can be set up and run again."""
+        self._run_state.update({"setup": False, "teardown": False})
+        self._interrupted = self._fully_interrupted = self._allow_interrupted_execution = False
+        self._env_vars = None
+
     def _platform_check(self) -> None:
         """Skip env when platform does not match."""
         platform_str: str = self.conf["platform"]
@@ -321,6 +350,54 @@ class ToxEnv(ABC):  # ruff:ignore[too-many-public-methods]
         self._handle_env_tmp_dir()
         self._handle_core_tmp_dir()
 
+    def _setup_fingerprint(self) -> dict[str, Any] | None:  # ruff:ignore[no-self-use]
+        """:returns: everything setting up the environment depends on, ``None`` if not known without setting it up"""
+        return None
+
+    def _setup_state(self) -> dict[str, Any] | None:  # ruff:ignore[no-self-use]
+        """:returns: what setting up the environment found out to skip it next time, ``None`` if it cannot be skipped"""
+        return None
+
+    def _restore_setup_state(self, state: dict[str, Any]) -> bool:  # ruff:ignore[no-self-use, unused-method-argument]
+        """Take over what an earlier setup of the environment found out.
+
+        :param state: what :meth:`_setup_state` returned back then
+
+        :returns: ``True`` if it still holds, ``False`` when the environment must be set up
+        """
+        return False
+
+    def _setup_unchanged(self) -> bool:
+        """Skip setting up the environment when nothing it depends on changed since the last setup."""
+        if (stored := self._restore_last_setup()) is None:
+            return False
+        if (digest := self._setup_digest()) is None or digest != stored.get("fingerprint"):
+            return False
+        LOGGER.info("skip setup, nothing it depends on changed")
+        self._handle_env_tmp_dir()
+        self._handle_core_tmp_dir()
+        return True
+
+    def _restore_last_setup(self) -> dict[str, Any] | None:
+        """:returns: what the last setup stored when restored its state as still valid, ``None`` otherwise"""
+        stored = self.cache.get(_SETUP)
+        if isinstance(stored, dict) and self._restore_setup_state(stored.get("state") or {}):
+            return stored
+        return None
+
+    def _store_setup_fingerprint(self) -> None:
+        if (state := self._setup_state()) is None or (digest := self._setup_digest()) is None:
+            return
+        with self.cache.compare({"fingerprint": digest, "state": state}, _SETUP):
+            pass
+
+    def _setup_digest(self) -> str | None:
+        if (fingerprint := self._setup_fingerprint()) is None:
+            return None
+        env = {"name": self.conf.name, "type": type(self).__name__}
+        value = {"tox": version, "env": env, "env info": self.cache.get(ToxEnv.__name__), **fingerprint}
+        return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
     def _setup_with_env(self) -> None:  # ruff:ignore[empty-method-without-abstract-decorator] # empty abstract base class
         pass
 
@@ -332,13 +409,14 @@ class ToxEnv(ABC):  # ruff:ignore[too-many-public-methods]
         env_tmp_dir = self.env_tmp_dir
         if env_tmp_dir.exists() and next(env_tmp_dir.iterdir(), None) is not None:
             LOGGER.debug("clear env temp folder %s", env_tmp_dir)
-            ensure_empty_dir(env_tmp_dir)
+            empty_dir(env_tmp_dir, self.core["work_dir"])
         env_tmp_dir.mkdir(parents=True, exist_ok=True)
 
     def _handle_core_tmp_dir(self) -> None:
         self.core["temp_dir"].mkdir(parents=True, exist_ok=True)
         ensure_cachedir_tag(self.core["work_dir"])
         ensure_gitignore(cast("Path", self.core["work_dir"]))
+        reap(self.core["work_dir"])
 
     def _clean(self, transitive: bool = False) -> None:  # ruff:ignore[unused-method-argument, boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
         if self._run_state["clean"]:  # pragma: no branch
@@ -346,7 +424,7 @@ class ToxEnv(ABC):  # ruff:ignore[too-many-public-methods]
         env_dir = self.env_dir
         if env_dir.exists():
             LOGGER.warning("remove tox env folder %s", env_dir)
-            ensure_empty_dir(env_dir, except_filename="file.lock")
+            empty_dir(env_dir, self.core["work_dir"], except_filename="file.lock")
         self._log_id = 0  # we deleted logs, so start over counter
         self.cache.reset()
         self._run_state.update({"setup": False, "clean": True})
@@ -390,6 +468,8 @@ class ToxEnv(ABC):  # ruff:ignore[too-many-public-methods]
         result["TOX_ENV_NAME"] = self.name
         result["TOX_WORK_DIR"] = str(self.core["work_dir"])
         result["TOX_ENV_DIR"] = str(self.conf["env_dir"])
+        if self._make_flags is not None and "MAKEFLAGS" not in set_env:
+            result["MAKEFLAGS"] = self._make_flags
         if (ci := os.environ.get("CI")) is not None:
             result["__TOX_ENVIRONMENT_VARIABLE_ORIGINAL_CI"] = ci
         return result
@@ -397,7 +477,7 @@ class ToxEnv(ABC):  # ruff:ignore[too-many-public-methods]
     @staticmethod
     def _load_pass_env(pass_env: list[str]) -> dict[str, str]:
         patterns = [re.compile(fnmatch.translate(e), re.IGNORECASE) for e in pass_env]
-        result: dict[str, str] = {e: v for e, v in os.environ.items() if any(p.match(e) for p in patterns)}
+        result: dict[str, str] = {e: os.environ[e] for e in os.environ if any(p.match(e) for p in patterns)}
         return result
 
     @property
@@ -502,7 +582,7 @@ class ToxEnv(ABC):  # ruff:ignore[too-many-public-methods]
 
     def _log_execute(self, request: ExecuteRequest, status: ExecuteStatus) -> None:
         if self._log_id == 0:  # start with fresh slate on new run
-            ensure_empty_dir(self.env_log_dir)
+            empty_dir(self.env_log_dir, self.core["work_dir"])
         self._log_id += 1
         self._write_execute_log(self.name, self.env_log_dir / f"{self._log_id}-{request.run_id}.log", request, status)
 
@@ -8,6 +8,8 @@ version, installed packages, etc.
 from __future__ import annotations
 
 import json
+import threading
+import uuid
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any
 
@@ -17,10 +19,13 @@ if TYPE_CHECKING:
 
 
 class Info:
-    """Stores metadata about the tox environment."""
+    """Stores metadata about the tox environment, read once and written when changed."""
 
     def __init__(self, path: Path) -> None:
         self._path = path / ".tox-info.json"
+        self._lock = threading.Lock()
+        self._batches = 0  #: the number of batches open, changes are written once all ended
+        self._dirty = False
         try:
             value = json.loads(self._path.read_text())
         except (ValueError, OSError):
@@ -61,20 +66,57 @@ class Info:
                 raised = False
             finally:
                 if not raised:  # only update when the body did not raise
-                    if sub_section is None:
-                        self._content[section] = value
-                    elif isinstance(self._content.get(section), dict):
-                        self._content[section][sub_section] = value
-                    else:
-                        self._content[section] = {sub_section: value}
-                    self._write()
+                    with self._lock:
+                        if sub_section is None:
+                            self._content[section] = value
+                        elif isinstance(self._content.get(section), dict):
+                            self._content[section][sub_section] = value
+                        else:
+                            self._content[section] = {sub_section: value}
+                        self._dirty = True
+                        batched = self._batches > 0
+                    if not batched:
+                        self.flush()
 
-    def reset(self) -> None:
-        self._content = {}
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Keep the changes in memory, and write them together once the outermost batch ends - even if it raised."""
+        with self._lock:
+            self._batches += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batches -= 1
+                done = self._batches == 0
+            if done:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write the changes not yet written, replacing the file at once so readers never see a partial one."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp = self._path.with_name(f"{self._path.name}.{uuid.uuid4().hex}")
+            try:
+                temp.write_text(json.dumps(self._content, separators=(",", ":")))
+                temp.replace(self._path)
+            finally:
+                temp.unlink(missing_ok=True)
+            self._dirty = False
+
+    def get(self, section: str) -> Any | None:
+        """:returns: the information stored under the primary key, ``None`` if there is none"""
+        return self._content.get(section)
 
-    def _write(self) -> None:
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._path.write_text(json.dumps(self._content, indent=2))
+    def sections(self) -> dict[str, Any]:
+        """:returns: all information stored, by primary key"""
+        return dict(self._content)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._content = {}
 
 
 __all__ = ("Info",)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from tox.tox_env.api import ToxEnv
 
 T = TypeVar("T", bound="ToxEnv")
@@ -27,3 +30,12 @@ class Installer(ABC, Generic[T]):
     @abstractmethod
     def install(self, arguments: Any, section: str, of_type: str) -> None:
         raise NotImplementedError
+
+    @contextmanager
+    def planned(self) -> Iterator[None]:  # ruff:ignore[no-self-use]
+        """Within, the installer may merge the installs into fewer invocations, all done once it ends without error."""
+        yield
+
+    def fingerprint(self, arguments: Any) -> Any | None:  # ruff:ignore[no-self-use, unused-method-argument]
+        """:returns: what installing the arguments depends on (JSON dump-able), ``None`` if unknown before installing"""
+        return None
@@ -29,6 +29,7 @@ class PathPackage(Package):
     def __init__(self, path: Path) -> None:
         super().__init__()
         self.path = path
+        self.sha256: str | None = None  #: the digest of the package file, when known without reading it
 
     def __str__(self) -> str:
         return str(self.path)
@@ -412,6 +412,21 @@ class Python(ToxEnv, ABC):
 
         return self._base_python
 
+    def base_python_key(self) -> str | None:  # ruff:ignore[no-self-use]
+        """:returns: environments with the same key resolve the same base python, ``None`` when not known up front"""
+        return None
+
+    def share_base_python(self, other: Python) -> None:
+        """Use the base python another environment with the same :meth:`base_python_key` already resolved.
+
+        :param other: the environment that resolved its base python
+        """
+        if self._base_python_searched or not other._base_python_searched:
+            return
+        self._base_python_searched, self._base_python = True, other._base_python
+        if self._base_python is not None and self.journal:
+            self.journal["python"] = self._get_env_journal_python()
+
     def _get_env_journal_python(self) -> dict[str, Any]:
         return {
             "implementation": self.base_python.implementation,
@@ -0,0 +1,156 @@
+"""List the distributions installed into an environment the way ``pip freeze --all`` does, from their metadata."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from importlib.metadata import distributions
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from importlib.metadata import Distribution
+
+LOGGER = logging.getLogger(__name__)
+
+#: version control systems pip asks for the requirement of an editable install within their checkouts
+_VCS_MARKERS = (".git", ".hg", ".svn", ".bzr")
+
+
+class _UnknownError(Exception):
+    """What pip prints for the environment depends on more than the metadata of its distributions."""
+
+
+def frozen(locations: Iterable[Path]) -> list[str] | None:
+    """List the installed distributions as ``pip freeze --all`` prints them.
+
+    :param locations: the folders holding distributions, in the order of the ``sys.path`` of the interpreter running
+        pip (the working directory, ``PYTHONPATH``, the site packages followed by the folders their ``.pth`` files add)
+
+    :returns: the lines printed, ``None`` when only pip can tell (eggs, legacy editable installs, editable installs
+        within a version control checkout, invalid metadata)
+    """
+    found: dict[str, str] = {}  # name, as the metadata tells -> lines
+    seen: set[str] = set()
+    try:
+        for location in dict.fromkeys(locations):
+            for dist in _distributions(location):
+                if (key := canonicalize_name(_name(dist))) not in seen:  # the first one on the path wins
+                    seen.add(key)
+                    found[_name(dist)] = _lines(dist)
+    except _UnknownError as exception:
+        LOGGER.debug("cannot list distributions in-process: %s", exception)
+        return None
+    return [line for name in sorted(found, key=str.lower) for line in found[name].splitlines()]
+
+
+def site_locations(site_packages: Iterable[Path]) -> list[Path]:
+    """:returns: the site packages, each followed by the folders its ``.pth`` files add to ``sys.path``"""
+    result: list[Path] = []
+    for site in dict.fromkeys(site_packages):
+        result.append(site)
+        if not site.is_dir():
+            continue
+        for pth in sorted(site.glob("*.pth")):
+            for line in pth.read_text(encoding="utf-8", errors="replace").splitlines():
+                if not line.strip() or line.startswith(("#", "import ", "import\t")):
+                    continue
+                if (path := site / line.rstrip()).is_dir():
+                    result.append(path)
+    return result
+
+
+def _distributions(location: Path) -> Iterator[Distribution]:
+    if not location.is_dir():
+        return
+    if any(location.glob("*.egg")) or any(location.glob("*.egg-link")):
+        msg = f"eggs or legacy editable installs in {location}"
+        raise _UnknownError(msg)
+    yield from distributions(path=[str(location)])
+
+
+def _name(dist: Distribution) -> str:
+    if not (name := dist.metadata["Name"]):
+        msg = f"distribution without a name in {getattr(dist, '_path', '?')}"
+        raise _UnknownError(msg)
+    return str(name)
+
+
+def _lines(dist: Distribution) -> str:
+    name = _name(dist)
+    if (direct_url := _direct_url(dist)) is None:
+        return f"{name}=={_version(dist)}"
+    if "dir_info" in direct_url and direct_url["dir_info"].get("editable"):
+        location = _editable_location(direct_url["url"])
+        return f"# Editable install with no version control ({name}=={_version(dist)})\n-e {location}"
+    requirement, fragments = f"{name} @ ", []
+    if vcs := direct_url.get("vcs_info"):
+        requirement += f"{vcs['vcs']}+{direct_url['url']}@{vcs['commit_id']}"
+    else:
+        requirement += direct_url["url"]
+        archive = direct_url.get("archive_info") or {}
+        if hashes := archive.get("hashes"):
+            fragments.append("{}={}".format(*next(iter(hashes.items()))))
+        elif archive.get("hash"):
+            fragments.append(archive["hash"])
+    if subdirectory := direct_url.get("subdirectory"):
+        fragments.append(f"subdirectory={subdirectory}")
+    return f"{requirement}#{'&'.join(fragments)}" if fragments else requirement
+
+
+def _version(dist: Distribution) -> Version:
+    stem, _, suffix = Path(getattr(dist, "_path", "")).name.rpartition(".")
+    from_folder = stem.partition("-")[2] if suffix == "dist-info" else ""  # pip prefers the version the folder tells
+    try:
+        return Version(from_folder or dist.version)
+    except (InvalidVersion, TypeError) as exception:
+        msg = f"invalid version of {_name(dist)}"
+        raise _UnknownError(msg) from exception
+
+
+def _direct_url(dist: Distribution) -> dict[str, Any] | None:
+    """:returns: the :pep:`610` record of where the distribution was installed from"""
+    if (text := dist.read_text("direct_url.json")) is None:
+        return None
+    try:
+        direct_url = json.loads(text)
+        valid = (
+            isinstance(direct_url, dict)
+            and isinstance(direct_url.get("url"), str)
+            and sum(isinstance(direct_url.get(key), dict) for key in ("vcs_info", "archive_info", "dir_info")) == 1
+            and (
+                "vcs_info" not in direct_url
+                or all(isinstance(direct_url["vcs_info"].get(key), str) for key in ("vcs", "commit_id"))
+            )
+        )
+    except (ValueError, AttributeError):
+        valid = False
+    if not valid:
+        msg = f"invalid direct_url.json of {_name(dist)}"  # pip ignores it with a warning
+        raise _UnknownError(msg)
+    return cast("dict[str, Any]", direct_url)
+
+
+def _editable_location(url: str) -> str:
+    scheme, netloc, path, _, _ = urlsplit(url)
+    if scheme != "file" or netloc not in {"", "localhost"}:
+        msg = f"editable install from {url}"
+        raise _UnknownError(msg)
+    location = Path(os.path.abspath(url2pathname(path)))  # ruff:ignore[os-path-abspath]
+    if any((folder / marker).exists() for folder in (location, *location.parents) for marker in _VCS_MARKERS):
+        msg = f"editable install within a version control checkout at {location}"  # pip asks the tool for its remote
+        raise _UnknownError(msg)
+    return os.path.normcase(location)
+
+
+__all__ = (
+    "frozen",
+    "site_locations",
+)
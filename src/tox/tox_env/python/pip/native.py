@@ -0,0 +1,323 @@
+"""Install the pinned, hashed wheels of a lock file into a virtual environment in-process, without starting pip."""
+
+from __future__ import annotations
+
+import base64
+import csv
+import hashlib
+import io
+import logging
+import operator
+import os
+import platform
+import stat
+import sys
+import sysconfig
+from concurrent.futures import ThreadPoolExecutor
+from configparser import ConfigParser
+from dataclasses import dataclass
+from email.parser import HeaderParser
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+from zipfile import BadZipFile, ZipFile
+
+from packaging.tags import Tag, compatible_tags, sys_tags
+from packaging.utils import InvalidWheelFilename, canonicalize_name, parse_wheel_filename
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from packaging.pylock import Package, PackageWheel
+
+    from tox.tox_env.python.api import PythonInfo
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMES = frozenset({"purelib", "platlib", "scripts", "data"})  # headers need the interpreter layout, left to pip
+_HASH_CHUNK = 2**20
+
+
+@dataclass(frozen=True)
+class Scheme:
+    """Where the files of a wheel go within the virtual environment."""
+
+    purelib: Path
+    platlib: Path
+    scripts: Path
+    data: Path
+    python: Path  #: the interpreter scripts run with
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    package: Package
+    wheel: Path
+    hashes: Mapping[str, str]
+
+
+def supported_tags(info: PythonInfo) -> list[Tag]:
+    """The wheel tags an interpreter installs, most preferred first.
+
+    Only the interpreter tox runs with is known well enough to tell its platform tags, any other one gets the platform
+    independent tags alone.
+
+    :param info: the interpreter of the environment
+
+    :returns: the tags
+    """
+    if _is_running(info):
+        return list(sys_tags())
+    abbreviation = {"cpython": "cp", "pypy": "pp", "graalpy": "graalpy"}.get(info.impl_lower, info.impl_lower)
+    major, minor = info.version_info.major, info.version_info.minor
+    return list(compatible_tags((major, minor), f"{abbreviation}{major}{minor}", ["any"]))
+
+
+def install_wheels(  # ruff:ignore[too-many-arguments]
+    packages: Sequence[Package],
+    lock_dir: Path,
+    wheel_dirs: Sequence[Path],
+    scheme: Scheme,
+    tags: Sequence[Tag],
+    max_workers: int = 8,
+) -> list[Package]:
+    """Install the locked packages pinned to a local wheel, verifying its hashes, each one in parallel.
+
+    :param packages: the locked packages to install
+    :param lock_dir: the folder of the lock file, the wheel paths of the lock are relative to it
+    :param wheel_dirs: the folders looked up, by file name, for the wheels of the lock
+    :param scheme: where to install
+    :param tags: the wheel tags the environment installs, most preferred first
+    :param max_workers: the number of wheels installed at the same time
+
+    :returns: the packages left for pip: no wheel found, hash not verified or not supported by this installer
+    """
+    candidates: list[_Candidate] = []
+    left: list[Package] = []
+    installed = _installed_names(scheme)
+    for package in packages:
+        candidate = _pick(package, lock_dir, wheel_dirs, tags)
+        if candidate is None or canonicalize_name(str(package.name)) in installed:
+            left.append(package)
+        else:
+            candidates.append(candidate)
+    if candidates:
+        with ThreadPoolExecutor(max_workers=min(len(candidates), max_workers), thread_name_prefix="tox-wheel") as pool:
+            done = list(pool.map(lambda candidate: _install(candidate, scheme), candidates))
+        left.extend(candidate.package for candidate, ok in zip(candidates, done, strict=True) if not ok)
+    return left
+
+
+def _is_running(info: PythonInfo) -> bool:
+    return (
+        info.impl_lower == sys.implementation.name
+        and tuple(info.version_info[:3]) == sys.version_info[:3]
+        and info.platform == sys.platform
+        and info.is_64 == (sys.maxsize > 2**32)
+        and info.free_threaded == bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+        and (info.machine is None or info.machine == platform.machine())
+    )
+
+
+def _installed_names(scheme: Scheme) -> set[str]:
+    names: set[str] = set()
+    for folder in {scheme.purelib, scheme.platlib}:
+        if folder.is_dir():
+            names.update(canonicalize_name(p.name.split("-")[0]) for p in folder.glob("*.dist-info"))
+    return names
+
+
+def _pick(package: Package, lock_dir: Path, wheel_dirs: Sequence[Path], tags: Sequence[Tag]) -> _Candidate | None:
+    if package.version is None or not package.wheels:
+        return None
+    rank = {tag: at for at, tag in enumerate(tags)}
+    ranked: list[tuple[int, PackageWheel]] = []
+    for wheel in package.wheels:
+        try:
+            _, _, _, wheel_tags = parse_wheel_filename(_filename(wheel))
+        except InvalidWheelFilename:
+            continue
+        if best := [rank[tag] for tag in wheel_tags if tag in rank]:
+            ranked.append((min(best), wheel))
+    for _, wheel in sorted(ranked, key=operator.itemgetter(0)):
+        if wheel.hashes and (path := _locate(wheel, lock_dir, wheel_dirs)) is not None:
+            return _Candidate(package, path, wheel.hashes)
+    return None
+
+
+def _filename(wheel: PackageWheel) -> str:
+    if wheel.name:
+        return wheel.name
+    if wheel.url is not None:
+        return PurePosixPath(urlparse(wheel.url).path).name
+    return PurePosixPath(str(wheel.path)).name
+
+
+def _locate(wheel: PackageWheel, lock_dir: Path, wheel_dirs: Iterable[Path]) -> Path | None:
+    options: list[Path] = []
+    if wheel.path is not None:
+        options.append(lock_dir / wheel.path)
+    if wheel.url is not None and (url := urlparse(wheel.url)).scheme == "file":
+        options.append(Path(url2pathname(url.path)))
+    options.extend(folder / _filename(wheel) for folder in wheel_dirs)
+    return next((path for path in options if path.is_file()), None)
+
+
+def _verified(wheel: Path, hashes: Mapping[str, str]) -> bool:
+    known = {name: value for name, value in hashes.items() if name in hashlib.algorithms_guaranteed}
+    if not known:
+        return False
+    digests = {name: hashlib.new(name) for name in known}
+    with wheel.open("rb") as stream:
+        while chunk := stream.read(_HASH_CHUNK):
+            for digest in digests.values():
+                digest.update(chunk)
+    return all(digests[name].hexdigest() == value.lower() for name, value in known.items())
+
+
+def _install(candidate: _Candidate, scheme: Scheme) -> bool:
+    wheel = candidate.wheel
+    if not _verified(wheel, candidate.hashes):
+        LOGGER.warning("hash of %s does not match the lock file, leave it to pip", wheel.name)
+        return False
+    try:
+        with ZipFile(wheel) as archive:
+            if (dist_info := _dist_info(archive, candidate.package)) is None:
+                return False
+            _extract(archive, dist_info, scheme)
+    except (BadZipFile, KeyError, ValueError) as exception:
+        LOGGER.warning("cannot install %s in-process, leave it to pip: %s", wheel.name, exception)
+        return False
+    LOGGER.info("installed %s in-process", wheel.name)
+    return True
+
+
+def _dist_info(archive: ZipFile, package: Package) -> str | None:
+    """:returns: the metadata folder of the wheel, ``None`` if this installer cannot install it"""
+    name = canonicalize_name(str(package.name))
+    folders = {entry.split("/", 1)[0] for entry in archive.namelist() if entry.split("/", 1)[0].endswith(".dist-info")}
+    dist_info = next((f for f in folders if canonicalize_name(f.split("-")[0]) == name), None)
+    if dist_info is None:
+        return None
+    meta = HeaderParser().parsestr(archive.read(f"{dist_info}/WHEEL").decode("utf-8"))
+    if not str(meta.get("Wheel-Version", "")).startswith("1."):
+        return None
+    data = f"{dist_info.removesuffix('.dist-info')}.data/"
+    if any(e.startswith(data) and e[len(data) :].split("/", 1)[0] not in _SCHEMES for e in archive.namelist()):
+        return None
+    if sys.platform == "win32" and _entry_points(archive, dist_info):  # needs executable launchers, left to pip
+        return None
+    return dist_info
+
+
+class _EntryPoints(ConfigParser):
+    """Parses ``entry_points.txt``, keeping the case of the entry point names."""
+
+    @staticmethod
+    def optionxform(optionstr: str) -> str:
+        return optionstr
+
+
+def _entry_points(archive: ZipFile, dist_info: str) -> dict[str, str]:
+    try:
+        content = archive.read(f"{dist_info}/entry_points.txt").decode("utf-8")
+    except KeyError:
+        return {}
+    parser = _EntryPoints(delimiters=("=",), interpolation=None)
+    parser.read_string(content)
+    return {
+        name: value
+        for group in ("console_scripts", "gui_scripts")
+        if parser.has_section(group)
+        for name, value in parser.items(group)
+    }
+
+
+def _extract(archive: ZipFile, dist_info: str, scheme: Scheme) -> None:
+    meta = HeaderParser().parsestr(archive.read(f"{dist_info}/WHEEL").decode("utf-8"))
+    root = scheme.purelib if str(meta.get("Root-Is-Purelib", "")).lower() == "true" else scheme.platlib
+    data = f"{dist_info.removesuffix('.dist-info')}.data/"
+    skip = {f"{dist_info}/{name}" for name in ("RECORD", "RECORD.jws", "RECORD.p7s", "INSTALLER", "REQUESTED")}
+    files: list[tuple[Path, bytes, bool]] = []  # validate every target before writing any, to not leave half a wheel
+    for info in archive.infolist():
+        if info.is_dir() or info.filename in skip:
+            continue
+        target_root, relative, key = root, info.filename, None
+        if info.filename.startswith(data):
+            key, relative = info.filename[len(data) :].split("/", 1)
+            target_root = getattr(scheme, key)
+        content = archive.read(info)
+        executable = bool((info.external_attr >> 16) & 0o111)
+        if key == "scripts":
+            content, executable = _fix_shebang(content, scheme.python), True
+        files.append((_target(target_root, relative), content, executable))
+    for name, value in _entry_points(archive, dist_info).items():
+        files.append((_target(scheme.scripts, name), _launcher(value, scheme.python), True))
+    files.extend((
+        (_target(root, f"{dist_info}/INSTALLER"), b"tox\n", False),
+        (_target(root, f"{dist_info}/REQUESTED"), b"", False),
+    ))
+    for dest, content, executable in files:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(content)
+        if executable:
+            dest.chmod(dest.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    _write_record(root, dist_info, ((dest, content) for dest, content, _ in files))
+
+
+def _target(root: Path, relative: str) -> Path:
+    dest = (root / relative).resolve()
+    if not dest.is_relative_to(root.resolve()):
+        msg = f"{relative} is outside of {root}"
+        raise ValueError(msg)
+    return dest
+
+
+def _fix_shebang(content: bytes, python: Path) -> bytes:
+    if not content.startswith(b"#!python"):
+        return content
+    _, _, rest = content.partition(b"\n")
+    return _shebang(python) + rest
+
+
+def _shebang(python: Path) -> bytes:
+    if " " not in str(python):
+        return f"#!{python}\n".encode()
+    return f"#!/bin/sh\n'''exec' \"{python}\" \"$0\" \"$@\"\n' '''\n".encode()  # shebang lines cannot hold spaces
+
+
+def _launcher(value: str, python: Path) -> bytes:
+    target = value.split("[", 1)[0].strip()  # extras of the entry point do not change what it runs
+    module, _, attr = target.partition(":")
+    if not attr:
+        msg = f"entry point {value!r} names no object"
+        raise ValueError(msg)
+    script = (
+        "# -*- coding: utf-8 -*-\n"
+        "import re\n"
+        "import sys\n"
+        f"from {module.strip()} import {attr.strip().split('.', 1)[0]}\n"
+        'if __name__ == "__main__":\n'
+        "    sys.argv[0] = re.sub(r'(-script\\.pyw|\\.exe)?$', '', sys.argv[0])\n"
+        f"    sys.exit({attr.strip()}())\n"
+    )
+    return _shebang(python) + script.encode()
+
+
+def _write_record(root: Path, dist_info: str, written: Iterable[tuple[Path, bytes]]) -> None:
+    record = root / dist_info / "RECORD"
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    for path, content in written:
+        digest = base64.urlsafe_b64encode(hashlib.sha256(content).digest()).rstrip(b"=").decode()
+        writer.writerow([Path(os.path.relpath(path, root)).as_posix(), f"sha256={digest}", len(content)])
+    writer.writerow([f"{dist_info}/RECORD", "", ""])
+    record.write_text(out.getvalue(), encoding="utf-8")
+
+
+__all__ = (
+    "Scheme",
+    "install_wheels",
+    "supported_tags",
+)
@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import logging
 import operator
+import os
+import sys
+import uuid
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Callable, Sequence
+from contextlib import contextmanager
 from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from packaging.requirements import Requirement
+from platformdirs import user_cache_dir
 
 from tox.config.types import Command
 from tox.execute.request import StdinSource
@@ -17,10 +22,18 @@ from tox.tox_env.errors import Fail, Recreate
 from tox.tox_env.installer import Installer
 from tox.tox_env.python.api import Python
 from tox.tox_env.python.package import EditableLegacyPackage, EditablePackage, SdistPackage, WheelPackage
+from tox.tox_env.python.pip.freeze import frozen, site_locations
+from tox.tox_env.python.pip.native import Scheme, install_wheels, supported_tags
+from tox.tox_env.python.pip.plan import InstallPlan, Stage
+from tox.tox_env.python.pip.prune import unreachable
 from tox.tox_env.python.pip.req_file import PythonConstraints, PythonDeps
+from tox.tox_env.python.pip.snapshot import SnapshotStore
+from tox.tox_env.python.pip.wheelhouse import Wheelhouse, add_wheelhouse_dir_to_core
 from tox.tox_env.python.pylock import Pylock
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from tox.config.main import Config
     from tox.tox_env.package import PathPackage
 
@@ -50,6 +63,8 @@ class PythonInstallerListDependencies(Installer[Python], ABC):
         return result.out.splitlines()
 
 
+#: tells apart the installs shared between the environments of this tox process from those of others
+_INVOCATION = uuid.uuid4().hex
 _PIP_RESOLUTION_ENV_VARS: frozenset[str] = frozenset({
     "PIP_CONSTRAINT",
     "PIP_EXTRA_INDEX_URL",
@@ -60,11 +75,27 @@ _PIP_RESOLUTION_ENV_VARS: frozenset[str] = frozenset({
     "PIP_REQUIRE_HASHES",
     "PIP_TRUSTED_HOST",
 })
+#: environment variables changing what ``pip freeze`` prints, unless set to a false value (tox sets ``PIP_USER=0``)
+_PIP_FREEZE_ENV_VARS: frozenset[str] = frozenset({
+    "PIP_EXCLUDE",
+    "PIP_EXCLUDE_EDITABLE",
+    "PIP_LOCAL",
+    "PIP_PATH",
+    "PIP_REQUIREMENT",
+    "PIP_USER",
+})
+_OFF = frozenset({"", "0", "false", "no", "off"})
+#: environment variables differing between runs or environments without changing what an install puts in place
+_VOLATILE = frozenset({"PYTHONHASHSEED", "COLUMNS", "LINES", "MAKEFLAGS", "TOX_ENV_NAME"})
 
 
 class Pip(PythonInstallerListDependencies):
     """Pip is a python installer that can install packages as defined by PEP-508 and PEP-517."""
 
+    def __init__(self, tox_env: Python, with_list_deps: bool = True) -> None:  # ruff:ignore[boolean-type-hint-positional-argument, boolean-default-value-positional-argument]
+        self._plan: InstallPlan | None = None
+        super().__init__(tox_env, with_list_deps)
+
     def _register_config(self) -> None:
         super()._register_config()
         root = self._env.core["toxinidir"]
@@ -100,10 +131,90 @@ class Pip(PythonInstallerListDependencies):
             default=False,
             desc="Use the exact versions of installed deps as constraints, otherwise use the listed deps.",
         )
+        self._env.conf.add_config(
+            keys=["deps_snapshot"],
+            of_type=bool,
+            default=False,
+            desc="restore what installs put into a new environment from a snapshot of an earlier environment with the "
+            "same install inputs, taking one when there is none yet",
+        )
+        self._env.conf.add_config(
+            keys=["coalesce_installs"],
+            of_type=bool,
+            default=True,
+            desc="environments running at the same time that install the same into a new environment install once, "
+            "the others copying what the first one installed",
+        )
+        self._env.conf.add_config(
+            keys=["uninstall_removed_deps"],
+            of_type=bool,
+            default=False,
+            desc="when requirements are removed, uninstall only the distributions nothing else installed needs rather "
+            "than recreating the environment",
+        )
+        self._env.conf.add_config(
+            keys=["merge_installs"],
+            of_type=bool,
+            default=False,
+            desc="install the deps, dependency groups, package dependencies and package of a new environment with a "
+            "single pip invocation, when no install options or constraints stand in the way",
+        )
+        self._env.conf.add_config(
+            keys=["pylock_native_install"],
+            of_type=bool,
+            default=False,
+            desc="install the pinned and hashed wheels of the pylock file found locally in-process, leaving the rest "
+            "to pip",
+        )
+        self._env.conf.add_config(
+            keys=["pylock_wheel_dirs"],
+            of_type=list[str],
+            default=[],
+            desc="folders (relative to tox_root) looked up by file name for the wheels of the pylock file",
+        )
+        self._env.conf.add_config(
+            keys=["wheelhouse"],
+            of_type=bool,
+            default=False,
+            desc="keep the wheels pip builds from source distributions and git checkouts in the wheelhouse and install "
+            "from it",
+        )
+        add_wheelhouse_dir_to_core(self._env.core)
+        self._env.core.add_config(
+            keys=["deps_snapshot_dir"],
+            of_type=Path,
+            default=Path(user_cache_dir("tox")) / "snapshots",
+            desc="the folder storing the dependency snapshots",
+        )
+        self._env.core.add_config(
+            keys=["deps_snapshot_max_size"],
+            of_type=int,
+            default=4096,
+            desc="evict the least recently used dependency snapshots once they take up more MiB than this",
+        )
 
     def freeze_cmd(self) -> list[str]:  # ruff:ignore[no-self-use]
         return ["python", "-m", "pip", "freeze", "--all"]
 
+    def installed(self) -> list[str]:
+        if (listed := self._installed_from_metadata()) is not None:
+            return listed
+        return super().installed()
+
+    def _installed_from_metadata(self) -> list[str] | None:
+        """:returns: what the default list dependencies command prints, read from the metadata in-process if possible"""
+        cmd: Command = self._env.conf["list_dependencies_command"]
+        env = self._env.environment_variables
+        if cmd.args != self.freeze_cmd() or any(env.get(key, "0").lower() not in _OFF for key in _PIP_FREEZE_ENV_VARS):
+            return None
+        # ConfigSet is no mapping, and only virtual environments define the key
+        if "system_site_packages" in self._env.conf and self._env.conf["system_site_packages"]:  # ruff:ignore[unnecessary-key-check]
+            return None
+        root: Path = self._env.core["tox_root"]  # ``python -m`` puts its working directory first on ``sys.path``
+        python_path = [root / path for path in env.get("PYTHONPATH", "").split(os.pathsep) if path]
+        site_packages = [self._env.env_site_package_dir_plat(), self._env.env_site_package_dir()]
+        return frozen([root, *python_path, *site_locations(site_packages)])
+
     def default_install_command(self, conf: Config, env_name: str | None) -> Command:  # ruff:ignore[unused-method-argument]
         isolated_flag = "-E" if self._env.base_python.version_info.major == 2 else "-I"  # ruff:ignore[magic-value-comparison]
         cmd = Command(["python", isolated_flag, "-m", "pip", "install", "{opts}", "{packages}"])
@@ -125,6 +236,12 @@ class Pip(PythonInstallerListDependencies):
         return cmd
 
     def install(self, arguments: Any, section: str, of_type: str) -> None:
+        if self._plan is not None:
+            if (stages := self._plan_stages(arguments, section, of_type)) is not None:
+                for stage in stages:
+                    self._plan.add(stage)
+                return
+            self._install_plan()  # what joined the plan installs before what cannot
         if isinstance(arguments, PythonDeps):
             self._install_requirement_file(arguments, section, of_type)
         elif isinstance(arguments, Pylock):
@@ -135,6 +252,61 @@ class Pip(PythonInstallerListDependencies):
             logging.warning("pip cannot install %r", arguments)
             raise SystemExit(1)
 
+    @contextmanager
+    def planned(self) -> Iterator[None]:
+        if self._plan is not None or not self._env.conf["merge_installs"]:
+            yield
+            return
+        self._plan = InstallPlan()
+        try:
+            yield
+            self._install_plan()
+        finally:
+            self._plan = None
+
+    def _plan_stages(self, arguments: Any, section: str, of_type: str) -> list[Stage] | None:
+        """:returns: the installs the arguments make up, ``None`` when these cannot join the plan"""
+        if self._env.conf["deps_snapshot"] or self._has_constraints or self.constrain_package_deps:
+            return None
+        if isinstance(arguments, PythonDeps):
+            value = self._requirement_file_value(arguments)
+            if value["options"] or value["constraints"]:
+                return None
+            stages = [Stage(section, of_type, value, tuple(arguments.as_root_args))]
+        elif isinstance(arguments, Sequence) and not getattr(self._env.options, "force_dep", None):
+            requirements = [str(arg) for arg in arguments if isinstance(arg, Requirement)]
+            packages = [arg for arg in arguments if isinstance(arg, (WheelPackage, EditablePackage))]
+            # sdist may need config settings, legacy editables install with -e, forced deps need --no-deps
+            if len(requirements) + len(packages) != len(arguments):
+                return None
+            requirements.extend(str(dep) for pkg in packages for dep in pkg.deps)
+            requirements.sort()
+            value = {"req": requirements, "env": self._install_env_vars()}
+            stages = [Stage(section, f"{of_type}_deps" if packages else of_type, value, tuple(requirements))]
+            if packages:  # the package itself is not recorded, as it is reinstalled every time
+                stages.append(Stage(section, of_type, None, tuple(str(pkg.path) for pkg in packages)))
+        else:
+            return None
+        installs = self._env.cache.get(section)
+        if any(isinstance(installs, dict) and installs.get(stage.of_type) is not None for stage in stages):
+            return None  # installed already, what changed decides what to do
+        return stages
+
+    def _install_plan(self) -> None:
+        if not self._plan:
+            return
+        plan, self._plan = self._plan, InstallPlan()
+        stages = plan.stages
+        if args := plan.args:
+            if any(stage.value is None for stage in stages):  # the package must not be restored from another env
+                self._execute_installer(args, plan.run_id)
+            else:
+                self._install_new(args, stages[0].section, plan.run_id, [stage.value for stage in stages])
+        for stage in stages:
+            if stage.value is not None:
+                with self._env.cache.compare(stage.value, stage.section, stage.of_type):
+                    pass
+
     @property
     def constraints(self) -> PythonConstraints:
         return cast("PythonConstraints", self._env.conf["constraints"])
@@ -150,7 +322,16 @@ class Pip(PythonInstallerListDependencies):
     def use_frozen_constraints(self) -> bool:
         return bool(self._env.conf["use_frozen_constraints"])
 
-    def _install_requirement_file(self, arguments: PythonDeps, section: str, of_type: str) -> None:
+    def fingerprint(self, arguments: Any) -> Any | None:
+        if isinstance(arguments, PythonDeps):
+            return self._requirement_file_value(arguments)
+        if isinstance(arguments, Pylock):
+            return self._pylock_value(arguments)
+        if isinstance(arguments, Sequence) and all(isinstance(arg, Requirement) for arg in arguments):
+            return {"req": sorted(str(arg) for arg in arguments), "env": self._install_env_vars()}
+        return None
+
+    def _requirement_file_value(self, arguments: PythonDeps) -> dict[str, Any]:
         new_requirements: list[str] = []
         new_constraints: list[str] = []
 
@@ -173,13 +354,18 @@ class Pip(PythonInstallerListDependencies):
             "constrain_package_deps": self.constrain_package_deps,
             "use_frozen_constraints": self.use_frozen_constraints,
         }
-        new = {
+        return {
             "options": new_options,
             "requirements": new_requirements,
             "constraints": new_constraints,
             "constraint_options": constraint_options,
             "env": self._install_env_vars(),
         }
+
+    def _install_requirement_file(self, arguments: PythonDeps, section: str, of_type: str) -> None:
+        new = self._requirement_file_value(arguments)
+        new_options, new_requirements, new_constraints = new["options"], new["requirements"], new["constraints"]
+        constraint_options = new["constraint_options"]
         # if option or constraint change in any way recreate, if the requirements change only if some are removed
         with self._env.cache.compare(new, section, of_type) as (eq, old):
             if not eq:  # pragma: no branch
@@ -188,18 +374,21 @@ class Pip(PythonInstallerListDependencies):
                     self._recreate_if_diff(
                         "constraint(s)", new_constraints, old["constraints"], operator.itemgetter(slice(3, None))
                     )
-                    missing_requirement = set(old["requirements"]) - set(new_requirements)
-                    if missing_requirement:
-                        msg = f"requirements removed: {' '.join(missing_requirement)}"
-                        raise Recreate(msg)
                     old_constraint_options = old.get("constraint_options")
                     if old_constraint_options != constraint_options:
                         msg = f"constraint options changed: old={old_constraint_options} new={constraint_options}"
                         raise Recreate(msg)
+                    missing_requirement = set(old["requirements"]) - set(new_requirements)
+                    if missing_requirement:
+                        msg = f"requirements removed: {' '.join(missing_requirement)}"
+                        self._uninstall_removed(missing_requirement, new_requirements, section, of_type, msg)
                 args = arguments.as_root_args
                 if args:  # pragma: no branch
                     args.extend(self.constraints.as_root_args)
-                    self._execute_installer(args, of_type)
+                    if old is None:
+                        self._install_new(args, section, of_type, new)
+                    else:
+                        self._execute_installer(args, of_type)
                     if self.constrain_package_deps and not self.use_frozen_constraints and not self._has_constraints:
                         combined_constraints = new_requirements + [c.removeprefix("-c ") for c in new_constraints]
                         self.constraints_file().write_text("\n".join(combined_constraints))
@@ -215,9 +404,12 @@ class Pip(PythonInstallerListDependencies):
         msg = f"changed {of_type}{removed}{added}"
         raise Recreate(msg)
 
+    def _pylock_value(self, pylock: Pylock) -> dict[str, Any]:
+        return {"req": sorted(pylock.install_lines()), "env": self._install_env_vars()}
+
     def _install_pylock(self, pylock: Pylock, section: str, of_type: str) -> None:
-        new_reqs = sorted(pylock.install_lines())
-        cache_value = {"req": new_reqs, "env": self._install_env_vars()}
+        cache_value = self._pylock_value(pylock)
+        new_reqs: list[str] = cache_value["req"]
         with self._env.cache.compare(cache_value, section, of_type) as (eq, old):
             if not eq:
                 old_req: list[str] = old["req"] if isinstance(old, dict) else (old or [])
@@ -225,9 +417,34 @@ class Pip(PythonInstallerListDependencies):
                     msg = f"pylock dependencies removed: {' '.join(missing)}"
                     raise Recreate(msg)
                 if new_deps := sorted(set(new_reqs) - set(old_req)) or new_reqs:
-                    req_file = Path(self._env.env_dir) / "pylock.txt"
-                    req_file.write_text("\n".join(new_deps))
-                    self._execute_installer(["--no-deps", "-r", str(req_file)], of_type)
+                    install = partial(self._install_locked, pylock, new_deps, of_type)
+                    if old is None:
+                        self._install_new([], section, of_type, cache_value, install)
+                    else:
+                        install()
+
+    def _install_locked(self, pylock: Pylock, lines: list[str], of_type: str) -> None:
+        if self._env.conf["pylock_native_install"]:
+            wanted = set(lines)
+            entries = [(line, pkg) for line, pkg in pylock.entries() if line in wanted]
+            root: Path = self._env.core["tox_root"]
+            scheme = Scheme(
+                purelib=self._env.env_site_package_dir(),
+                platlib=self._env.env_site_package_dir_plat(),
+                scripts=self._env.env_bin_dir(),
+                data=Path(self._env.env_dir),
+                python=self._env.env_python(),
+            )
+            wheel_dirs = [root / folder for folder in self._env.conf["pylock_wheel_dirs"]]
+            tags = supported_tags(self._env.base_python)
+            packages = [pkg for _, pkg in entries]
+            left = {id(pkg) for pkg in install_wheels(packages, pylock.path.parent, wheel_dirs, scheme, tags)}
+            lines = [line for line, pkg in entries if id(pkg) in left]
+            if not lines:
+                return
+        req_file = Path(self._env.env_dir) / "pylock.txt"
+        req_file.write_text("\n".join(lines))
+        self._execute_installer(["--no-deps", "-r", str(req_file)], of_type)
 
     def _install_list_of_deps(  # ruff:ignore[complex-structure, too-many-branches]
         self,
@@ -261,13 +478,16 @@ class Pip(PythonInstallerListDependencies):
             if not eq:  # pragma: no branch
                 old_req: list[str] = old["req"] if isinstance(old, dict) else (old or [])
                 miss = sorted(set(old_req) - set(groups["req"]))
-                if miss:  # no way yet to know what to uninstall here (transitive dependencies?)
+                if miss:
                     msg = f"dependencies removed: {', '.join(str(i) for i in miss)}"
-                    raise Recreate(msg)  # pragma: no branch
+                    self._uninstall_removed(miss, groups["req"], section, req_of_type, msg)
                 new_deps = sorted(set(groups["req"]) - set(old_req)) or list(groups["req"])
                 if new_deps:  # pragma: no branch
                     new_deps.extend(self.constraints.as_root_args)
-                    self._execute_installer(new_deps, req_of_type)
+                    if old is None:
+                        self._install_new(new_deps, section, req_of_type, cache_value)
+                    else:
+                        self._execute_installer(new_deps, req_of_type)
         install_args = ["--force-reinstall", "--no-deps"]
         cs_args = [f"--config-settings={k}={v}" for k, v in config_settings.items()]
         if groups["pkg"]:
@@ -281,10 +501,38 @@ class Pip(PythonInstallerListDependencies):
             # https://github.com/tox-dev/tox/issues/3550
             self._execute_installer(install_args, of_type)
 
+    def _uninstall_removed(
+        self, removed: Iterable[str], requirements: Iterable[str], section: str, of_type: str, reason: str
+    ) -> None:
+        """Uninstall what only the removed requirements needed, recreate the environment when it cannot tell what."""
+        if not self._env.conf["uninstall_removed_deps"]:
+            raise Recreate(reason)
+        kept = list(requirements)
+        for name, installs in self._env.cache.sections().items():
+            if not isinstance(installs, dict):
+                continue
+            for sub_section, value in installs.items():
+                if (name, sub_section) != (section, of_type) and isinstance(value, dict):
+                    kept.extend(req for key in ("requirements", "req") for req in value.get(key) or [])
+        site_packages = [self._env.env_site_package_dir(), self._env.env_site_package_dir_plat()]
+        if (dists := unreachable(site_packages, removed, kept)) is None:
+            raise Recreate(reason)
+        logging.warning("%s, uninstall %s", reason, ", ".join(dists) or "nothing")
+        if dists:
+            cmd = ["python", "-I", "-m", "pip", "uninstall", "--yes", *dists]
+            self._env.execute(cmd, stdin=StdinSource.OFF, run_id=f"uninstall_{of_type}").assert_success()
+
     def _install_env_vars(self) -> dict[str, str]:
         """Return env vars that affect pip resolution and should be part of the install cache key."""
         return {k: v for k, v in self._env.environment_variables.items() if k in _PIP_RESOLUTION_ENV_VARS}
 
+    def _snapshot_env_vars(self) -> dict[str, str]:
+        """Return env vars that may affect what an install builds, with the environment folder made relative."""
+        env_dir = str(self._env.env_dir)
+        return {
+            k: v.replace(env_dir, "{env_dir}") for k, v in self._env.environment_variables.items() if k not in _VOLATILE
+        }
+
     def _apply_force_deps(self, deps: Sequence[Requirement]) -> list[str]:
         forced: dict[str, Requirement] = {r.name: r for r in getattr(self._env.options, "force_dep", [])}
         return [str(forced.get(dep.name, dep)) for dep in deps]
@@ -299,10 +547,19 @@ class Pip(PythonInstallerListDependencies):
             if constraints_file.exists():
                 deps = [*deps, f"-c{constraints_file}"]
 
+        wheelhouse = Wheelhouse(self._env.core["wheelhouse_dir"]) if self._env.conf["wheelhouse"] else None
+        if wheelhouse is not None:
+            pinned = wheelhouse.pin_vcs([str(dep) for dep in deps], supported_tags(self._env.base_python))
+            deps = [*pinned, "--find-links", str(wheelhouse.root)]
         cmd = self.build_install_cmd(deps)
         outcome = self._env.execute(cmd, stdin=StdinSource.OFF, run_id=f"install_{of_type}")
         outcome.assert_success()
+        if wheelhouse is not None and of_type != "package":  # the package under test changes, keeping its version
+            site_packages = [self._env.env_site_package_dir(), self._env.env_site_package_dir_plat()]
+            wheelhouse.capture(outcome.out, [str(dep) for dep in deps], site_packages)
+        self._freeze_constraints(of_type)
 
+    def _freeze_constraints(self, of_type: str) -> None:
         if (
             of_type == "deps"
             and self.constrain_package_deps
@@ -311,6 +568,49 @@ class Pip(PythonInstallerListDependencies):
         ):
             self.constraints_file().write_text("\n".join(self.installed()))
 
+    def _install_new(
+        self, deps: Sequence[Any], section: str, of_type: str, value: Any, run: Callable[[], None] | None = None
+    ) -> None:
+        """Install into an environment that has nothing installed for this yet.
+
+        Environments installing the same into the same interpreter at the same time wait for the first one and copy
+        what it installed (unless ``coalesce_installs`` is disabled); with ``deps_snapshot`` enabled, a snapshot from an
+        earlier tox run can also be restored.
+
+        ``run`` installs instead of invoking the installer with ``deps``.
+        """
+        install = partial(self._execute_installer, deps, of_type) if run is None else run
+        if shared := self._env.conf["deps_snapshot"]:
+            max_size = self._env.core["deps_snapshot_max_size"] * 2**20
+            store = SnapshotStore(self._env.core["deps_snapshot_dir"], max_size)
+        elif not self._env.conf["coalesce_installs"]:
+            install()
+            return
+        else:
+            store = SnapshotStore(self._env.core["temp_dir"] / f"installs-{_INVOCATION}", sys.maxsize, shared=False)
+        digest = store.digest({
+            "installed": {name: self._env.cache.get(name) for name in (Python.__name__, section)},
+            "install": [section, of_type, value],
+            "install_command": self.build_install_cmd([]),
+            "env": self._snapshot_env_vars(),
+        })
+        env_dir = Path(self._env.env_dir)
+        with store.exclusive(digest) as others_waiting:
+            if store.restore(digest, env_dir):
+                if shared:
+                    logging.warning("restored %s from snapshot %s", of_type, digest)
+                else:
+                    logging.warning("copied %s from an environment with the same install inputs", of_type)
+                    if not others_waiting():
+                        store.remove(digest)
+                self._freeze_constraints(of_type)
+                return
+            install()
+            if shared or others_waiting():
+                own = {Path(self._env.conf["env_tmp_dir"]), Path(self._env.conf["env_log_dir"])}
+                folders = [p for p in env_dir.iterdir() if p.is_dir() and not p.is_symlink() and p not in own]
+                store.save(digest, env_dir, folders)
+
     def build_install_cmd(self, args: Sequence[str]) -> list[str]:
         try:
             cmd: Command = self._env.conf["install_command"]
@@ -0,0 +1,51 @@
+"""Merge the installs setting up a new environment into a single installer invocation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Stage:
+    """An install that joined the plan."""
+
+    section: str  #: the section the install is recorded under in the environment info
+    of_type: str  #: the sub-section the install is recorded under in the environment info
+    value: Any  #: what is recorded once installed, ``None`` when not recorded
+    args: tuple[str, ...]  #: the installer arguments of the install
+
+
+class InstallPlan:
+    """The installs of a new environment, installed together so the installer resolves them in one pass."""
+
+    def __init__(self) -> None:
+        self._stages: list[Stage] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._stages)
+
+    def add(self, stage: Stage) -> None:
+        """:param stage: the install to join the plan"""
+        self._stages.append(stage)
+
+    @property
+    def stages(self) -> list[Stage]:
+        """:returns: the installs of the plan, in the order they joined"""
+        return list(self._stages)
+
+    @property
+    def args(self) -> list[str]:
+        """:returns: the installer arguments of all installs, the resolver merges what more of them ask for"""
+        return [arg for stage in self._stages for arg in stage.args]
+
+    @property
+    def run_id(self) -> str:
+        """:returns: identifies the invocation installing the plan"""
+        return "+".join(dict.fromkeys(stage.of_type for stage in self._stages))
+
+
+__all__ = (
+    "InstallPlan",
+    "Stage",
+)
@@ -0,0 +1,85 @@
+"""Find what removing requirements leaves behind in a virtual environment, from the metadata of its distributions."""
+
+from __future__ import annotations
+
+import logging
+from importlib.metadata import distributions
+from typing import TYPE_CHECKING
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+#: distributions the virtual environment was seeded with, never removed
+PROTECTED = frozenset({"pip", "setuptools", "wheel"})
+
+
+def unreachable(site_packages: Iterable[Path], removed: Iterable[str], kept: Iterable[str]) -> list[str] | None:
+    """Find the installed distributions only the removed requirements lead to.
+
+    Markers and extras of the dependencies are not evaluated, every dependency counts as needed: this keeps more than
+    strictly required, never less.
+
+    :param site_packages: the folders holding the distributions of the environment
+    :param removed: the requirements no longer asked for
+    :param kept: every requirement still asked for, from any install into the environment
+
+    :returns: the names of the distributions to uninstall, ``None`` when the environment cannot tell
+    """
+    if (graph := _graph(site_packages)) is None:
+        return None
+    removed_names, kept_names = _names(removed), _names(kept)
+    if removed_names is None or kept_names is None:
+        return None
+    if missing := sorted(kept_names - graph.keys()):
+        LOGGER.debug("cannot trace dependencies of %s, not installed under their name", ", ".join(missing))
+        return None
+    keep = _closure(graph, kept_names | (PROTECTED & graph.keys()))
+    return sorted(_closure(graph, removed_names & graph.keys()) - keep)
+
+
+def _graph(site_packages: Iterable[Path]) -> dict[str, set[str]] | None:
+    graph: dict[str, set[str]] = {}
+    for dist in distributions(path=[str(path) for path in dict.fromkeys(site_packages)]):
+        if not (name := dist.metadata["Name"]) or (key := canonicalize_name(name)) in graph:
+            LOGGER.debug("distribution metadata of %s is missing or duplicated", name)
+            return None
+        try:
+            graph[key] = {canonicalize_name(Requirement(req).name) for req in dist.requires or []}
+        except InvalidRequirement as exception:
+            LOGGER.debug("invalid dependency of %s: %s", name, exception)
+            return None
+    return graph
+
+
+def _names(requirements: Iterable[str]) -> set[str] | None:
+    names: set[str] = set()
+    for line in requirements:
+        if line.startswith("-"):  # editable, nested requirement files, options - what these install is not named
+            return None
+        try:
+            names.add(canonicalize_name(Requirement(line.split(" --", 1)[0]).name))  # drop per-requirement options
+        except InvalidRequirement:  # a path or URL
+            return None
+    return names
+
+
+def _closure(graph: dict[str, set[str]], roots: set[str]) -> set[str]:
+    seen, todo = set(roots), list(roots)
+    while todo:
+        for dep in graph.get(todo.pop(), ()):
+            if dep in graph and dep not in seen:  # dependencies not installed were left out by their marker
+                seen.add(dep)
+                todo.append(dep)
+    return seen
+
+
+__all__ = (
+    "PROTECTED",
+    "unreachable",
+)
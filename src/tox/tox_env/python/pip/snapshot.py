@@ -0,0 +1,204 @@
+"""Store what an install put into a virtual environment, so environments with the same install inputs restore it."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+import threading
+import uuid
+from collections import Counter
+from contextlib import contextmanager, nullcontext, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from filelock import FileLock, Timeout
+
+from tox.util.path import clone_file, referring_files
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+LOGGER = logging.getLogger(__name__)
+
+_META = "meta.json"
+# environments of this process waiting to install what a snapshot holds, and what they wait on
+_GUARD = threading.Lock()
+_WAITING: Counter[tuple[Path, str]] = Counter()
+_INSTALLING: dict[tuple[Path, str], threading.Lock] = {}
+
+
+class SnapshotStore:
+    """Snapshots of the installed files of virtual environments, the least recently used ones evicted beyond a size."""
+
+    def __init__(self, root: Path, max_size: int, *, shared: bool = True) -> None:
+        """Open the store.
+
+        :param root: the folder holding the snapshots
+        :param max_size: the size in bytes the snapshots may take up together
+        :param shared: other tox processes use the store too
+        """
+        self.root, self._max_size, self._shared = root, max_size, shared
+
+    @contextmanager
+    def exclusive(self, digest: str) -> Iterator[Callable[[], bool]]:
+        """Hold the right to install what a snapshot holds, waiting while another environment installs the same.
+
+        :param digest: the identifier of the snapshot
+
+        :returns: tells if environments of this process wait to install the same
+        """
+        key = self.root, digest
+        with _GUARD:
+            _WAITING[key] += 1
+            waiting = True
+            lock = _INSTALLING.setdefault(key, threading.Lock())
+        try:
+            with lock:
+                if self._shared:
+                    self.root.mkdir(parents=True, exist_ok=True)
+                with FileLock(self.root / f"{digest}.install.lock") if self._shared else nullcontext():
+                    with _GUARD:
+                        _WAITING[key] -= 1
+                        waiting = False
+                    yield lambda: _WAITING[key] > 0
+        finally:
+            if waiting:
+                with _GUARD:
+                    _WAITING[key] -= 1
+
+    @staticmethod
+    def digest(key: dict[str, Any]) -> str:
+        """:returns: the identifier of the snapshot of these install inputs"""
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:32]
+
+    def restore(self, digest: str, env_dir: Path) -> bool:
+        """Copy the files of a snapshot into a virtual environment.
+
+        :param digest: the identifier of the snapshot
+        :param env_dir: the virtual environment, files referring to the snapshot environment are pointed to it instead
+
+        :returns: ``True`` if restored, ``False`` when there is no such snapshot
+        """
+        folder = self.root / digest
+        with FileLock(self._lock(digest)):
+            try:
+                meta = json.loads((folder / _META).read_text(encoding="utf-8"))
+                relatives, embedding = meta["folders"], meta["embedding"]
+            except (OSError, ValueError, KeyError):  # missing, or stored by an earlier tox
+                return False
+            for relative in relatives:
+                source, target = folder / "content" / relative, env_dir / relative
+                shutil.copytree(source, target, copy_function=_replace, dirs_exist_ok=True)
+            (folder / _META).touch()  # mark as recently used
+        _retarget(env_dir, embedding, meta["env_dir"])
+        return True
+
+    def save(self, digest: str, env_dir: Path, folders: Iterable[Path]) -> None:
+        """Take a snapshot of the folders of a virtual environment, then evict snapshots beyond the size limit.
+
+        Text files referring to the environment are pointed to the restoring one, bytecode referring to it is left out
+        to be compiled again; other binary files referring to it make the environment not relocatable, so not stored.
+
+        :param digest: the identifier of the snapshot
+        :param env_dir: the virtual environment
+        :param folders: the folders within the virtual environment to store, symbolic links are left out
+        """
+        if (self.root / digest / _META).exists():
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        building = self.root / f".{digest}-{uuid.uuid4().hex}"
+        try:
+            relatives = sorted({folder.relative_to(env_dir).as_posix() for folder in folders if folder.exists()})
+            for relative in relatives:
+                source, target = env_dir / relative, building / "content" / relative
+                shutil.copytree(source, target, ignore=_links, copy_function=clone_file)
+            if (embedding := referring_files(building / "content", env_dir)) is None:
+                LOGGER.info("not storing snapshot %s as binary files refer to %s", digest, env_dir)
+                return
+            meta = {"env_dir": str(env_dir), "folders": relatives, "embedding": embedding, "size": _size(building)}
+            (building / _META).write_text(json.dumps(meta), encoding="utf-8")
+            with FileLock(self._lock(digest)):
+                if (self.root / digest).exists():  # a concurrent tox stored it first
+                    return
+                building.rename(self.root / digest)
+        finally:
+            shutil.rmtree(building, ignore_errors=True)
+        LOGGER.info("stored snapshot %s", digest)
+        self._evict(keep=digest)
+
+    def remove(self, digest: str) -> None:
+        """Remove a snapshot, and the store once empty.
+
+        :param digest: the identifier of the snapshot
+        """
+        with FileLock(lock := self._lock(digest)):
+            shutil.rmtree(self.root / digest, ignore_errors=True)
+            _unlink_held(lock)
+        with suppress(OSError):  # other snapshots remain
+            self.root.rmdir()
+
+    def _evict(self, keep: str) -> None:
+        snapshots: list[tuple[float, int, str]] = []
+        for folder in self.root.iterdir():
+            if folder.name.startswith("."):  # being built
+                continue
+            try:
+                meta_path = folder / _META
+                snapshots.append((meta_path.stat().st_mtime, json.loads(meta_path.read_text())["size"], folder.name))
+            except (OSError, ValueError, KeyError):  # not a snapshot, or one being evicted
+                continue
+        total = sum(size for _, size, _ in snapshots)
+        for _, size, digest in sorted(snapshots):
+            if total <= self._max_size:
+                break
+            if digest == keep:
+                continue
+            try:
+                with FileLock(lock := self._lock(digest), timeout=0):  # one being restored is recently used, skip it
+                    shutil.rmtree(self.root / digest, ignore_errors=True)
+                    _unlink_held(lock)
+            except Timeout:
+                continue
+            LOGGER.info("evicted snapshot %s", digest)
+            total -= size
+        for lock in self.root.glob("*.lock"):  # of evicted snapshots, or of installs that stored none
+            if not (self.root / lock.name.split(".")[0]).exists():
+                with suppress(Timeout), FileLock(lock, timeout=0):  # in use by an install, a restore or a save
+                    _unlink_held(lock)
+
+    def _lock(self, digest: str) -> Path:
+        return self.root / f"{digest}.lock"
+
+
+def _unlink_held(lock: Path) -> None:
+    # while held: whoever waits on it then finds it gone, and locks the file taking its place
+    with suppress(OSError):  # Windows removes it on release
+        lock.unlink()
+
+
+def _links(folder: str, names: list[str]) -> set[str]:
+    return {name for name in names if Path(folder, name).is_symlink()}
+
+
+def _replace(src: str, dst: str) -> None:
+    # the fresh virtual environment has its own copy, the snapshot may hold a newer one
+    Path(dst).unlink(missing_ok=True)
+    clone_file(src, dst)
+
+
+def _size(folder: Path) -> int:
+    return sum(path.stat().st_size for path in folder.rglob("*") if path.is_file())
+
+
+def _retarget(env_dir: Path, embedding: Iterable[str], old: str) -> None:
+    before, after = old.encode(), str(env_dir).encode()
+    if before == after:
+        return
+    for relative in embedding:
+        path = env_dir / relative
+        path.write_bytes(path.read_bytes().replace(before, after))
+
+
+__all__ = ("SnapshotStore",)
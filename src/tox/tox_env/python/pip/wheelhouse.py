@@ -0,0 +1,322 @@
+"""Keep the wheels pip built from source distributions and git checkouts, so later installs use them instead."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+import uuid
+from contextlib import suppress
+from dataclasses import dataclass
+from importlib.metadata import distributions
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, cast
+from urllib.parse import urlsplit, urlunsplit
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import (
+    InvalidSdistFilename,
+    InvalidWheelFilename,
+    canonicalize_name,
+    parse_sdist_filename,
+    parse_wheel_filename,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from packaging.tags import Tag
+    from packaging.utils import NormalizedName
+
+    from tox.config.main import Config
+    from tox.config.sets import CoreConfigSet
+
+LOGGER = logging.getLogger(__name__)
+
+_CREATED = re.compile(
+    r"Created wheel for (?P<name>\S+): filename=(?P<file>\S+\.whl) .*\bsha256=(?P<sha256>[0-9a-f]{64})"
+)
+_STORED = re.compile(r"Stored in directory: (?P<dir>.+?)\s*$")
+_DIRECT = re.compile(r"Collecting (?P<name>[A-Za-z0-9._-]+)(?:\[[^]]*])?\s*@")  # a requirement of a URL, not a name
+_COMMIT = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+#: how long to wait for the remote to list its references, in seconds
+_LS_REMOTE_TIMEOUT = 30
+#: the commits references resolved to during this invocation, by repository and reference
+_RESOLVED: dict[tuple[str, str], str | None] = {}
+_RESOLVING: dict[tuple[str, str], threading.Lock] = {}
+_GUARD = threading.Lock()
+#: the folder of the wheels built from git checkouts, out of the sight of ``--find-links`` as these go by commit
+_VCS = "vcs"
+
+
+@dataclass(frozen=True)
+class Wheel:
+    """A wheel held by the wheelhouse."""
+
+    path: Path
+    size: int
+    added: float  #: when the wheelhouse took the wheel, as seconds since the epoch
+
+
+def add_wheelhouse_dir_to_core(core: CoreConfigSet) -> None:
+    """:param core: the core configuration to register the folder of the wheelhouse with"""
+
+    def _default(conf: Config, env_name: str | None) -> Path:  # ruff:ignore[unused-function-argument]
+        return cast("Path", conf.core["work_dir"]) / ".wheelhouse"
+
+    core.add_config(
+        keys=["wheelhouse_dir"],
+        of_type=Path,
+        default=_default,
+        desc="the folder keeping the wheels pip built from source distributions and git checkouts",
+    )
+
+
+class Wheelhouse:
+    """A folder of wheels pip built, handed back to pip as a ``--find-links`` source.
+
+    The file name of a wheel tells the project, its version and the interpreter tags it was built for; pip picks the
+    matching one for the requirement and interpreter at hand. Wheels built for ``git+`` requirements are kept apart, by
+    project and commit, and handed to pip by :meth:`pin_vcs` when the reference of the requirement resolves to that
+    commit. Wheels built for other requirements of a URL (archives) are left out, pip looks these up by URL.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """:param root: the folder holding the wheels"""
+        self.root = root
+
+    def pin_vcs(self, args: Iterable[str], tags: Sequence[Tag]) -> list[str]:
+        """Point the ``git+`` requirements at the wheel held for the commit their reference resolves to.
+
+        Requirements without such a wheel are pinned to the commit instead, so pip keeps the wheel it builds in its
+        wheel cache (it does not keep those of branches and tags) for :meth:`capture` to take.
+
+        :param args: what pip is about to install
+        :param tags: the wheel tags the interpreter installs, most preferred first
+
+        :returns: the arguments, with the ``git+`` requirements of a resolvable reference replaced
+        """
+        return [self._pin(arg, tags) for arg in args]
+
+    def _pin(self, arg: str, tags: Sequence[Tag]) -> str:
+        try:
+            req = Requirement(arg)
+        except InvalidRequirement:  # an option, a path or a requirement file
+            return arg
+        if req.url is None or (location := _git_location(req.url)) is None:
+            return arg
+        repo, ref, fragment = location
+        if (commit := _resolve(repo, ref)) is None:
+            return arg
+        if (wheel := self._vcs_wheel(req.name, commit, tags)) is not None:
+            LOGGER.info("wheelhouse has %s for %s at %s", wheel.name, req.name, commit)
+            req.url = wheel.as_uri()
+        else:
+            req.url = f"git+{repo}@{commit}{fragment}"
+        return str(req)
+
+    def _vcs_wheel(self, name: str, commit: str, tags: Sequence[Tag]) -> Path | None:
+        rank = {tag: at for at, tag in enumerate(tags)}
+        best: tuple[int, Path] | None = None
+        for path in (self.root / _VCS / f"{canonicalize_name(name)}-{commit}").glob("*.whl"):
+            try:
+                wheel_tags = parse_wheel_filename(path.name)[3]
+            except InvalidWheelFilename:
+                continue
+            at = min((rank[tag] for tag in wheel_tags if tag in rank), default=None)
+            if at is not None and (best is None or at < best[0]):
+                best = at, path
+        return None if best is None else best[1]
+
+    def capture(self, output: str, args: Iterable[str] = (), site_packages: Iterable[Path] = ()) -> list[Path]:
+        """Take the wheels a pip install built, as its output tells, that pip stored in its wheel cache.
+
+        :param output: what pip printed
+        :param args: what pip installed, the wheels of source distribution files named here are not taken as these
+            change keeping their version
+        :param site_packages: where pip installed to, the wheels of requirements installed from a git checkout are
+            taken for the commit the installed distribution records
+
+        :returns: the wheels taken
+        """
+        direct: set[str] = {name for arg in args if (name := _sdist_name(arg)) is not None}
+        created: tuple[str, str, str] | None = None
+        taken: list[Path] = []
+        for line in output.splitlines():
+            if match := _DIRECT.search(line):
+                direct.add(canonicalize_name(match["name"]))
+            elif match := _CREATED.search(line):
+                created = match["name"], match["file"], match["sha256"]
+            elif (match := _STORED.search(line)) and created is not None:
+                name, filename, sha256 = created
+                created = None
+                dest = self.root
+                if canonicalize_name(name) in direct:
+                    if (commit := _vcs_commit(site_packages, name)) is None:
+                        continue
+                    dest = self.root / _VCS / f"{canonicalize_name(name)}-{commit}"
+                if (path := self._take(Path(match["dir"]), filename, sha256, dest)) is not None:
+                    taken.append(path)
+        return taken
+
+    @staticmethod
+    def _take(folder: Path, filename: str, sha256: str, dest_dir: Path) -> Path | None:
+        source, dest = folder / filename, dest_dir / filename
+        try:
+            parse_wheel_filename(filename)
+        except InvalidWheelFilename:
+            return None
+        if dest.exists() or not source.is_file():  # pip's wheel cache is disabled, the built wheel is gone by now
+            return None
+        if hashlib.sha256(source.read_bytes()).hexdigest() != sha256:
+            LOGGER.debug("wheel %s changed since pip built it, not taken", source)
+            return None
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        temp = dest_dir / f".{filename}-{uuid.uuid4().hex}"
+        try:
+            shutil.copyfile(source, temp)
+            temp.replace(dest)  # other environments see either no wheel or all of it
+        except OSError as exception:
+            LOGGER.debug("could not take wheel %s: %r", source, exception)
+            temp.unlink(missing_ok=True)
+            return None
+        LOGGER.info("wheelhouse took %s", filename)
+        return dest
+
+    def wheels(self) -> list[Wheel]:
+        """:returns: the wheels held, by file name, followed by those built from git checkouts"""
+        if not self.root.is_dir():
+            return []
+        result: list[Wheel] = []
+        for path in [*sorted(self.root.glob("*.whl")), *sorted(self.root.glob(f"{_VCS}/*/*.whl"))]:
+            try:
+                parse_wheel_filename(path.name)
+                stat = path.stat()
+            except (InvalidWheelFilename, OSError):  # not put there by tox, or removed by another tox process meanwhile
+                continue
+            result.append(Wheel(path=path, size=stat.st_size, added=stat.st_mtime))
+        return result
+
+    def select(self, older_than: float | None = None, names: Iterable[str] = ()) -> list[Wheel]:
+        """Find wheels.
+
+        :param older_than: only the wheels taken more than these many seconds ago, all if ``None``
+        :param names: only the wheels of these projects, all if empty
+
+        :returns: the wheels found
+        """
+        projects = {canonicalize_name(name) for name in names}
+        limit = None if older_than is None else time.time() - older_than
+        return [
+            wheel
+            for wheel in self.wheels()
+            if (limit is None or wheel.added <= limit)
+            and (not projects or parse_wheel_filename(wheel.path.name)[0] in projects)
+        ]
+
+    def prune(self, older_than: float | None = None, names: Iterable[str] = ()) -> list[Wheel]:
+        """Remove the wheels :meth:`select` finds.
+
+        :returns: the wheels removed
+        """
+        removed = self.select(older_than, names)
+        for wheel in removed:
+            wheel.path.unlink(missing_ok=True)
+            if wheel.path.parent != self.root:
+                with suppress(OSError):  # other wheels of the commit remain
+                    wheel.path.parent.rmdir()
+        return removed
+
+
+def _git_location(url: str) -> tuple[str, str, str] | None:
+    """:returns: the repository, the reference (empty for the default branch) and the fragment of a ``git+`` URL"""
+    if not url.startswith("git+"):
+        return None
+    location, sep, fragment = url.removeprefix("git+").partition("#")
+    parts = urlsplit(location)
+    path, at, ref = parts.path.rpartition("@")
+    if not at:
+        path, ref = parts.path, ""
+    return urlunsplit(parts._replace(path=path)), ref, f"{sep}{fragment}"
+
+
+def _resolve(repo: str, ref: str) -> str | None:
+    """:returns: the commit the reference of a repository points to, ``None`` if it cannot be told"""
+    if _COMMIT.fullmatch(ref):
+        return ref
+    key = repo, ref
+    with _GUARD:
+        lock = _RESOLVING.setdefault(key, threading.Lock())
+    with lock:  # environments installing the same requirement at the same time ask the remote once
+        if key not in _RESOLVED:
+            _RESOLVED[key] = _ls_remote(repo, ref)
+        return _RESOLVED[key]
+
+
+def clear_resolved() -> None:
+    """Forget the commits references resolved to, so the next invocation asks the remotes again."""
+    with _GUARD:
+        _RESOLVED.clear()
+        _RESOLVING.clear()
+
+
+def _ls_remote(repo: str, ref: str) -> str | None:
+    cmd = ["git", "ls-remote", repo, *((ref, f"{ref}^{{}}") if ref else ("HEAD",))]
+    env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}  # fail rather than ask for credentials, like pip runs
+    try:
+        listed = subprocess.run(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            check=True,
+            text=True,
+            env=env,
+            timeout=_LS_REMOTE_TIMEOUT,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as exception:
+        LOGGER.debug("could not resolve %s of %s: %r", ref or "HEAD", repo, exception)
+        return None
+    found = [line.split("\t", 1) for line in listed.splitlines() if "\t" in line]
+    if peeled := {sha for sha, name in found if name.endswith("^{}")}:  # the commit of an annotated tag
+        found = [(sha, name) for sha, name in found if sha in peeled]
+    commits = {sha for sha, _ in found}
+    return commits.pop() if len(commits) == 1 else None  # none, a short commit, or names of several references
+
+
+def _vcs_commit(site_packages: Iterable[Path], name: str) -> str | None:
+    """:returns: the commit an installed distribution records it was built from, ``None`` if not a git checkout"""
+    key = canonicalize_name(name)
+    for location in site_packages:
+        if not location.is_dir():
+            continue
+        for dist in distributions(path=[str(location)]):
+            if canonicalize_name(dist.metadata["Name"] or "") != key:
+                continue
+            try:
+                vcs_info = json.loads(dist.read_text("direct_url.json") or "{}").get("vcs_info") or {}
+            except (ValueError, AttributeError):
+                return None
+            commit = vcs_info.get("commit_id", "") if vcs_info.get("vcs") == "git" else ""
+            return commit if _COMMIT.fullmatch(commit) else None
+    return None
+
+
+def _sdist_name(arg: str) -> NormalizedName | None:
+    try:
+        return parse_sdist_filename(PurePath(arg).name)[0]
+    except InvalidSdistFilename:  # not a source distribution file, pip does not keep what it builds from folders
+        return None
+
+
+__all__ = (
+    "Wheel",
+    "Wheelhouse",
+    "add_wheelhouse_dir_to_core",
+    "clear_resolved",
+)
@@ -30,6 +30,10 @@ class Pylock:
 
     def install_lines(self) -> list[str]:
         """Return pip requirement lines for the packages this environment locks."""
+        return [line for line, _ in self.entries()]
+
+    def entries(self) -> list[tuple[str, Package]]:
+        """Return the packages this environment locks, each with its pip requirement line."""
         with self.path.open("rb") as fh:
             data = tomllib.load(fh)
         try:
@@ -37,12 +41,15 @@ class Pylock:
         except PylockValidationError as exc:
             msg = f"invalid pylock file {self.path}: {exc}"
             raise Fail(msg) from exc
-        entries = [self._to_entry(pkg) for pkg in parsed.packages if self._is_active(pkg)]
+        packages = [pkg for pkg in parsed.packages if self._is_active(pkg)]
+        entries = [self._to_entry(pkg) for pkg in packages]
         if all(hashes for _, hashes in entries):
             # pip's hash-checking mode is all-or-nothing for a requirements file: verify when every line can carry
             # a hash, otherwise fall back to unverified installs (directory/VCS sources cannot be hashed)
-            return [f"{line} {' '.join(f'--hash={h}' for h in hashes)}" for line, hashes in entries]
-        return [line for line, _ in entries]
+            lines = [f"{line} {' '.join(f'--hash={h}' for h in hashes)}" for line, hashes in entries]
+        else:
+            lines = [line for line, _ in entries]
+        return list(zip(lines, packages, strict=True))
 
     def _is_active(self, pkg: Package) -> bool:
         env: dict[str, str | frozenset[str]] = {**self.marker_env}
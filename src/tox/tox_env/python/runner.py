@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from abc import ABC
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from packaging.utils import canonicalize_name
 
@@ -26,6 +26,8 @@ from .extras import resolve_extras_static
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from packaging.requirements import Requirement
+
     from tox.config.cli.parser import Parsed
     from tox.config.main import Config
     from tox.config.sets import CoreConfigSet, EnvConfigSet
@@ -35,6 +37,7 @@ if TYPE_CHECKING:
 
 class PythonRun(Python, RunToxEnv, ABC):
     def __init__(self, create_args: ToxEnvCreateArgs) -> None:
+        self._env_install_pending = False  #: the environment is set up, its dependencies not yet installed
         super().__init__(create_args)
 
     def register_config(self) -> None:
@@ -146,6 +149,10 @@ class PythonRun(Python, RunToxEnv, ABC):
         if getattr(self.options, "skip_env_install", False):
             logging.warning("skip installing dependencies and package")
             return
+        # installed with the package, so the installer may merge them into one invocation
+        self._env_install_pending = True
+
+    def _install_env_deps(self) -> None:
         if self.conf["pylock"]:
             self._install_pylock()
         else:
@@ -157,17 +164,23 @@ class PythonRun(Python, RunToxEnv, ABC):
         self._install(requirements_file, PythonRun.__name__, "deps")
 
     def _install_dependency_groups(self) -> None:
+        if (requirements := self._dependency_groups()) is not None:
+            self._install(requirements, PythonRun.__name__, "dependency-groups")
+
+    def _dependency_groups(self) -> list[Requirement] | None:
         groups: set[str] = self.conf["dependency_groups"]
         if not groups:
-            return
+            return None
         try:
             root: Path = self.core["package_root"]
         except KeyError:
             root = self.core["tox_root"]
-        requirements = resolve_dependency_groups(root, groups)
-        self._install(list(requirements), PythonRun.__name__, "dependency-groups")
+        return list(resolve_dependency_groups(root, groups))
 
     def _install_pylock(self) -> None:
+        self._install(self._pylock(), PythonRun.__name__, "pylock")
+
+    def _pylock(self) -> Pylock:
         pylock_path: str = self.conf["pylock"]
         try:
             root: Path = self.core["package_root"]
@@ -186,11 +199,30 @@ class PythonRun(Python, RunToxEnv, ABC):
         }
         extras: set[str] = self.conf["extras"]
         groups: set[str] = self.conf["dependency_groups"]
-        pylock = Pylock(path=path, extras=frozenset(extras), groups=frozenset(groups), marker_env=marker_env)
-        self._install(pylock, PythonRun.__name__, "pylock")
+        return Pylock(path=path, extras=frozenset(extras), groups=frozenset(groups), marker_env=marker_env)
+
+    def _setup_fingerprint(self) -> dict[str, Any] | None:
+        if getattr(self.options, "skip_env_install", False):
+            steps: dict[str, Any] = {}
+        elif self.conf["pylock"]:
+            steps = {"pylock": self._pylock()}
+        else:
+            steps = {"deps": self.conf["deps"], "dependency-groups": self._dependency_groups()}
+        install: dict[str, Any] = {}
+        for of_type, arguments in steps.items():
+            if arguments is None:
+                continue
+            if (value := self.installer.fingerprint(arguments)) is None:
+                return None
+            install[of_type] = value
+        return {"python": self.python_cache(), "skip_env_install": not steps, "install": install}
 
     def _setup_with_env(self) -> None:
-        super()._setup_with_env()
+        pending, self._env_install_pending = self._env_install_pending, False
+        with self.installer.planned():
+            if pending:
+                self._install_env_deps()
+            super()._setup_with_env()
         self._run_extra_setup_commands()
 
     def _run_extra_setup_commands(self) -> None:
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
 import os
+import shutil
 import sys
 from abc import ABC
 from contextlib import redirect_stderr
@@ -12,6 +16,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from packaging.version import Version
+from platformdirs import user_cache_dir
 from python_discovery import get_interpreter
 from virtualenv import __version__ as virtualenv_version
 from virtualenv import app_data, session_via_cli
@@ -22,9 +27,13 @@ from tox.execute.local_sub_process import LocalSubProcessExecutor
 from tox.tox_env.errors import Skip
 from tox.tox_env.python.api import Python, PythonInfo, VersionInfo
 from tox.tox_env.python.pip.pip_install import Pip
+from tox.tox_env.python.virtual_env.interpreter_cache import dump_info, interpreter_cache, load_info, signature
 from tox.tox_env.python.virtual_env.subprocess_adapter import SubprocessCreator, SubprocessPythonInfo, SubprocessSession
+from tox.tox_env.python.virtual_env.template import can_clone, clone, ensure_template, template_path
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from python_discovery import PyInfoCache
     from virtualenv.create.creator import Creator
     from virtualenv.create.describe import Describe
@@ -43,6 +52,7 @@ class VirtualEnv(Python, ABC):
         self._virtualenv_session: Session | SubprocessSession | None = None
         self._executor: Execute | None = None
         self._installer: Pip | None = None
+        self._layout: dict[str, Path] | None = None  # the paths within the environment, cached by an earlier setup
         super().__init__(create_args)
 
     def register_config(self) -> None:
@@ -83,6 +93,19 @@ class VirtualEnv(Python, ABC):
             "incompatible with the installed virtualenv. Left empty it is derived automatically: tox pins an "
             "older virtualenv only when the installed one can no longer create the targeted Python version.",
         )
+        self.core.add_config(
+            keys=["virtualenv_bootstrap_dir"],
+            of_type=Path,
+            default=Path(user_cache_dir("tox")) / "virtualenv-bootstrap",
+            desc="the folder holding the isolated virtualenv installations of virtualenv_spec, shared by all projects",
+        )
+        self.conf.add_config(
+            keys=["venv_template"],
+            of_type=bool,
+            default=True,
+            desc="create the virtual environment by cloning a template shared with environments that use the same "
+            "interpreter and virtualenv settings",
+        )
 
     def _default_virtualenv_spec(self, conf: Config, name: str | None) -> str:  # ruff:ignore[unused-method-argument]
         return _auto_virtualenv_spec(self.conf["base_python"], virtualenv_version)
@@ -106,6 +129,8 @@ class VirtualEnv(Python, ABC):
             base["virtualenv_spec"] = spec
         else:
             base["virtualenv version"] = virtualenv_version
+        if (template := self._venv_template()) is not None:
+            base["venv template"] = template.name
         return base
 
     def _get_env_journal_python(self) -> dict[str, Any]:
@@ -144,14 +169,14 @@ class VirtualEnv(Python, ABC):
             resolved = get_interpreter(base_python, try_first_with=try_first_with, cache=cache, env=env)
             if resolved is None or (executable := resolved.system_executable) is None:
                 continue
-            if (interpreter := probe_python(executable)) is not None:
+            if (interpreter := _probe_cached(executable, probe_python)) is not None:
                 break
         # only pay the bootstrap cost once an interpreter is found; a missing one skips without it
-        bootstrap = ensure_bootstrap(cast("Path", self.core["work_dir"]), spec) if interpreter is not None else None
+        bootstrap = None if interpreter is None else ensure_bootstrap(self.core["virtualenv_bootstrap_dir"], spec)
         return SubprocessSession(self.env_dir, bootstrap, env, interpreter)
 
-    def _create_imported_session(self, env: dict[str, str]) -> Session:
-        env_dir = [str(self.env_dir)]
+    def _create_imported_session(self, env: dict[str, str], dest: Path | None = None) -> Session:
+        env_dir = [str(dest or self.env_dir)]
         try:
             with redirect_stderr(StringIO()):
                 return session_via_cli(env_dir, options=None, setup_logging=False, env=env)
@@ -178,7 +203,94 @@ class VirtualEnv(Python, ABC):
         return self.session.creator
 
     def create_python_env(self) -> None:
-        self.session.run()
+        script_dir = cast("Describe", self.creator).script_dir
+        # virtualenv updates a virtual environment left behind in place, a clone would clash with it
+        if (template := self._venv_template()) is None or script_dir.exists():
+            self.session.run()
+            return
+        if (referring := ensure_template(template, self._venv_template_key(), self._build_venv_template)) is None:
+            self.session.run()
+            return
+        try:
+            clone(template, self.env_dir, referring)
+        except OSError as exception:  # such as the template pruned by another tox meanwhile
+            logging.warning("could not clone virtual environment template %s: %r", template, exception)
+            shutil.rmtree(self.env_dir, ignore_errors=True)
+            self.session.run()
+
+    def _venv_template(self) -> Path | None:
+        """:returns: the template to clone the virtual environment from, ``None`` to create it with virtualenv"""
+        if not self.conf["venv_template"] or self.conf["virtualenv_spec"] or self.conf["download"]:
+            return None  # a subprocess virtualenv has its own seeding, download seeds the latest versions each time
+        work_dir = cast("Path", self.core["work_dir"])
+        template = template_path(work_dir, self._venv_template_key())
+        return template if can_clone(template, self.env_dir) else None
+
+    def _venv_template_key(self) -> dict[str, Any]:
+        env = self.virtualenv_env_vars()
+        return {
+            "executable": str(self.base_python.extra["executable"]),
+            "version_info": list(self.base_python.version_info),
+            "virtualenv version": virtualenv_version,
+            "virtualenv": {  # interpreter discovery is already settled by the executable
+                k: v for k, v in env.items() if k.startswith("VIRTUALENV_") and k not in _NOT_TEMPLATE_KEY
+            },
+        }
+
+    def _build_venv_template(self, path: Path) -> None:
+        self._create_imported_session(self.virtualenv_env_vars(), path).run()
+
+    def _setup_state(self) -> dict[str, Any] | None:
+        executable = signature(self.base_python.extra["executable"])
+        if executable is None or (pyvenv_cfg := self._pyvenv_cfg_digest()) is None:
+            return None
+        return {
+            "python": dump_info(self.base_python),
+            "discovery": self._discovery_key(),
+            "executable": executable,
+            "layout": {attr: str(self._describe_path(attr)) for attr in _LAYOUT},
+            "pyvenv.cfg": pyvenv_cfg,
+        }
+
+    def _restore_setup_state(self, state: dict[str, Any]) -> bool:
+        try:
+            info, layout = load_info(state["python"]), {attr: Path(state["layout"][attr]) for attr in _LAYOUT}
+            if (
+                state["discovery"] != self._discovery_key()
+                or state["executable"] != signature(info.extra["executable"])  # stored ones are never None
+                or not layout["exe"].exists()
+                or state["pyvenv.cfg"] != self._pyvenv_cfg_digest()
+            ):
+                return False  # the interpreter discovery may find another interpreter, or the environment was replaced
+        except (KeyError, TypeError):
+            return False
+        self._base_python, self._base_python_searched, self._layout = info, True, layout
+        if self.journal:
+            self.journal["python"] = self._get_env_journal_python()
+        self._paths = self.prepend_env_var_path()
+        return True
+
+    def _pyvenv_cfg_digest(self) -> str | None:
+        try:
+            return hashlib.sha256((self.env_dir / "pyvenv.cfg").read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def _discovery_key(self) -> dict[str, Any]:
+        return {
+            "base_python": self.conf["base_python"],
+            "discover": list(getattr(self.options, "discover", None) or []),
+            "PATH": os.environ.get("PATH", ""),
+            "virtualenv_spec": self.conf["virtualenv_spec"],
+        }
+
+    def base_python_key(self) -> str | None:
+        if not self.conf["recreate"] and self._restore_last_setup() is not None:
+            return None  # the last setup already knows the interpreter
+        # the discovery of virtualenv is driven by its environment variables, the base pythons included
+        env = self.virtualenv_env_vars()
+        key = {k: v for k, v in env.items() if k.startswith(_DISCOVERY_ENV) or k == "PATH"}
+        return json.dumps({"env": key, "virtualenv_spec": self.conf["virtualenv_spec"]}, sort_keys=True)
 
     def _get_python(self, base_python: list[str]) -> PythonInfo | None:  # ruff:ignore[unused-method-argument]
         # the base pythons are injected into the virtualenv_env_vars, so we don't need to use it here
@@ -186,23 +298,14 @@ class VirtualEnv(Python, ABC):
             interpreter = self.creator.interpreter
         except (FileNotFoundError, RuntimeError):  # Unable to find the interpreter
             return None
-        if (sys_exe := interpreter.system_executable) is None:
-            return None
-        vi = interpreter.version_info
-        return PythonInfo(
-            implementation=interpreter.implementation,
-            version_info=VersionInfo(vi.major, vi.minor, vi.micro, vi.releaselevel, vi.serial),
-            version=interpreter.version,
-            is_64=(interpreter.architecture == 64),  # ruff:ignore[magic-value-comparison]
-            platform=interpreter.platform,
-            extra={"executable": Path(sys_exe).resolve()},
-            free_threaded=interpreter.free_threaded,
-            debug=interpreter.debug_build,
-            machine=getattr(interpreter, "machine", None),
-        )
+        if (info := _to_python_info(interpreter)) is not None:
+            interpreter_cache().put(info.extra["executable"], info)
+        return info
 
     def prepend_env_var_path(self) -> list[Path]:
         """Paths to add to the executable."""
+        if self._layout is not None:
+            return list(dict.fromkeys((self._layout["bin_dir"], self._layout["script_dir"])))
         creator = self._creator_with_skip()
         if isinstance(creator, SubprocessCreator):
             return list(dict.fromkeys((creator.bin_dir, creator.script_dir)))
@@ -222,6 +325,8 @@ class VirtualEnv(Python, ABC):
         return self._describe_path("script_dir")
 
     def _describe_path(self, attr: str) -> Path:
+        if self._layout is not None:
+            return self._layout[attr]
         creator = self._creator_with_skip()
         if isinstance(creator, SubprocessCreator):
             return getattr(creator, attr)
@@ -253,13 +358,18 @@ class VirtualEnv(Python, ABC):
         :returns: the found spec
 
         """
-        info = cls.get_virtualenv_py_info(path)
-        machine_suffix = f"-{m}" if (m := getattr(info, "machine", None)) else ""
-        threaded = "t" if getattr(info, "free_threaded", False) else ""
-        debug = "d" if getattr(info, "debug_build", False) else ""
+        cache = interpreter_cache()
+        if (info := cache.get(path)) is None:
+            if (info := _to_python_info(cls.get_virtualenv_py_info(path))) is None:
+                msg = f"could not query python information for {path}"
+                raise RuntimeError(msg)
+            cache.put(path, info)
+        machine_suffix = f"-{info.machine}" if info.machine else ""
+        threaded = "t" if info.free_threaded else ""
+        debug = "d" if info.debug else ""
         return PythonSpec.from_string_spec(
             f"{info.implementation}{info.version_info.major}{info.version_info.minor}{threaded}{debug}"
-            f"-{info.architecture}{machine_suffix}"
+            f"-{64 if info.is_64 else 32}{machine_suffix}"
         )
 
     @staticmethod
@@ -283,6 +393,40 @@ class VirtualEnv(Python, ABC):
         return result
 
 
+# the paths within a virtual environment cached across setups, so an unchanged environment needs no virtualenv session
+_LAYOUT = ("bin_dir", "script_dir", "purelib", "platlib", "exe")
+# environment variables that steer where the interpreter discovery looks for interpreters
+_DISCOVERY_ENV = ("VIRTUALENV_", "PYENV", "UV_")
+_NOT_TEMPLATE_KEY = frozenset({"VIRTUALENV_CLEAR", "VIRTUALENV_PYTHON", "VIRTUALENV_TRY_FIRST_WITH"})
+
+
+def _to_python_info(interpreter: VirtualenvPythonInfo | SubprocessPythonInfo) -> PythonInfo | None:
+    if (sys_exe := interpreter.system_executable) is None:
+        return None
+    vi = interpreter.version_info
+    return PythonInfo(
+        implementation=interpreter.implementation,
+        version_info=VersionInfo(vi.major, vi.minor, vi.micro, vi.releaselevel, vi.serial),
+        version=interpreter.version,
+        is_64=(interpreter.architecture == 64),  # ruff:ignore[magic-value-comparison]
+        platform=interpreter.platform,
+        extra={"executable": Path(sys_exe).resolve()},
+        free_threaded=interpreter.free_threaded,
+        debug=interpreter.debug_build,
+        machine=getattr(interpreter, "machine", None),
+    )
+
+
+def _probe_cached(executable: str, probe: Callable[[str], SubprocessPythonInfo | None]) -> SubprocessPythonInfo | None:
+    """Probe an interpreter an older virtualenv creates environments for, unless already known."""
+    cache = interpreter_cache()
+    if (info := cache.get(Path(executable))) is not None:
+        return SubprocessPythonInfo.from_python_info(info)
+    if (probed := probe(executable)) is not None and (info := _to_python_info(probed)) is not None:
+        cache.put(Path(executable), info)
+    return probed
+
+
 def _shared_app_data() -> PyInfoCache:
     """Interpreter metadata cache, shared so tox discovery reuses what virtualenv already probed (and vice versa)."""
     return app_data.make_app_data(None, read_only=False, env=os.environ)
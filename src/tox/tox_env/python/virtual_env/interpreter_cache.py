@@ -0,0 +1,131 @@
+"""Remember what tox found out about interpreters, so each interpreter binary is inspected once until it changes."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from dataclasses import asdict
+from functools import cache
+from hashlib import sha256
+from pathlib import Path
+from typing import Any
+
+from virtualenv import app_data
+
+from tox.tox_env.python.api import PythonInfo, VersionInfo
+
+LOGGER = logging.getLogger(__name__)
+
+
+class InterpreterCache:
+    """Interpreter information keyed by the resolved path of the interpreter, valid while the binary is unchanged."""
+
+    def __init__(self, root: Path | None) -> None:
+        """Open the cache.
+
+        :param root: the folder persisting the entries across tox invocations, ``None`` to only keep them in memory
+        """
+        self.root = root
+        self._lock = threading.Lock()
+        self._known: dict[Path, tuple[list[int], PythonInfo]] = {}
+
+    def get(self, executable: Path) -> PythonInfo | None:
+        """:returns: the information stored for the interpreter, ``None`` if unknown or the binary changed since"""
+        path = executable.resolve()
+        if (current := signature(path)) is None:
+            return None
+        with self._lock:
+            if (known := self._known.get(path)) is not None and known[0] == current:
+                return known[1]
+        if self.root is None:
+            return None
+        try:
+            entry = json.loads(self._entry(path).read_text(encoding="utf-8"))
+            if entry["path"] != str(path) or entry["signature"] != current:
+                return None
+            info = load_info(entry["info"])
+        except (OSError, ValueError, KeyError, TypeError):  # missing, being replaced or from another tox version
+            return None
+        with self._lock:
+            self._known[path] = current, info
+        return info
+
+    def put(self, executable: Path, info: PythonInfo) -> None:
+        """Store the information of an interpreter.
+
+        :param executable: the interpreter
+        :param info: what the interpreter told about itself
+        """
+        path = executable.resolve()
+        if (current := signature(path)) is None:
+            return
+        with self._lock:
+            self._known[path] = current, info
+        if self.root is None:
+            return
+        entry = self._entry(path)
+        temp = entry.with_name(f".{entry.name}-{uuid.uuid4().hex}")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            temp.write_text(json.dumps({"path": str(path), "signature": current, "info": dump_info(info)}))
+            temp.replace(entry)  # readers see either the old or the new entry
+        except OSError as exception:
+            LOGGER.debug("could not store interpreter information of %s: %r", path, exception)
+            temp.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Forget all interpreters."""
+        with self._lock:
+            self._known.clear()
+        if self.root is not None:
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    def _entry(self, path: Path) -> Path:
+        assert self.root is not None  # ruff:ignore[assert]
+        return self.root / f"{sha256(str(path).encode()).hexdigest()[:32]}.json"
+
+
+@cache
+def interpreter_cache() -> InterpreterCache:
+    """:returns: the interpreter cache, persisted within the virtualenv application data folder when writable"""
+    # honor the folder virtualenv itself uses when invoked via its command line
+    folder = app_data.make_app_data(os.environ.get("VIRTUALENV_APP_DATA"), read_only=False, env=os.environ)
+    lock = getattr(folder, "lock", None)
+    return InterpreterCache(None if lock is None else Path(lock.path) / "tox-py-info")
+
+
+def signature(path: Path) -> list[int] | None:
+    """:returns: changes when the file is replaced or modified, ``None`` when it is missing"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+def dump_info(info: PythonInfo) -> dict[str, Any]:
+    """:returns: the interpreter information as JSON dump-able value"""
+    result = asdict(info)
+    result["extra"] = {"executable": str(info.extra["executable"])}
+    return result
+
+
+def load_info(value: dict[str, Any]) -> PythonInfo:
+    """:returns: the interpreter information from the value :func:`dump_info` returned"""
+    value = dict(value)
+    value["version_info"] = VersionInfo(*value["version_info"])
+    value["extra"] = {"executable": Path(value["extra"]["executable"])}
+    return PythonInfo(**value)
+
+
+__all__ = (
+    "InterpreterCache",
+    "dump_info",
+    "interpreter_cache",
+    "load_info",
+    "signature",
+)
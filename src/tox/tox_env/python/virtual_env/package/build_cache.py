@@ -0,0 +1,155 @@
+"""Keep built packages by a digest of what built them, so later and concurrent tox runs install them instead."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import uuid
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, Any
+
+from filelock import FileLock, Timeout
+
+from tox.util.path import project_files
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+_META = "meta.json"
+#: how many built packages the cache keeps, the least recently used ones are removed beyond
+MAX_ENTRIES = 16
+
+
+class BuildCache:
+    """Built packages (sdists, wheels), each in a folder named by the digest of its build inputs."""
+
+    def __init__(self, root: Path) -> None:
+        """:param root: the folder holding the packages"""
+        self.root = root
+
+    @staticmethod
+    def digest(key: dict[str, Any]) -> str:
+        """:returns: the identifier of the package built from these inputs"""
+        return hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+    @contextmanager
+    def exclusive(self, digest: str) -> Iterator[None]:
+        """Hold the right to build a package, waiting while another tox process builds the same."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.root / f"{digest}.lock"):
+            yield
+
+    def load(self, digest: str) -> tuple[Path, dict[str, Any]] | None:
+        """Look up a package.
+
+        :param digest: the identifier of the package
+
+        :returns: the package file and what was stored with it, ``None`` if not held
+        """
+        meta_file = self.root / digest / _META
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            package = self.root / digest / meta["file"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not package.is_file():
+            return None
+        meta_file.touch()  # mark as recently used
+        return package, meta
+
+    def store(self, digest: str, package: Path, meta: dict[str, Any]) -> str:
+        """Keep a copy of a package.
+
+        :param digest: the identifier of the package
+        :param package: the package file
+        :param meta: what to keep with it, returned by :meth:`load`
+
+        :returns: the sha256 digest of the package
+        """
+        sha256 = hashlib.sha256(package.read_bytes()).hexdigest()
+        temp = self.root / f".{digest}-{uuid.uuid4().hex}"
+        temp.mkdir(parents=True)
+        try:
+            shutil.copyfile(package, temp / package.name)
+            meta = {**meta, "file": package.name, "sha256": sha256}
+            (temp / _META).write_text(json.dumps(meta, indent=2, sort_keys=True), encoding="utf-8")
+            shutil.rmtree(self.root / digest, ignore_errors=True)  # held under the lock, a stale or partial one
+            temp.replace(self.root / digest)
+        except OSError as exception:
+            LOGGER.debug("could not keep package %s: %r", package, exception)
+            shutil.rmtree(temp, ignore_errors=True)
+            return sha256
+        self._evict()
+        return sha256
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, Path]] = []
+        for folder in self.root.iterdir():
+            with suppress(OSError):
+                if not folder.name.startswith(".") and folder.is_dir():
+                    entries.append(((folder / _META).stat().st_mtime, folder))
+        for _, folder in sorted(entries, reverse=True)[MAX_ENTRIES:]:
+            self._remove(folder.name)
+        for lock in self.root.glob("*.lock"):  # of builds that kept nothing, or of packages evicted by others
+            if not (self.root / lock.stem).exists():
+                self._remove(lock.stem)
+
+    def _remove(self, digest: str) -> None:
+        lock = self.root / f"{digest}.lock"
+        try:
+            with FileLock(lock, timeout=0):
+                if (folder := self.root / digest).exists():
+                    LOGGER.debug("evict built package %s", digest)
+                    shutil.rmtree(folder, ignore_errors=True)
+                _unlink_held(lock)
+        except Timeout:  # another tox process is using it right now
+            return
+
+
+def _unlink_held(lock: Path) -> None:
+    # while held: whoever waits on it then finds it gone, and locks the file taking its place
+    with suppress(OSError):  # Windows removes it on release
+        lock.unlink()
+
+
+def source_digest(root: Path, exclude: Iterable[Path]) -> str:
+    """Digest the source tree of a project.
+
+    :param root: the project folder
+    :param exclude: folders within the project left out (such as the tox work folder)
+
+    :returns: the digest of the paths and content of its files, and the git revision describing it (versions derived
+        from version control change with it)
+    """
+    excluded = tuple(exclude)
+    digest = hashlib.sha256()
+    for path in sorted(project_files(root)):
+        if any(path.is_relative_to(folder) for folder in excluded):
+            continue
+        try:
+            content = path.read_bytes()
+        except OSError:  # a folder, a dangling link or removed meanwhile
+            continue
+        digest.update(f"{path.relative_to(root).as_posix()}\0{len(content)}\0".encode())
+        digest.update(content)
+    cmd = ["git", "describe", "--tags", "--long", "--always"]
+    try:
+        described = subprocess.run(cmd, cwd=root, env=dict(os.environ), capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):  # not a git checkout
+        described = b""
+    digest.update(b"\0" + described)
+    return digest.hexdigest()
+
+
+__all__ = (
+    "MAX_ENTRIES",
+    "BuildCache",
+    "source_digest",
+)
@@ -9,7 +9,7 @@ from collections import defaultdict
 from contextlib import contextmanager
 from itertools import chain
 from pathlib import Path
-from threading import RLock
+from threading import Lock, RLock
 from typing import TYPE_CHECKING, Any, Literal, NoReturn, cast
 
 from cachetools import cached
@@ -30,12 +30,14 @@ from tox.tox_env.python.package import (
     EditableLegacyPackage,
     EditablePackage,
     PythonPackageToxEnv,
+    PythonPathPackageWithDeps,
     SdistPackage,
     WheelPackage,
 )
 from tox.tox_env.python.virtual_env.api import VirtualEnv
 from tox.util.file_view import create_session_view
 
+from .build_cache import BuildCache, source_digest
 from .util import dependencies_with_extras, dependencies_with_extras_from_markers, safe_extractall
 
 if TYPE_CHECKING:
@@ -56,6 +58,8 @@ else:  # pragma: <3.11 cover
     import tomli as tomllib
 
 ConfigSettings = dict[str, Any] | None
+#: environment variables that change between runs without changing what the build produces
+_VOLATILE = frozenset({"PYTHONHASHSEED", "COLUMNS", "LINES", "MAKEFLAGS"})
 
 
 class ToxBackendFailed(Fail, BackendFailed):
@@ -112,6 +116,8 @@ class Pep517VenvPackager(PythonPackageToxEnv, ABC):
         self._pkg_lock = RLock()  # can build only one package at a time
         self._package_paths: set[Path] = set()
         self._root: Path | None = None
+        self._source_digests: dict[Path, str] = {}  # reading the source tree once, not once per run environment
+        self._source_digest_lock = Lock()
 
     @property
     def root(self) -> Path:
@@ -166,6 +172,18 @@ class Pep517VenvPackager(PythonPackageToxEnv, ABC):
         )
         for key in ("sdist", "wheel", "editable"):
             self._add_config_settings(key)
+        self.conf.add_config(
+            keys=["package_cache"],
+            of_type=bool,
+            default=False,
+            desc="reuse the package built earlier from the same sources, build requirements, settings and interpreter",
+        )
+        self.core.add_config(
+            keys=["package_cache_dir"],
+            of_type=Path,
+            default=lambda conf, name: cast("Path", conf.core["work_dir"]) / ".package-cache",  # ruff:ignore[unused-lambda-argument]
+            desc="the folder keeping the packages built with package_cache enabled, shared between tox processes",
+        )
         self.conf.add_config(
             keys=["fresh_subprocess"],
             of_type=bool,
@@ -261,7 +279,87 @@ class Pep517VenvPackager(PythonPackageToxEnv, ABC):
         super()._teardown()
 
     def perform_packaging(self, for_env: EnvConfigSet) -> list[Package]:
-        """Build the package to install."""
+        """Build the package to install, or take it from the package cache when built from the same inputs before."""
+        if (digest := self._package_cache_digest(for_env)) is None:
+            return self._build_package(for_env)
+        cache = BuildCache(self.core["package_cache_dir"])
+        with self._pkg_lock, cache.exclusive(digest):
+            recreate: bool = self.conf["recreate"]  # builds again, e.g. to pick up newer build requirements
+            if not recreate and (package := self._cached_package(cache, digest, for_env)) is not None:
+                return [package]
+            packages = self._build_package(for_env)
+            self._keep_package(cache, digest, packages)
+            return packages
+
+    def _package_cache_digest(self, for_env: EnvConfigSet) -> str | None:
+        of_type: str = for_env["package"]
+        if not self.conf["package_cache"] or of_type not in {"sdist", "wheel", "editable"}:
+            return None
+        if of_type != "sdist" and self._wheel_build_envs.get(for_env["wheel_build_env"]) not in {None, self}:
+            return None  # the wheel build environment builds it, and looks up its own cache
+        cache_dir: Path = self.core["package_cache_dir"]
+        key = {
+            "type": of_type,
+            "source": self._source_digest(cache_dir),
+            "backend": self._frontend.backend_args,
+            "requires": [str(req) for req in self.requires()],
+            "config_settings": {
+                k: self.conf[k] for k in self.conf if k.startswith("config_settings_") and k.endswith(f"_{of_type}")
+            },
+            "python": self._get_env_journal_python(),
+            "env": {k: v for k, v in self.environment_variables.items() if k not in _VOLATILE},
+            "root": str(self.root) if of_type == "editable" else None,  # editable wheels point to the source tree
+        }
+        return BuildCache.digest(key)
+
+    def _source_digest(self, cache_dir: Path) -> str:
+        with self._source_digest_lock:
+            if (digest := self._source_digests.get(self.root)) is None:
+                digest = source_digest(self.root, [self.core["work_dir"], cache_dir])
+                self._source_digests[self.root] = digest
+            return digest
+
+    def reset(self) -> None:
+        super().reset()
+        with self._source_digest_lock:
+            self._source_digests.clear()  # the sources may have changed since
+
+    def _cached_package(self, cache: BuildCache, digest: str, for_env: EnvConfigSet) -> Package | None:
+        if (found := cache.load(digest)) is None:
+            return None
+        path, meta = found
+        if (deps := self._load_deps_from_static(for_env)) is None:
+            if not (metadata := meta.get("metadata")):
+                return None  # built when the dependencies were known without reading the metadata
+            reqs, extras = [Requirement(req) for req in metadata["requires"]], set(metadata["extras"])
+            deps = dependencies_with_extras(reqs, for_env["extras"], metadata["name"], available_extras=extras)
+        logging.warning("reuse %s built from the same inputs", path.name)
+        session_path = create_session_view(path, self._package_temp_path)
+        self._package_paths.add(session_path)
+        of_type: str = for_env["package"]
+        package: PythonPathPackageWithDeps
+        if of_type == "sdist":
+            package = SdistPackage(session_path, deps, config_settings=self.conf["config_settings_build_wheel"])
+        else:
+            package = (EditablePackage if of_type == "editable" else WheelPackage)(session_path, deps)
+        package.sha256 = meta["sha256"]
+        return package
+
+    def _keep_package(self, cache: BuildCache, digest: str, packages: list[Package]) -> None:
+        package = packages[0]
+        if type(package) not in {SdistPackage, WheelPackage, EditablePackage}:  # fell back to editable-legacy
+            return
+        package = cast("PythonPathPackageWithDeps", package)
+        meta: dict[str, Any] = {}
+        if (dist := self._distribution_meta) is not None:
+            meta["metadata"] = {
+                "name": dist.metadata["Name"],
+                "requires": dist.requires or [],
+                "extras": dist.metadata.get_all("Provides-Extra") or [],
+            }
+        package.sha256 = cache.store(digest, package.path, meta)
+
+    def _build_package(self, for_env: EnvConfigSet) -> list[Package]:
         try:
             deps = self._load_deps(for_env)
         except BuildEditableNotSupportedError:
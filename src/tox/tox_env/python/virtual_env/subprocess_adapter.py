@@ -5,16 +5,23 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
+import shutil
 import subprocess
 import sys
+import time
 import venv
+from contextlib import suppress
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from filelock import FileLock
+from filelock import FileLock, Timeout
+
+from tox.tox_env.python.virtual_env.interpreter_cache import signature
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from tox.tox_env.python.api import PythonInfo
 
 
 _PROBE_SCRIPT = """\
@@ -32,6 +39,12 @@ print(json.dumps({
 }))
 """
 
+_BOOTSTRAP_MARKER = "tox-bootstrap.json"
+#: the number of bootstrap venvs kept, the least recently used ones beyond are evicted
+_BOOTSTRAP_KEEP = 8
+# seconds a bootstrap venv is protected from eviction after its last use, tox processes may still run it
+_BOOTSTRAP_IN_USE = 24 * 60 * 60
+
 
 @dataclass
 class _VersionInfo:
@@ -56,6 +69,22 @@ class SubprocessPythonInfo:
     debug_build: bool = False
     sysconfig_platform: str | None = None
 
+    @classmethod
+    def from_python_info(cls, info: PythonInfo) -> SubprocessPythonInfo:
+        """Describe an interpreter tox already knows, without probing it again."""
+        vi = info.version_info
+        return cls(
+            implementation=info.implementation,
+            version_info=_VersionInfo(vi.major, vi.minor, vi.micro, vi.releaselevel, vi.serial),
+            version=info.version.split()[0],
+            architecture=64 if info.is_64 else 32,
+            platform=info.platform,
+            system_executable=str(info.extra["executable"]),
+            free_threaded=info.free_threaded,
+            debug_build=info.debug,
+            sysconfig_platform=f"{info.platform}-{info.machine}" if info.machine else None,  # only the machine is used
+        )
+
     @property
     def machine(self) -> str:
         """Derive instruction set architecture from sysconfig_platform."""
@@ -159,9 +188,10 @@ def probe_python(python_path: str) -> SubprocessPythonInfo | None:
     )
 
 
-def _bootstrap_path(work_dir: Path, virtualenv_spec: str) -> Path:
-    digest = hashlib.sha256(virtualenv_spec.encode()).hexdigest()[:16]
-    return work_dir / ".virtualenv-bootstrap" / digest
+def _bootstrap_path(root: Path, virtualenv_spec: str) -> Path:
+    # the bootstrap venv is created by the interpreter running tox
+    key = json.dumps([virtualenv_spec, str(Path(sys.executable).resolve()), sys.version])
+    return root / hashlib.sha256(key.encode()).hexdigest()[:16]
 
 
 def _bin_dir(base: Path) -> Path:
@@ -198,27 +228,74 @@ def _has_correct_virtualenv(python: Path, virtualenv_spec: str) -> bool:
         return False
 
 
-def ensure_bootstrap(work_dir: Path, virtualenv_spec: str) -> Path:
-    """Create or reuse a cached bootstrap venv with the specified virtualenv version."""
-    base = _bootstrap_path(work_dir, virtualenv_spec)
+def ensure_bootstrap(root: Path, virtualenv_spec: str) -> Path:
+    """Create or reuse a bootstrap venv with the specified virtualenv version.
+
+    The bootstrap venvs are keyed by the virtualenv spec and the interpreter running tox, so all projects and tox
+    processes using the same folder share them. Beyond :data:`_BOOTSTRAP_KEEP` the least recently used ones are evicted.
+
+    :param root: the folder holding the bootstrap venvs
+    :param virtualenv_spec: the virtualenv requirement to install
+
+    :returns: the interpreter of the bootstrap venv
+    """
+    base = _bootstrap_path(root, virtualenv_spec)
     python = _bootstrap_python(base)
-    if _has_correct_virtualenv(python, virtualenv_spec):
+    if _bootstrap_intact(base, virtualenv_spec):
+        (base / _BOOTSTRAP_MARKER).touch()  # mark as recently used
         return python
-
-    lock_path = base.parent / f"{base.name}.lock"
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
-    with FileLock(lock_path):
-        if _has_correct_virtualenv(python, virtualenv_spec):
+    root.mkdir(parents=True, exist_ok=True)
+    with FileLock(root / f"{base.name}.lock"):
+        if _bootstrap_intact(base, virtualenv_spec):
             return python
         logging.info("bootstrapping %s into %s", virtualenv_spec, base)
         if base.exists():
-            import shutil  # ruff:ignore[import-outside-top-level]
-
             shutil.rmtree(base)
         venv.create(str(base), with_pip=True, clear=True)
         pip = _bootstrap_pip(base)
-        result = subprocess.run([str(pip), "install", virtualenv_spec], capture_output=True, text=True, check=False)
+        cmd = [str(pip), "install", virtualenv_spec]
+        # the index settings of the invocation, as the tox daemon serves it with a replaced os.environ
+        result = subprocess.run(cmd, env=dict(os.environ), capture_output=True, text=True, check=False)
         if result.returncode != 0:
             msg = f"failed to install {virtualenv_spec} into bootstrap env: {result.stderr}"
             raise RuntimeError(msg)
-        return python
+        if not _has_correct_virtualenv(python, virtualenv_spec):
+            msg = f"the virtualenv installed into bootstrap env {base} does not satisfy {virtualenv_spec}"
+            raise RuntimeError(msg)
+        marker = {"spec": virtualenv_spec, "files": _bootstrap_files(base)}
+        (base / _BOOTSTRAP_MARKER).write_text(json.dumps(marker), encoding="utf-8")
+    _evict_bootstraps(root, keep=base.name)
+    return python
+
+
+def _bootstrap_intact(base: Path, virtualenv_spec: str) -> bool:
+    try:
+        marker = json.loads((base / _BOOTSTRAP_MARKER).read_text(encoding="utf-8"))
+    except (OSError, ValueError):  # never completed, or being evicted
+        return False
+    return marker.get("spec") == virtualenv_spec and marker.get("files") == _bootstrap_files(base)
+
+
+def _bootstrap_files(base: Path) -> dict[str, list[int] | None]:
+    # the interpreter and the installed virtualenv, a bootstrap venv is broken once either changed
+    packages = (*base.glob("lib/python*/site-packages/virtualenv"), *base.glob("Lib/site-packages/virtualenv"))
+    files = [_bootstrap_python(base).resolve(), *(package / "__init__.py" for package in packages)]
+    return {str(path): signature(path) for path in files}
+
+
+def _evict_bootstraps(root: Path, keep: str) -> None:
+    markers: list[tuple[float, Path]] = []
+    for base in root.iterdir():
+        with suppress(OSError):  # not a bootstrap venv, or one being evicted
+            markers.append(((base / _BOOTSTRAP_MARKER).stat().st_mtime, base))
+    cutoff = time.time() - _BOOTSTRAP_IN_USE
+    for used, base in sorted(markers, reverse=True)[_BOOTSTRAP_KEEP:]:
+        if base.name == keep or used > cutoff:  # may still run virtualenv for another tox process
+            continue
+        try:
+            with FileLock(root / f"{base.name}.lock", timeout=0):
+                (base / _BOOTSTRAP_MARKER).unlink(missing_ok=True)
+                shutil.rmtree(base, ignore_errors=True)
+        except Timeout:  # being rebuilt
+            continue
+        logging.info("evicted bootstrap env %s", base)
@@ -0,0 +1,124 @@
+"""Create virtual environments by cloning a template shared by environments with the same interpreter and settings."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import shutil
+import sys
+import time
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from filelock import FileLock, Timeout
+
+from tox.util.path import clone_file, referring_files
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+#: the folder within the tox working directory holding the templates
+TEMPLATES_DIR = ".venv-templates"
+#: templates not cloned for this many days are removed
+UNUSED_DAYS = 14
+# paths virtualenv writes verbatim, without any quoting, into the activation scripts and the script shebangs
+_VERBATIM = re.compile(r"[\w@%+=:,./-]+")
+
+
+def template_path(work_dir: Path, key: dict[str, Any]) -> Path:
+    """:returns: where the template for this key lives"""
+    digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+    return work_dir / TEMPLATES_DIR / digest
+
+
+def can_clone(*paths: Path) -> bool:
+    """:returns: if a clone can be fixed up by replacing these paths within its files"""
+    return sys.platform != "win32" and all(_VERBATIM.fullmatch(str(path)) for path in paths)
+
+
+def ensure_template(path: Path, key: dict[str, Any], build: Callable[[Path], None]) -> list[str] | None:
+    """Build the template unless already built, safe to call from concurrent tox processes.
+
+    Building a template prunes the templates no tox used within :data:`UNUSED_DAYS`.
+
+    :param path: where the template lives
+    :param key: what the template was built from, stored next to it
+    :param build: creates the virtual environment at the given path
+
+    :returns: the text files of the template referring to its location, ``None`` when it cannot be cloned
+    """
+    marker = path.with_suffix(".json")
+    if (known := _load(marker, path)) is not None:
+        return known
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with FileLock(path.with_suffix(".lock")):
+        if (known := _load(marker, path)) is not None:
+            return known
+        LOGGER.info("create virtual environment template %s", path)
+        marker.unlink(missing_ok=True)
+        if path.exists():  # a build that did not complete
+            shutil.rmtree(path)
+        build(path)
+        referring = referring_files(path, path)
+        marker.write_text(json.dumps({"key": key, "referring": referring}, indent=2), encoding="utf-8")
+    _prune(path.parent)
+    return referring
+
+
+def clone(template: Path, env_dir: Path, referring: Iterable[str]) -> None:
+    """Create a virtual environment as a copy of the template.
+
+    Files are copied rather than hard linked, as later installs may write into files shared with the template. Where the
+    file system supports it, the copies share their content with the template until written to.
+
+    :param template: the template to clone
+    :param env_dir: the virtual environment to create
+    :param referring: the text files of the template referring to its location, as :func:`ensure_template` returned
+    """
+    shutil.copytree(template, env_dir, symlinks=True, copy_function=clone_file, dirs_exist_ok=True)
+    replace = (
+        (str(template).encode(), str(env_dir).encode()),
+        (f"''{template.name}''".encode(), f"''{env_dir.name}''".encode()),  # the prompt of the csh activation script
+    )
+    for relative in referring:
+        path = env_dir / relative
+        content = path.read_bytes()
+        for old, new in replace:
+            content = content.replace(old, new)
+        path.write_bytes(content)
+
+
+def _load(marker: Path, path: Path) -> list[str] | None:
+    try:
+        referring = json.loads(marker.read_text(encoding="utf-8"))["referring"]
+    except (OSError, ValueError, KeyError, TypeError):  # not built yet, or by an earlier tox
+        return None
+    if not path.exists():
+        return None
+    marker.touch()  # mark as recently used
+    return referring
+
+
+def _prune(root: Path) -> None:
+    unused_since = time.time() - UNUSED_DAYS * 24 * 3600
+    for marker in root.glob("*.json"):
+        with suppress(OSError, Timeout), FileLock(marker.with_suffix(".lock"), timeout=0):
+            if marker.stat().st_mtime < unused_since:
+                LOGGER.info("remove unused virtual environment template %s", marker.with_suffix(""))
+                marker.unlink()
+                shutil.rmtree(marker.with_suffix(""), ignore_errors=True)
+
+
+__all__ = (
+    "TEMPLATES_DIR",
+    "UNUSED_DAYS",
+    "can_clone",
+    "clone",
+    "ensure_template",
+    "template_path",
+)
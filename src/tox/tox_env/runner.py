@@ -115,6 +115,33 @@ class RunToxEnv(ToxEnv, ABC):
             default=False,
             desc="if set to true, tox will stop executing remaining environments when this environment fails",
         )
+        self.conf.add_config(
+            keys=["parallel_weight"],
+            of_type=int,
+            default=1,
+            desc="number of parallel slots (out of --parallel) this environment occupies while running",
+        )
+        self.conf.add_config(
+            keys=["resources"],
+            of_type=list[str],
+            default=[],
+            desc="named resources this environment holds while running, see resource_capacity for how many may share",
+        )
+        self.conf.add_config(
+            keys=["cache_inputs"],
+            of_type=list[str],
+            default=[],
+            desc="glob patterns (relative to the tox root) of the files the commands read, with --cached a run is "
+            "skipped while these, the configuration, the installed packages and the environment variables are "
+            "unchanged",
+        )
+        self.conf.add_config(
+            keys=["watch_paths"],
+            of_type=list[str],
+            default=[],
+            desc="glob patterns (relative to the tox root) of files outside the change_dir whose changes make tox "
+            "watch run the environment again",
+        )
 
     def _teardown(self) -> None:
         super()._teardown()
@@ -124,6 +151,11 @@ class RunToxEnv(ToxEnv, ABC):
         super().interrupt()
         self._call_pkg_envs("interrupt")
 
+    def reset(self) -> None:
+        super().reset()
+        for package_env in self.package_envs:
+            package_env.reset()
+
     def get_package_env_types(self) -> tuple[str, str] | None:
         if not self._register_package_conf():
             return None
@@ -176,15 +208,15 @@ class RunToxEnv(ToxEnv, ABC):
         chdir: Path = self.conf["change_dir"]
         chdir.mkdir(exist_ok=True, parents=True)
         env_dir = self.env_dir
-        old_paths = self._paths_private
-        self._paths_private = [p for p in (env_dir / "bin", env_dir / "Scripts") if p.exists()]
+        old_paths = self._paths  # the setter drops environment variables already built with the paths
+        self._paths = [p for p in (env_dir / "bin", env_dir / "Scripts") if p.exists()]
         try:
             outcomes: list[Outcome] = []
             exit_code = run_command_set(self, "recreate_commands", chdir, ignore_errors=True, outcomes=outcomes)
             if exit_code != Outcome.OK:
                 logging.warning("recreate_commands failed with exit code %d, continuing with recreation", exit_code)
         finally:
-            self._paths_private = old_paths
+            self._paths = old_paths
 
     @property
     def _default_package_env(self) -> str:
@@ -236,6 +268,11 @@ class RunToxEnv(ToxEnv, ABC):
             self._install(self._packages, RunToxEnv.__name__, "package")
         self._handle_journal_package(self.journal, self._packages)
 
+    @property
+    def packages(self) -> list[Package]:
+        """:returns: the packages installed into this environment by the setup"""
+        return self._packages
+
     @staticmethod
     def _handle_journal_package(journal: EnvJournal, packages: list[Package]) -> None:
         if not journal:
@@ -247,7 +284,7 @@ class RunToxEnv(ToxEnv, ABC):
                 of_type = "file" if pkg.is_file() else ("dir" if pkg.is_dir() else "N/A")
                 meta = {"basename": pkg.name, "type": of_type}
                 if of_type == "file":
-                    meta["sha256"] = sha256(pkg.read_bytes()).hexdigest()
+                    meta["sha256"] = package.sha256 or sha256(pkg.read_bytes()).hexdigest()
             else:
                 raise NotImplementedError
             installed_meta.append(meta)
@@ -3,6 +3,12 @@
 from __future__ import annotations
 
 import multiprocessing
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+PRESSURE_ROOT = Path("/proc/pressure")
 
 
 def auto_detect_cpus() -> int:
@@ -13,4 +19,100 @@ def auto_detect_cpus() -> int:
     return n or 1
 
 
-__all__ = ("auto_detect_cpus",)
+def usable_cpus() -> int:
+    """:returns: the CPUs this process may use, honoring the CPU affinity mask and the cgroup v2 CPU quota"""
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on Windows and macOS
+        count = auto_detect_cpus()
+    if (limit := cgroup_cpu_limit()) is not None:
+        count = min(count, int(limit))  # rounding up would get the whole run throttled by the quota
+    return max(1, count)
+
+
+def cgroup_cpu_limit() -> float | None:
+    """:returns: the CPUs the tightest cgroup v2 ``cpu.max`` quota along our hierarchy allows, ``None`` if unlimited"""
+    folder, limit = _cgroup_dir(), None
+    while folder is not None:
+        try:
+            quota, period = (folder / "cpu.max").read_text(encoding="utf-8").split()
+            if quota != "max" and int(period) > 0:
+                value = int(quota) / int(period)
+                limit = value if limit is None else min(limit, value)
+        except (OSError, ValueError):
+            pass
+        folder = folder.parent if folder != CGROUP_ROOT and folder.is_relative_to(CGROUP_ROOT) else None
+    return limit
+
+
+def _cgroup_dir() -> Path | None:
+    try:
+        lines = Path("/proc/self/cgroup").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    for line in lines:
+        if line.startswith("0::"):  # the unified (v2) hierarchy
+            return CGROUP_ROOT / line[3:].lstrip("/")
+    return None
+
+
+@dataclass(frozen=True)
+class Load:
+    """A snapshot of how busy the machine is, fields are ``None`` when the platform does not report them."""
+
+    cpus: int  #: CPUs this process may use
+    load_average: float | None  #: one minute load average per CPU of the host
+    cpu_pressure: float | None  #: share of the last ten seconds some tasks waited for a CPU, in percent
+    memory_pressure: float | None  #: share of the last ten seconds some tasks stalled on memory, in percent
+
+
+def read_load() -> Load:
+    """:returns: the current load of the machine"""
+    try:
+        load_average: float | None = os.getloadavg()[0] / auto_detect_cpus()
+    except (AttributeError, OSError):  # not available on Windows
+        load_average = None
+    return Load(
+        cpus=usable_cpus(),
+        load_average=load_average,
+        cpu_pressure=pressure("cpu"),
+        memory_pressure=pressure("memory"),
+    )
+
+
+def pressure(resource: str) -> float | None:
+    """Read the pressure stall information of a resource, preferring the one of our cgroup over the system wide one.
+
+    :param resource: ``cpu``, ``memory`` or ``io``
+
+    :returns: the share of the last ten seconds in which some tasks stalled on the resource, in percent, ``None`` if
+      the kernel does not report it
+
+    """
+    candidates = [PRESSURE_ROOT / resource]
+    if (folder := _cgroup_dir()) is not None:
+        candidates.insert(0, folder / f"{resource}.pressure")
+    for path in candidates:
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            kind, *fields = line.split()
+            if kind == "some":
+                values = dict(field.split("=", 1) for field in fields)
+                try:
+                    return float(values["avg10"])
+                except (KeyError, ValueError):
+                    return None
+    return None
+
+
+__all__ = (
+    "Load",
+    "auto_detect_cpus",
+    "cgroup_cpu_limit",
+    "pressure",
+    "read_load",
+    "usable_cpus",
+)
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from collections import OrderedDict, defaultdict
+from heapq import heappop, heappush
 
 
-def stable_topological_sort(graph: dict[str, set[str]]) -> list[str]:  # ruff:ignore[complex-structure]
+def stable_topological_sort(graph: dict[str, set[str]]) -> list[str]:
     to_order = set(graph.keys())  # keep a log of what  we need to order
 
     # normalize graph - fill missing nodes (assume no dependency)
@@ -20,25 +21,20 @@ def stable_topological_sort(graph: dict[str, set[str]]) -> list[str]:  # ruff:ig
             inverse_graph[depend].add(key)
 
     topology = []
+    nodes = list(graph)
     degree = {k: len(v) for k, v in graph.items()}
-    ready_to_visit = {n for n, d in degree.items() if not d}
-    need_to_visit = OrderedDict((i, None) for i in graph)
-    while need_to_visit:
-        # to keep stable, pick the first node ready to visit in the original order
-        for node in need_to_visit:
-            if node in ready_to_visit:
-                break
-        else:
-            break
-        del need_to_visit[node]
-
+    # to keep stable, always visit the ready node that comes first in the original order: a heap of positions
+    ready_to_visit = [at for at, node in enumerate(nodes) if not degree[node]]
+    position = {node: at for at, node in enumerate(nodes)}
+    while ready_to_visit:
+        node = nodes[heappop(ready_to_visit)]
         topology.append(node)
 
         # decrease degree for nodes we're going too
         for to_node in inverse_graph[node]:
             degree[to_node] -= 1
             if not degree[to_node]:  # if a node has no more incoming node it's ready to visit
-                ready_to_visit.add(to_node)
+                heappush(ready_to_visit, position[to_node])
 
     result = [n for n in topology if n in to_order]  # filter out missing nodes we extended
 
@@ -69,3 +65,72 @@ def identify_cycle(graph: dict[str, set[str]]) -> None:
         if result is not None:
             msg = f"{' | '.join(result.keys())}"
             raise ValueError(msg)
+
+
+def critical_path(graph: dict[str, set[str]], order: list[str], weight: dict[str, float]) -> dict[str, float]:
+    """Calculate the length of the longest chain of work each node unlocks, including itself.
+
+    :param graph: node to the set of nodes it depends on
+    :param order: the nodes in topological order (dependencies first)
+    :param weight: the cost of each node, missing nodes cost nothing
+
+    :returns: node to the total weight of the heaviest path starting at it
+
+    """
+    length: dict[str, float] = {}
+    dependants: dict[str, list[str]] = defaultdict(list)
+    for key, depends in graph.items():
+        for depend in depends:
+            dependants[depend].append(key)
+    for node in reversed(order):  # dependants come later in the order, so they are already calculated
+        length[node] = weight.get(node, 0.0) + max((length.get(i, 0.0) for i in dependants[node]), default=0.0)
+    return length
+
+
+class ReadySet:
+    """Hand out the nodes of a dependency graph once every node they depend on completed.
+
+    Nodes are handed out in the order given, and completing a node costs only the number of its dependants, so draining
+    the graph is linear in its size rather than rescanning what is left after every completion.
+    """
+
+    def __init__(self, graph: dict[str, set[str]], order: list[str]) -> None:
+        self._nodes = order  # in topological order, dependencies first
+        position = {node: at for at, node in enumerate(order)}
+        self._position = position
+        self._dependants: dict[str, list[str]] = defaultdict(list)
+        self._waiting_on: dict[str, int] = {}
+        for node in order:
+            depends = [i for i in graph.get(node, ()) if i in position]  # nodes outside the order never complete
+            self._waiting_on[node] = len(depends)
+            for depend in depends:
+                self._dependants[depend].append(node)
+        self._ready = [at for at, node in enumerate(order) if not self._waiting_on[node]]
+        self._completed: set[str] = set()
+        self._handed_out = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(nodes={len(self._nodes)}, handed_out={self._handed_out})"
+
+    def __bool__(self) -> bool:
+        """:returns: whether there are nodes not handed out yet"""
+        return self._handed_out < len(self._nodes)
+
+    def complete(self, node: str) -> None:
+        """Mark a node as completed, releasing the nodes that waited only on it.
+
+        :param node: the node completed
+        """
+        if node in self._completed or node not in self._position:
+            return
+        self._completed.add(node)
+        for dependant in self._dependants[node]:
+            self._waiting_on[dependant] -= 1
+            if not self._waiting_on[dependant]:
+                heappush(self._ready, self._position[dependant])
+
+    def pop(self) -> list[str]:
+        """:returns: the nodes that became ready since the last call, in the original order"""
+        ready = [self._nodes[heappop(self._ready)] for _ in range(len(self._ready))]
+        self._handed_out += len(ready)
+        return ready
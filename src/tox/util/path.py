@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from shutil import rmtree
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from pathlib import Path
+import os
+import subprocess
+import sys
+from pathlib import Path
+from shutil import copy2, copystat, rmtree
 
 _CACHEDIR_TAG = """\
 Signature: 8a477f597d28d172789f06886806bc55
@@ -12,6 +12,7 @@ Signature: 8a477f597d28d172789f06886806bc55
 # For information about cache directory tags, see:
 #	https://bford.info/cachedir/spec.html
 """
+_FICLONE = 0x40049409  # from linux/fs.h, share the extents of a file on copy on write file systems
 
 
 def ensure_cachedir_tag(work_dir: Path) -> None:
@@ -53,8 +54,85 @@ def ensure_gitignore(path: Path) -> None:
         gitignore.write_text("*\n", encoding="utf-8")
 
 
+def clone_file(src: str, dst: str) -> None:
+    """Copy a file with its metadata, sharing its content with the source until written to where supported.
+
+    Usable as the ``copy_function`` of :func:`shutil.copytree`.
+
+    :param src: the file to copy
+    :param dst: where to copy it
+    """
+    if sys.platform == "linux":
+        import fcntl  # ruff:ignore[import-outside-top-level]
+
+        with Path(src).open("rb") as source, Path(dst).open("wb") as target:
+            try:
+                fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+            except OSError:  # the file system cannot share content between files
+                pass
+            else:
+                copystat(src, dst)
+                return
+    copy2(src, dst)
+
+
+def referring_files(root: Path, path: Path) -> list[str] | None:
+    """Find the files within a folder referring to a path, such as a virtual environment referring to its own location.
+
+    Bytecode referring to the path is removed, the interpreter compiles it again.
+
+    :param root: the folder
+    :param path: the path looked for
+
+    :returns: the text files referring to the path, relative to the folder; ``None`` when binary files other than
+        bytecode do, replacing the path within those is not possible
+    """
+    needle, result = str(path).encode(), []
+    for file in sorted(root.rglob("*")):
+        if file.is_symlink() or not file.is_file() or needle not in (content := file.read_bytes()):
+            continue
+        if file.suffix == ".pyc":  # holds the path of its source
+            file.unlink()
+        elif b"\0" in content:  # such as executables embedding their interpreter, a changed length breaks them
+            return None
+        else:  # scripts, .pth files, installer records and the like
+            result.append(file.relative_to(root).as_posix())
+    return result
+
+
+def _generated(folder: Path) -> bool:
+    name = folder.name
+    if name.startswith(".") or name in {"__pycache__", "build", "dist"} or name.endswith(".egg-info"):
+        return True
+    return (folder / "pyvenv.cfg").is_file()
+
+
+def project_files(root: Path) -> list[Path]:
+    """List the files of a project.
+
+    :param root: the project folder
+
+    :returns: the files git tracks or would track (honoring its ignore rules), or when not a git checkout, the files
+        outside of hidden, bytecode, build output (``build``, ``dist``, ``*.egg-info``) and virtual environment folders
+    """
+    cmd = ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"]
+    try:
+        # env as read now: within the tox daemon that is the invoking client's, the process environment is the daemon's
+        listed = subprocess.run(cmd, cwd=root, env=dict(os.environ), capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        paths: list[Path] = []
+        for base, dirs, names in os.walk(root):
+            dirs[:] = [name for name in dirs if not _generated(Path(base, name))]
+            paths.extend(Path(base, name) for name in names)
+        return paths
+    return [root / os.fsdecode(name) for name in listed.split(b"\0") if name]
+
+
 __all__ = [
+    "clone_file",
     "ensure_cachedir_tag",
     "ensure_empty_dir",
     "ensure_gitignore",
+    "project_files",
+    "referring_files",
 ]
@@ -0,0 +1,129 @@
+"""Empty folders at once by moving their content into a trash folder, deleted in the background."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import subprocess
+import sys
+import threading
+import uuid
+from queue import SimpleQueue
+from shutil import rmtree
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+#: the folder within the tox working directory holding what is being deleted
+TRASH_DIR = ".trash"
+# deletes the trash of all working directories of this process, one after the other
+_GUARD = threading.Lock()
+_QUEUE: SimpleQueue[Path] = SimpleQueue()
+_PENDING: set[Path] = set()
+_REAPED: set[Path] = set()
+_STARTED = threading.Event()
+# deletes what is left in a process of its own, so tox need not wait on it when exiting
+_REMOVE_SCRIPT = "import shutil, sys\nfor path in sys.argv[1:]:\n    shutil.rmtree(path, ignore_errors=True)\n"
+
+
+def empty_dir(path: Path, work_dir: Path, except_filename: str | None = None) -> None:
+    """Ensure a folder exists and is empty, moving what it holds into the trash of the working directory.
+
+    Content that cannot be moved, such as content on another file system than the working directory, is deleted in
+    place.
+
+    :param path: the folder to empty
+    :param work_dir: the tox working directory, holding the trash
+    :param except_filename: the name of a file to keep within the folder
+    """
+    if not path.is_dir():
+        path.unlink(missing_ok=True)
+        path.mkdir(parents=True)
+        return
+    children = [child for child in path.iterdir() if child.name != except_filename]
+    if not children:
+        return
+    batch: Path | None = work_dir / TRASH_DIR / uuid.uuid4().hex
+    try:
+        batch.mkdir(parents=True)
+    except OSError:  # cannot create the trash, delete in place
+        batch = None
+    for child in children:
+        if batch is not None:
+            try:
+                child.rename(batch / child.name)
+                continue
+            except OSError:  # another file system, or the trash removed under us by another tox process
+                pass
+        _remove(child)
+    if batch is not None:
+        _schedule(batch)
+
+
+def reap(work_dir: Path) -> None:
+    """Delete in the background the trash earlier tox runs left behind, once per working directory and process.
+
+    :param work_dir: the tox working directory, holding the trash
+    """
+    trash = work_dir / TRASH_DIR
+    with _GUARD:
+        if trash in _REAPED:
+            return
+        _REAPED.add(trash)
+    if not trash.is_dir():
+        return
+    for batch in trash.iterdir():
+        if batch not in _PENDING:
+            LOGGER.debug("delete trash %s left behind", batch)
+            _schedule(batch)
+
+
+def _schedule(batch: Path) -> None:
+    with _GUARD:
+        _PENDING.add(batch)
+        if not _STARTED.is_set():
+            _STARTED.set()
+            threading.Thread(target=_work, name="tox-trash", daemon=True).start()
+            atexit.register(_detach)
+    _QUEUE.put(batch)
+
+
+def _work() -> None:
+    while True:
+        batch = _QUEUE.get()
+        _remove(batch)
+        with _GUARD:
+            _PENDING.discard(batch)
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def _detach() -> None:
+    with _GUARD:
+        left = sorted(str(batch) for batch in _PENDING)
+    if not left:
+        return
+    args = [sys.executable, "-c", _REMOVE_SCRIPT, *left]
+    null = subprocess.DEVNULL
+    try:
+        if sys.platform == "win32":
+            subprocess.Popen(args, stdin=null, stdout=null, stderr=null, creationflags=subprocess.DETACHED_PROCESS)
+        else:
+            subprocess.Popen(args, stdin=null, stdout=null, stderr=null, start_new_session=True)
+    except OSError:  # the next tox run deletes it
+        LOGGER.debug("could not delete trash %s", ", ".join(left))
+
+
+__all__ = (
+    "TRASH_DIR",
+    "empty_dir",
+    "reap",
+)
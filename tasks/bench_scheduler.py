@@ -0,0 +1,84 @@
+"""Measure how much time the parallel scheduler spends on environments that finish instantly."""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+from itertools import pairwise
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from tox.run import main
+from tox.session.cmd.run import common
+from tox.session.cmd.run.single import ToxEnvRunResult
+
+if TYPE_CHECKING:
+    from tox.tox_env.runner import RunToxEnv
+
+
+SCENARIOS = ("flat", "chain", "fan-in")
+
+
+def _instant(tox_env: RunToxEnv, no_test: bool, suspend_display: bool) -> ToxEnvRunResult:  # ruff:ignore[boolean-type-hint-positional-argument, unused-function-argument]
+    return ToxEnvRunResult(name=tox_env.conf.name, skipped=False, code=0, outcomes=[], duration=0.0)
+
+
+def _write_project(root: Path, count: int, scenario: str) -> None:
+    names = [f"{'f' if scenario == 'fan-in' and at >= count - count // 10 else 'e'}{at}" for at in range(count)]
+    lines = [f"env_list = {names!r}".replace("'", '"')]
+    if scenario == "chain":  # every environment waits for the previous one, the worst case for completion latency
+        lines.extend(f'env.{name}.depends = ["{previous}"]' for previous, name in pairwise(names))
+    elif scenario == "fan-in":  # the last tenth waits on globs matching the rest, like a coverage combine step
+        lines.extend(f'env.{name}.depends = ["e?", "e??", "e[1-9]??*"]' for name in names if name[0] == "f")
+    lines.extend(["[env_run_base]", 'package = "skip"'])
+    (root / "tox.toml").write_text("\n".join(lines) + "\n")
+
+
+def bench(count: int, workers: int, scenario: str) -> float:
+    """:returns: the seconds spent inside the scheduler for one run"""
+    with TemporaryDirectory() as folder:
+        root = Path(folder)
+        _write_project(root, count, scenario)
+        elapsed: list[float] = []
+        original = common.execute
+
+        def _timed(*args: object, **kwargs: object) -> int:
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)  # ty: ignore[invalid-argument-type]
+            finally:
+                elapsed.append(time.perf_counter() - start)
+
+        with (
+            mock.patch.object(common, "run_one", _instant),
+            mock.patch("tox.session.cmd.run.parallel.execute", _timed),
+            redirect_stdout(io.StringIO()),
+        ):
+            args = ["-c", str(root / "tox.toml"), "--workdir", str(root / ".tox"), "-qq", "p", "-p", str(workers)]
+            code = main([*args, "--parallel-no-spinner"])
+        if code:
+            msg = f"benchmark run failed with {code}"
+            raise RuntimeError(msg)
+        return elapsed[0]
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--envs", type=int, nargs="+", default=[100, 300, 1000], help="environment counts to try")
+    parser.add_argument("--workers", type=int, default=8, help="parallel workers")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scenario, the best is reported")
+    options = parser.parse_args()
+    for scenario in SCENARIOS:
+        for count in options.envs:
+            best = min(bench(count, options.workers, scenario) for _ in range(options.repeat))
+            per_env = best / count * 1000
+            sys.stdout.write(f"{scenario:>6} {count:>6} envs: {best:8.3f}s total {per_env:8.3f}ms per env\n")
+
+
+if __name__ == "__main__":
+    run()
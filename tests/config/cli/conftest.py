@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from tox.session.cmd.cache import cache
+from tox.session.cmd.daemon import daemon
 from tox.session.cmd.depends import depends
 from tox.session.cmd.devenv import devenv
 from tox.session.cmd.exec_ import exec_
@@ -15,6 +17,7 @@ from tox.session.cmd.run.parallel import run_parallel
 from tox.session.cmd.run.sequential import run_sequential
 from tox.session.cmd.schema import gen_schema
 from tox.session.cmd.show_config import show_config
+from tox.session.cmd.watch import watch
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -38,6 +41,8 @@ def core_handlers() -> dict[str, Callable[[State], int]]:
         "devenv": devenv,
         "q": quickstart,
         "quickstart": quickstart,
+        "daemon": daemon,
+        "cache": cache,
         "de": depends,
         "depends": depends,
         "le": legacy,
@@ -45,4 +50,6 @@ def core_handlers() -> dict[str, Callable[[State], int]]:
         "e": exec_,
         "exec": exec_,
         "man": setup_man,
+        "w": watch,
+        "watch": watch,
     }
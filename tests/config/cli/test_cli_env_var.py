@@ -69,6 +69,10 @@ def test_verbose_no_test() -> None:
         "parallel": 0,
         "parallel_live": False,
         "parallel_no_spinner": False,
+        "schedule": "config",
+        "jobserver": False,
+        "shard": None,
+        "cached": False,
         "pre": False,
         "factors": [],
         "labels": [],
@@ -125,6 +129,10 @@ def test_env_var_exhaustive_parallel_values(
         "parallel": 3,
         "parallel_live": False,
         "parallel_no_spinner": False,
+        "schedule": "config",
+        "jobserver": False,
+        "shard": None,
+        "cached": False,
         "pre": False,
         "quiet": 1,
         "recreate": True,
@@ -40,6 +40,8 @@ def default_options() -> dict[str, Any]:
         "hash_seed": ANY,
         "install_pkg": None,
         "fail_fast": False,
+        "shard": None,
+        "cached": False,
         "no_test": False,
         "no_capture": False,
         "override": [],
@@ -225,6 +227,10 @@ def test_ini_exhaustive_parallel_values(core_handlers: dict[str, Callable[[State
         "parallel": 3,
         "parallel_live": True,
         "parallel_no_spinner": False,
+        "schedule": "config",
+        "jobserver": False,
+        "shard": None,
+        "cached": False,
         "quiet": 1,
         "no_provision": False,
         "recreate": True,
@@ -88,3 +88,20 @@ commands = [["python", "-c", "print('native')"]]
     outcome.assert_success()
     assert "native" in outcome.out
     assert "legacy" not in outcome.out
+
+
+def test_source_reused_while_file_unchanged(tox_project: ToxProjectCreator) -> None:
+    project = tox_project({"tox.ini": "[tox]\nenv_list = a\n[testenv:b]\ncommands = python -c 'print(1)'"})
+    first = project.run("l")
+    first.assert_success()
+
+    again = project.run("l")
+    (project.path / "tox.ini").write_text("[tox]\nenv_list = c\n")
+    edited = project.run("l")
+
+    again.assert_success()
+    assert again.state.conf._src is first.state.conf._src  # ruff:ignore[private-member-access]
+    assert again.out == first.out
+    edited.assert_success()
+    assert "c ->" in edited.out
+    assert "b ->" not in edited.out
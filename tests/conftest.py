@@ -19,6 +19,7 @@ from tox.config.main import Config
 from tox.config.source import discover_source
 from tox.tox_env.python.api import PythonInfo, VersionInfo
 from tox.tox_env.python.virtual_env.api import VirtualEnv
+from tox.tox_env.python.virtual_env.interpreter_cache import interpreter_cache
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator, Sequence
@@ -153,6 +154,12 @@ def _do_not_share_virtualenv_for_parallel_runs(tmp_path_factory: pytest.TempPath
         cli_run(args, setup_logging=False)  # pragma: no cover
 
 
+@pytest.fixture(autouse=True)
+def _forget_interpreters() -> None:
+    # tests fake interpreters, what one test learned about an interpreter must not leak into another
+    interpreter_cache().clear()
+
+
 @pytest.fixture(scope="session")
 def fake_exe_on_path(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
     tmp_path = Path(tmp_path_factory.mktemp("a"))
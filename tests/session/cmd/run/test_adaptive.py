@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox.session.cmd.run import adaptive
+from tox.session.cmd.run.adaptive import AdaptiveLimit
+from tox.session.cmd.run.slots import Slots
+from tox.util.cpu import Load
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _load(
+    cpus: int = 8,
+    load_average: float | None = None,
+    cpu_pressure: float | None = None,
+    memory_pressure: float | None = None,
+) -> Load:
+    return Load(cpus=cpus, load_average=load_average, cpu_pressure=cpu_pressure, memory_pressure=memory_pressure)
+
+
+@pytest.mark.parametrize(
+    ("current", "busy", "load", "expected"),
+    [
+        pytest.param(4, 4, _load(cpu_pressure=1.0), (5, "spare CPU capacity"), id="grow-when-full"),
+        pytest.param(4, 2, _load(cpu_pressure=1.0), (4, "steady"), id="keep-when-not-full"),
+        pytest.param(8, 8, _load(cpu_pressure=1.0), (8, "steady"), id="keep-at-ceiling"),
+        pytest.param(4, 4, _load(cpu_pressure=20.0), (4, "steady"), id="keep-on-some-pressure"),
+        pytest.param(4, 4, _load(cpu_pressure=60.0), (3, "CPU pressure 60.0%"), id="shrink-on-cpu-pressure"),
+        pytest.param(1, 1, _load(cpu_pressure=60.0), (1, "CPU pressure 60.0%"), id="keep-one"),
+        pytest.param(6, 6, _load(memory_pressure=30.0), (3, "memory pressure 30.0%"), id="halve-on-memory"),
+        pytest.param(4, 4, _load(load_average=2.0), (3, "load average 2.00 per CPU"), id="shrink-on-load"),
+        pytest.param(4, 4, _load(load_average=0.5), (5, "spare CPU capacity"), id="grow-on-low-load"),
+        pytest.param(4, 4, _load(load_average=1.2), (4, "steady"), id="keep-on-some-load"),
+        pytest.param(4, 4, _load(), (5, "spare CPU capacity"), id="grow-without-metrics"),
+        pytest.param(6, 0, _load(cpus=2), (2, "only 2 usable CPUs"), id="quota-shrunk"),
+    ],
+)
+def test_adaptive_decide(current: int, busy: int, load: Load, expected: tuple[int, str]) -> None:
+    assert AdaptiveLimit(8).decide(current, busy, load) == expected
+
+
+def test_adaptive_update(mocker: MockerFixture, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO)
+    read_load = mocker.patch.object(adaptive, "read_load", return_value=_load(cpu_pressure=90.0))
+    limit, slots = AdaptiveLimit(4), Slots(4, {})
+
+    limit.update(slots)
+    limit.update(slots)  # within the interval, no new decision
+
+    assert slots.total == 3
+    assert read_load.call_count == 1
+    assert [r.message.split(" (")[0] for r in caplog.records] == ["adaptive parallel 4 -> 3: CPU pressure 90.0%"]
+    assert repr(limit) == "AdaptiveLimit(ceiling=4)"
+
+
+def test_adaptive_shrink_keeps_running(mocker: MockerFixture) -> None:
+    mocker.patch.object(adaptive, "read_load", return_value=_load(memory_pressure=90.0))
+    slots = Slots(4, {})
+    assert slots.acquire("a", 2, [])
+    assert slots.acquire("b", 2, [])
+
+    AdaptiveLimit(4).update(slots)
+
+    assert slots.total == 2
+    assert slots.busy == 4  # running environments are not stopped
+    assert not slots.acquire("c", 1, [])
+    slots.release("a")
+    slots.release("b")
+    assert slots.acquire("c", 1, [])
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 import re
 import sys
@@ -10,11 +11,16 @@ from urllib.parse import quote
 import pytest
 
 from tox.session.cmd.run.common import InstallPackageAction, SkipMissingInterpreterAction
+from tox.session.cmd.run.single import ToxEnvRunResult
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
     from tox.pytest import ToxProjectCreator
+    from tox.tox_env.runner import RunToxEnv
 
 
 @pytest.mark.parametrize("values", ["config", None, "true", "false"])
@@ -99,3 +105,44 @@ def test_empty_report(tox_project: ToxProjectCreator) -> None:
 
     outcome.assert_success()
     outcome.assert_out_err(f"foo{os.linesep}", "")
+
+
+def _instant(ran: list[str]) -> Callable[..., ToxEnvRunResult]:
+    def _run_one(tox_env: RunToxEnv, no_test: bool, suspend_display: bool) -> ToxEnvRunResult:  # ruff:ignore[unused-function-argument]
+        ran.append(tox_env.conf.name)
+        return ToxEnvRunResult(name=tox_env.conf.name, skipped=False, code=0, outcomes=[], duration=0.0)
+
+    return _run_one
+
+
+def test_parallel_collects_every_completion(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    names = [f"e{at}" for at in range(20)]
+    project = tox_project({"tox.toml": f'env_list = {json.dumps(names)}\n[env_run_base]\npackage = "skip"\n'})
+    ran: list[str] = []
+    mocker.patch("tox.session.cmd.run.common.run_one", side_effect=_instant(ran))
+
+    outcome = project.run("p", "-p", "4")
+
+    outcome.assert_success()
+    assert sorted(ran) == sorted(names)
+    assert all(f"{name}: OK" in outcome.out for name in names), outcome.out
+
+
+def test_parallel_starts_dependents_on_completion(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    toml = """
+    env_list = ["a", "b", "c"]
+    [env_run_base]
+    package = "skip"
+    [env.b]
+    depends = ["a"]
+    [env.c]
+    depends = ["b"]
+    """
+    project = tox_project({"tox.toml": toml})
+    ran: list[str] = []
+    mocker.patch("tox.session.cmd.run.common.run_one", side_effect=_instant(ran))
+
+    outcome = project.run("p", "-p", "3")
+
+    outcome.assert_success()
+    assert ran == ["a", "b", "c"]
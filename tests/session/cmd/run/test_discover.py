@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+from tox.tox_env.python.virtual_env.api import VirtualEnv
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from tox.pytest import ToxProjectCreator
+    from tox.tox_env.python.api import PythonInfo
+
+
+def test_discover_once_per_spec_up_front(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    ini = "[tox]\nenv_list = a, b, c\n[testenv]\npackage = skip\ncommands = python -c 'print(1)'\n"
+    ini += f"[testenv:c]\nbase_python = python{sys.version_info.major}\n"
+    project = tox_project({"tox.ini": ini})
+    threads: list[str] = []
+    original = VirtualEnv._get_python  # ruff:ignore[private-member-access]
+
+    def _get_python(self: VirtualEnv, base_python: list[str]) -> PythonInfo | None:
+        threads.append(threading.current_thread().name)
+        return original(self, base_python)
+
+    mocker.patch.object(VirtualEnv, "_get_python", autospec=True, side_effect=_get_python)
+
+    outcome = project.run("r")
+
+    outcome.assert_success()
+    assert len(threads) == 2
+    assert all(name.startswith("tox-discover") for name in threads)
+
+
+def test_discover_shares_journal_python(tox_project: ToxProjectCreator) -> None:
+    ini = "[tox]\nenv_list = a, b\n[testenv]\npackage = skip\ncommands = python -c 'print(1)'\n"
+    project = tox_project({"tox.ini": ini})
+    journal = project.path / "journal.json"
+
+    outcome = project.run("r", "--result-json", str(journal))
+
+    outcome.assert_success()
+    result = json.loads(journal.read_text())["testenvs"]
+    assert result["a"]["python"] == result["b"]["python"]
+    assert result["b"]["python"]["executable"]
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox.session.cmd.run.history import DurationHistory
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_history_empty(tmp_path: Path) -> None:
+    history = DurationHistory(tmp_path)
+    assert not history
+    assert history.expected("a") is None
+    history.write()
+    assert not (tmp_path / ".tox-durations.json").exists()
+
+
+def test_history_record_and_reload(tmp_path: Path) -> None:
+    history = DurationHistory(tmp_path)
+    history.record("a", 4.0)
+    assert history.expected("a") == pytest.approx(4.0)
+    history.record("a", 2.0)
+    assert history.expected("a") == pytest.approx(3.0)
+    history.write()
+
+    assert DurationHistory(tmp_path).expected("a") == pytest.approx(3.0)
+
+
+def test_history_write_keeps_concurrent_entries(tmp_path: Path) -> None:
+    first, second = DurationHistory(tmp_path), DurationHistory(tmp_path)
+    first.record("a", 1.0)
+    second.record("b", 2.0)
+    first.write()
+    second.write()
+
+    loaded = DurationHistory(tmp_path)
+    assert (loaded.expected("a"), loaded.expected("b")) == (1.0, 2.0)
+
+
+@pytest.mark.parametrize("content", ["{", "[]", '{"a": "x", "b": true, "c": -1}'])
+def test_history_corrupt(tmp_path: Path, content: str) -> None:
+    (tmp_path / ".tox-durations.json").write_text(content)
+    assert not DurationHistory(tmp_path)
+
+
+def test_history_file_format(tmp_path: Path) -> None:
+    history = DurationHistory(tmp_path)
+    history.record("b", 1.5)
+    history.record("a", 0.5)
+    history.write()
+    assert json.loads((tmp_path / ".tox-durations.json").read_text()) == {"a": 0.5, "b": 1.5}
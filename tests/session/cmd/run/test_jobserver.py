@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox.session.cmd.run.jobserver import JobServer, jobserver
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="the jobserver needs named pipes")
+
+
+@pytest.fixture
+def server() -> Iterator[JobServer]:
+    created = JobServer.create(3)
+    assert created is not None
+    yield created
+    created.close()
+
+
+def test_jobserver_tokens(server: JobServer) -> None:
+    assert server.acquire("a")  # the implicit token
+    assert server.acquire("b")
+    assert server.acquire("c")
+    assert not server.acquire("d")
+    server.release("b")
+    assert server.acquire("d")
+    server.release("a")
+    assert server.acquire("e")  # the implicit token is free again
+    server.release("never-started")
+    assert repr(server).endswith("held=2)")
+
+
+def test_jobserver_create_and_close() -> None:
+    server = JobServer.create(2)
+    assert server is not None
+    assert server.make_flags is not None
+    assert server.make_flags.startswith("-j2 --jobserver-auth=fifo:")
+    fifo = Path(server.make_flags.split("fifo:")[1])
+    assert fifo.exists()
+    server.close()
+    assert not fifo.parent.exists()
+
+
+def test_jobserver_join_fifo(server: JobServer) -> None:
+    assert server.make_flags is not None
+    client = JobServer.join({"MAKEFLAGS": f"-j --jobserver-auth=fifo:/missing {server.make_flags}"})
+    assert client is not None
+    try:
+        assert client.make_flags == f"-j --jobserver-auth=fifo:/missing {server.make_flags}"
+        assert client.acquire("a")
+        assert client.acquire("b")
+        assert client.acquire("c")
+        assert not client.acquire("d")
+        assert server.acquire("x")
+        assert not server.acquire("y")  # the client holds the tokens
+    finally:
+        client.close()  # gives back the tokens still held
+    assert server.acquire("y")
+
+
+@pytest.mark.skipif(not Path("/proc/self/fd").exists(), reason="needs procfs")
+def test_jobserver_join_pipe() -> None:
+    read, write = os.pipe()
+    os.write(write, b"++")
+    client = JobServer.join({"MAKEFLAGS": f"-j3 --jobserver-auth={read},{write}"})
+    assert client is not None
+    try:
+        assert client.make_flags is None  # environments cannot inherit the descriptors
+        assert [client.acquire(i) for i in "abcd"] == [True, True, True, False]
+        client.close()
+        assert os.read(read, 3) == b"++"
+    finally:
+        os.close(read)
+        os.close(write)
+
+
+@pytest.mark.parametrize("make_flags", ["", "-j4", "-j --jobserver-auth=fifo:/missing", "--jobserver-fds=x,y"])
+def test_jobserver_join_none(make_flags: str) -> None:
+    assert JobServer.join({"MAKEFLAGS": make_flags}) is None
+
+
+def test_jobserver_serve(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO)
+    monkeypatch.delenv("MAKEFLAGS", raising=False)
+    with jobserver(False, 2) as server:
+        assert server is None
+    with jobserver(True, 2) as server:
+        assert server is not None
+        assert "serving 2 jobserver tokens with MAKEFLAGS=-j2" in caplog.text
+
+
+def test_jobserver_prefers_the_one_we_run_under(server: JobServer, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert server.make_flags is not None
+    monkeypatch.setenv("MAKEFLAGS", server.make_flags)
+    with jobserver(True, 8) as client:
+        assert client is not None
+        assert client.make_flags == server.make_flags
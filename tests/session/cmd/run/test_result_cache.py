@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import re
+from textwrap import dedent
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pytest
+
+    from tox.pytest import ToxProject, ToxProjectCreator
+
+_TOML = """
+env_list = ["a"]
+[env_run_base]
+package = "skip"
+cache_inputs = ["src/*.py"]
+commands = [["python", "-c", "print('ran ' + open('src/x.py').read())"]]
+"""
+
+
+def _ran(project: ToxProject, *args: str) -> list[str]:
+    outcome = project.run("r", *args)
+    outcome.assert_success()
+    return re.findall(r"^ran (.*)$", outcome.out, re.MULTILINE)
+
+
+def test_result_cache_hit(tox_project: ToxProjectCreator) -> None:
+    project = tox_project({"tox.toml": dedent(_TOML), "src": {"x.py": "1"}})
+    assert _ran(project, "--cached") == ["1"]
+
+    outcome = project.run("r", "--cached")
+    outcome.assert_success()
+    assert "ran 1" not in outcome.out
+    assert re.search(r"cached commands\[0\]> python -c .* \(exit 0 in \d+\.\d+ seconds\)", outcome.out)
+    assert "a: CACHED" in outcome.out
+
+    assert _ran(project) == ["1"]  # without the flag the commands always run
+
+
+def test_result_cache_miss_on_input_change(tox_project: ToxProjectCreator) -> None:
+    project = tox_project({"tox.toml": dedent(_TOML), "src": {"x.py": "1"}})
+    assert _ran(project, "--cached") == ["1"]
+    (project.path / "src" / "x.py").write_text("2")
+    assert _ran(project, "--cached") == ["2"]
+    assert _ran(project, "--cached") == []
+
+
+def test_result_cache_miss_on_env_var_change(tox_project: ToxProjectCreator, monkeypatch: pytest.MonkeyPatch) -> None:
+    project = tox_project({"tox.toml": f'{dedent(_TOML)}pass_env = ["MAGIC"]\n', "src": {"x.py": "1"}})
+    monkeypatch.setenv("MAGIC", "1")
+    assert _ran(project, "--cached") == ["1"]
+    assert _ran(project, "--cached") == []
+    monkeypatch.setenv("MAGIC", "2")
+    assert _ran(project, "--cached") == ["1"]
+
+
+def test_result_cache_not_stored_on_failure(tox_project: ToxProjectCreator) -> None:
+    toml = 'env_list = ["a"]\n[env_run_base]\npackage = "skip"\ncommands = [["python", "-c", "raise SystemExit(3)"]]\n'
+    project = tox_project({"tox.toml": toml})
+    project.run("r", "--cached").assert_failed(code=3)
+    project.run("r", "--cached").assert_failed(code=3)
+
+
+def test_result_cache_journal_and_durations(tox_project: ToxProjectCreator) -> None:
+    project = tox_project({"tox.toml": dedent(_TOML), "src": {"x.py": "1"}})
+    project.run("r", "--cached").assert_success()
+    durations = project.path / ".tox" / ".tox-durations.json"
+    recorded = json.loads(durations.read_text())
+
+    journal = project.path / "journal.json"
+    project.run("r", "--cached", "--result-json", str(journal)).assert_success()
+
+    assert json.loads(durations.read_text()) == recorded  # a cached run says nothing about how long the run takes
+    cached = json.loads(journal.read_text())["testenvs"]["a"]["cached"]
+    assert [c["run_id"] for c in cached["commands"]] == ["commands[0]"]
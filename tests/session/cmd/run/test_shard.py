@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from argparse import ArgumentTypeError
+
+import pytest
+
+from tox.session.cmd.run.shard import Shard, partition
+
+
+def test_shard() -> None:
+    shard = Shard("3/8")
+    assert (shard.index, shard.total) == (3, 8)
+    assert shard == Shard("3/8")
+    assert str(shard) == "3/8"
+
+
+@pytest.mark.parametrize(
+    ("value", "message"),
+    [
+        ("3", "value must be <index>/<total>, is '3'"),
+        ("a/b", "value must be <index>/<total>, is 'a/b'"),
+        ("0/2", "index must be between 1 and 2, is 0"),
+        ("3/2", "index must be between 1 and 2, is 3"),
+    ],
+)
+def test_shard_invalid(value: str, message: str) -> None:
+    with pytest.raises(ArgumentTypeError, match=message):
+        Shard(value)
+
+
+def test_partition_balances_weight() -> None:
+    order = ["a", "b", "c", "d", "e"]
+    weight = {"a": 10.0, "b": 6.0, "c": 5.0, "d": 3.0, "e": 2.0}
+    parts = partition(order, {}, weight, 2)
+    assert parts == [["a", "d"], ["b", "c", "e"]]
+    assert [sum(weight[e] for e in part) for part in parts] == [13.0, 13.0]
+
+
+def test_partition_counts_and_stable() -> None:
+    order = [f"e{i}" for i in range(7)]
+    weight = dict.fromkeys(order, 1.0)
+    parts = partition(order, {}, weight, 3)
+    assert parts == [["e0", "e3", "e6"], ["e1", "e4"], ["e2", "e5"]]
+    assert partition(order, {}, weight, 3) == parts
+
+
+def test_partition_keeps_depends_together() -> None:
+    order = ["a", "b", "c", "d", "cover"]
+    todo = {"a": set(), "b": set(), "c": set(), "d": {"c"}, "cover": {"a", "b"}}
+    weight = {"a": 4.0, "b": 4.0, "c": 1.0, "d": 1.0, "cover": 1.0}
+    parts = partition(order, todo, weight, 3)
+    assert parts == [["a", "b", "cover"], ["c", "d"], []]
+
+
+def test_partition_more_parts_than_envs() -> None:
+    assert partition(["a"], {}, {"a": 1.0}, 3) == [["a"], [], []]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox.session.cmd.run.slots import Slots
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_slots_weight() -> None:
+    slots = Slots(4, {})
+    assert slots.acquire("a", 3, [])
+    assert not slots.acquire("b", 2, [])
+    assert slots.acquire("c", 1, [])
+    assert slots.peak == 4
+    slots.release("a")
+    assert slots.acquire("b", 2, [])
+
+
+@pytest.mark.parametrize(("weight", "expected"), [(0, 1), (1, 1), (2, 2), (10, 4)])
+def test_slots_weight_capped(weight: int, expected: int) -> None:
+    assert Slots(4, {}).weight(weight) == expected
+
+
+def test_slots_resources() -> None:
+    slots = Slots(8, {"db": 2})
+    assert slots.acquire("a", 1, ["db", "port"])
+    assert not slots.acquire("b", 1, ["port"])  # not listed in the capacity, so held by one environment
+    assert slots.acquire("c", 1, ["db"])
+    assert not slots.acquire("d", 1, ["db"])
+    slots.release("a")
+    assert slots.acquire("b", 1, ["port"])
+    assert slots.acquire("d", 1, ["db"])
+
+
+def test_slots_admit_keeps_freed_slots_for_heavy_env() -> None:
+    slots = Slots(4, {})
+    light = [(f"l{i}", 1, []) for i in range(8)]
+    assert slots.admit(light[:2]) == ["l0", "l1"]
+    waiting = [("heavy", 4, []), *light[2:]]
+
+    assert slots.admit(waiting) == []  # the free slots are not handed to the light ones behind it
+    slots.release("l0")
+    assert slots.admit(waiting) == []
+    slots.release("l1")
+    assert slots.admit(waiting) == ["heavy"]
+
+
+def test_slots_admit_passes_env_waiting_on_resource() -> None:
+    slots = Slots(4, {})
+    assert slots.admit([("a", 1, ["db"])]) == ["a"]
+    assert slots.admit([("b", 1, ["db"]), ("c", 1, []), ("d", 3, []), ("e", 1, [])]) == ["c"]
+
+
+def test_slots_admit_gate() -> None:
+    slots = Slots(4, {})
+    assert slots.admit([("a", 1, []), ("b", 1, [])], lambda name: name == "b") == ["b"]
+    assert slots.busy == 1
+
+
+def test_slots_release_unknown() -> None:
+    slots = Slots(1, {})
+    slots.release("a")
+    assert repr(slots) == "Slots(total=1, busy=0)"
+
+
+def test_slots_average(mocker: MockerFixture) -> None:
+    clock = mocker.patch("tox.session.cmd.run.slots.time.monotonic", side_effect=[0, 0, 2, 4])
+    slots = Slots(2, {})
+    assert slots.acquire("a", 2, [])
+    slots.release("a")
+    assert slots.average == pytest.approx(1.0)
+    assert clock.call_count == 4
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from python_discovery import PythonInfo, _cached_py_info  # ruff:ignore[import-private-name]
+
+import tox.daemon
+from tox.daemon import DISABLE_ENV, ENV, forward, socket_path
+from tox.run import run
+from tox.session.cmd.daemon import (
+    _invocation,  # ruff:ignore[import-private-name]
+    _remember_discovery,  # ruff:ignore[import-private-name]
+    _reset_discovery,  # ruff:ignore[import-private-name]
+)
+from tox.util.path import project_files
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pytest_mock import MockerFixture
+
+    from tox.pytest import ToxProjectCreator
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="the daemon needs unix sockets")
+
+
+@pytest.fixture
+def runtime_dir(monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    # unix socket paths are limited to about a hundred characters, pytest temporary folders can be longer
+    with tempfile.TemporaryDirectory() as folder:
+        monkeypatch.setenv("XDG_RUNTIME_DIR", folder)
+        monkeypatch.delenv(DISABLE_ENV, raising=False)
+        yield Path(folder)
+
+
+@pytest.fixture
+def tox_daemon(runtime_dir: Path) -> Iterator[subprocess.Popen[bytes]]:  # ruff:ignore[unused-function-argument]
+    process = subprocess.Popen([sys.executable, "-m", "tox", "daemon"])
+    try:
+        for _ in range(100):
+            if socket_path().exists():
+                break
+            time.sleep(0.1)
+        yield process
+    finally:
+        process.send_signal(signal.SIGINT)
+        process.wait(timeout=10)
+
+
+@pytest.mark.usefixtures("tox_daemon")
+def test_daemon_runs_in_cwd_with_environment(
+    tox_project: ToxProjectCreator,
+    monkeypatch: pytest.MonkeyPatch,
+    capfd: pytest.CaptureFixture[str],
+    mocker: MockerFixture,
+) -> None:
+    cmd = "python -c 'import os; print(os.getcwd(), os.environ[\"MAGIC\"])'"
+    project = tox_project({"tox.ini": f"[testenv:a]\nskip_install = true\npass_env = MAGIC\ncommands = {cmd}"})
+    monkeypatch.chdir(project.path)
+    monkeypatch.setenv("MAGIC", "forwarded")
+    monkeypatch.setenv("SECRET_TOKEN", "not-for-the-daemon")
+    send_frame = mocker.spy(tox.daemon, "send_frame")
+
+    code = forward(["r", "-e", "a"])
+
+    assert code == 0
+    out, _ = capfd.readouterr()
+    assert f"{project.path} forwarded" in out
+    assert "a: OK" in out
+    answered = [json.loads(i.args[2])[0] for i in send_frame.call_args_list if i.args[1] == ENV]
+    assert "MAGIC" in answered
+    assert "SECRET_TOKEN" not in answered
+
+
+@pytest.mark.usefixtures("tox_daemon")
+def test_daemon_forwards_exit_code(tox_project: ToxProjectCreator, monkeypatch: pytest.MonkeyPatch) -> None:
+    project = tox_project({"tox.ini": "[testenv:a]\nskip_install = true\ncommands = python -c 'raise SystemExit(3)'"})
+    monkeypatch.chdir(project.path)
+
+    assert forward(["r", "-e", "a"]) == 3
+    assert forward(["r", "--not-an-option"]) == -2
+
+
+@pytest.mark.usefixtures("tox_daemon")
+def test_daemon_only_once(tox_project: ToxProjectCreator) -> None:
+    outcome = tox_project({"tox.ini": ""}).run("daemon")
+
+    outcome.assert_failed()
+    assert f"a tox daemon already listens on {socket_path()}" in outcome.out
+
+
+@pytest.mark.usefixtures("runtime_dir")
+def test_forward_without_daemon() -> None:
+    assert forward(["l"]) is None
+
+
+@pytest.mark.usefixtures("tox_daemon")
+def test_forward_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(DISABLE_ENV, "1")
+    assert forward(["l"]) is None
+    monkeypatch.delenv(DISABLE_ENV)
+    assert forward(["daemon"]) is None
+
+
+def test_run_uses_daemon(mocker: MockerFixture) -> None:
+    mocker.patch("tox.daemon.forward", return_value=5)
+    main = mocker.patch("tox.run.main")
+    mocker.patch.object(sys, "argv", ["tox", "l"])
+
+    with pytest.raises(SystemExit) as context:
+        run()
+
+    assert context.value.code == 5
+    main.assert_not_called()
+
+
+def test_reset_discovery_keeps_disk_cache(mocker: MockerFixture) -> None:
+    clear_cache = mocker.patch("tox.session.cmd.daemon.PythonInfo.clear_cache")
+
+    _reset_discovery()
+
+    (cache,), _ = clear_cache.call_args
+    cache.py_info_clear()
+    assert not hasattr(cache, "py_info")
+
+
+def test_reset_discovery_keeps_unchanged_interpreters(tmp_path: Path, mocker: MockerFixture) -> None:
+    same, changed, failed = tmp_path / "same", tmp_path / "changed", tmp_path / "failed"
+    for path in (same, changed, failed):
+        path.write_text("python")
+    known = {same: PythonInfo(), changed: PythonInfo(), failed: RuntimeError("broken")}
+    mocker.patch.dict(_cached_py_info._CACHE, known, clear=True)  # ruff:ignore[private-member-access]
+    _remember_discovery()
+    changed.write_text("upgraded")
+
+    _reset_discovery()
+
+    assert dict(_cached_py_info._CACHE) == {same: known[same]}  # ruff:ignore[private-member-access]
+
+
+def test_invocation_subprocess_sees_client_environment(tmp_path: Path, mocker: MockerFixture) -> None:
+    client_bin = tmp_path / "client-bin"
+    client_bin.mkdir()
+    (client_bin / "git").write_text('#!/bin/sh\nprintf "$LISTED\\0"\n')
+    (client_bin / "git").chmod(0o755)
+    (tmp_path / "listed").write_text("")
+    client = mocker.MagicMock(getenv={"PATH": str(client_bin), "LISTED": "listed"}.get)
+    request = {"cwd": str(tmp_path), "env": ["PATH", "LISTED"], "tty": [False, False]}
+
+    with _invocation(request, client):
+        files = project_files(tmp_path)
+
+    assert files == [tmp_path / "listed"]  # git ran with the variables of the client, not those of the daemon
+
+
+@pytest.mark.usefixtures("runtime_dir")
+def test_forward_refuses_socket_others_can_access(capsys: pytest.CaptureFixture[str]) -> None:
+    path = socket_path()
+    path.parent.mkdir()
+    path.parent.chmod(0o777)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        server.listen()
+        server.settimeout(0)
+
+        assert forward(["l"]) is None
+
+        with pytest.raises(BlockingIOError):
+            server.accept()
+    assert f"ignore tox daemon socket {path} as other users can access it" in capsys.readouterr().err
+
+
+@pytest.mark.usefixtures("runtime_dir")
+def test_daemon_refuses_folder_others_can_access(tox_project: ToxProjectCreator) -> None:
+    folder = socket_path().parent
+    folder.mkdir()
+    folder.chmod(0o777)
+
+    outcome = tox_project({"tox.ini": ""}).run("daemon")
+
+    outcome.assert_failed()
+    assert f"refuse to serve from {folder} as it is not a folder only you can access" in outcome.out
+    assert not socket_path().exists()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import sys
 from argparse import ArgumentTypeError
 from signal import SIGINT
@@ -12,10 +13,11 @@ from unittest import mock
 import pytest
 
 from tox.session.cmd.run import parallel
-from tox.session.cmd.run.parallel import parse_num_processes
+from tox.session.cmd.run.parallel import ADAPTIVE_VALUE, parse_num_processes
+from tox.session.cmd.run.slots import Slots
 from tox.tox_env.api import ToxEnv
 from tox.tox_env.errors import Fail
-from tox.util.cpu import auto_detect_cpus
+from tox.util.cpu import Load, auto_detect_cpus
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -35,6 +37,10 @@ def test_parse_num_processes_auto() -> None:
     assert auto > 0
 
 
+def test_parse_num_processes_adaptive() -> None:
+    assert parse_num_processes("adaptive") == ADAPTIVE_VALUE
+
+
 def test_parse_num_processes_exact() -> None:
     assert parse_num_processes("3") == 3
 
@@ -323,3 +329,117 @@ def test_parallel_spinner_stays_out_of_non_tty_output(tox_project: ToxProjectCre
 
     outcome.assert_success()
     assert "\x1b[" not in outcome.out
+
+
+def test_parallel_records_durations(tox_project: ToxProjectCreator) -> None:
+    ini = "[tox]\nno_package=true\nenv_list=a,b\n[testenv]\ncommands=python -c 'pass'"
+    project = tox_project({"tox.ini": ini})
+    outcome = project.run("p", "-p", "2")
+    outcome.assert_success()
+    durations = json.loads((project.path / ".tox" / ".tox-durations.json").read_text())
+    assert set(durations) == {"a", "b"}
+
+
+def test_parallel_schedule_critical_path(tox_project: ToxProjectCreator) -> None:
+    ini = """
+    [tox]
+    no_package=true
+    env_list= a, b, c, d
+    [testenv]
+    commands=python -c 'print("run {env_name}")'
+    [testenv:d]
+    depends = a
+    """
+    project = tox_project({"tox.ini": ini})
+    (project.path / ".tox").mkdir()
+    durations = {"a": 1, "b": 5, "c": 2, "d": 8}
+    (project.path / ".tox" / ".tox-durations.json").write_text(json.dumps(durations))
+    outcome = project.run("p", "-p", "1", "--parallel-live", "--schedule", "critical-path")
+    outcome.assert_success()
+    started = sorted("abcd", key=lambda e: outcome.out.index(f"run {e}"))
+    assert started == ["a", "d", "b", "c"]  # a unlocks d, together they are the longest chain of work
+
+
+def test_parallel_schedule_critical_path_no_history(tox_project: ToxProjectCreator) -> None:
+    ini = "[tox]\nno_package=true\nenv_list=b,a\n[testenv]\ncommands=python -c 'print(\"run {env_name}\")'"
+    project = tox_project({"tox.ini": ini})
+    outcome = project.run("p", "-p", "1", "--parallel-live", "--schedule", "critical-path")
+    outcome.assert_success()
+    assert outcome.out.index("run b") < outcome.out.index("run a")
+
+
+def test_parallel_resources_exclusive(tox_project: ToxProjectCreator) -> None:
+    # each environment takes a lock file and fails if another environment holds it
+    cmd = "import pathlib, time; p = pathlib.Path('lock'); p.open('x').close(); time.sleep(0.2); p.unlink()"
+    toml = f"""
+    env_list = ["a", "b", "c"]
+    [env_run_base]
+    package = "skip"
+    resources = ["lock"]
+    commands = [["python", "-c", "{cmd}"]]
+    """
+    project = tox_project({"tox.toml": dedent(toml)})
+    outcome = project.run("p", "-p", "3", "-v")
+    outcome.assert_success()
+    assert "parallel slots busy" in outcome.out
+    assert ", 1 at peak" in outcome.out
+
+
+def test_parallel_resource_capacity_below_one(tox_project: ToxProjectCreator) -> None:
+    toml = """
+    env_list = ["a"]
+    resource_capacity = { lock = 0 }
+    [env_run_base]
+    package = "skip"
+    resources = ["lock"]
+    """
+    project = tox_project({"tox.toml": dedent(toml)})
+    outcome = project.run("p", "-p", "2")
+    outcome.assert_failed()
+    assert "resource_capacity must be at least 1, got lock=0" in outcome.out
+
+
+def test_parallel_weight_limits_concurrency(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    acquire = mocker.spy(Slots, "acquire")
+    toml = """
+    env_list = ["a", "b"]
+    [env_run_base]
+    package = "skip"
+    [env.a]
+    parallel_weight = 2
+    """
+    project = tox_project({"tox.toml": dedent(toml)})
+    outcome = project.run("p", "-p", "2", "-v")
+    outcome.assert_success()
+    assert ", 2 at peak" in outcome.out
+    assert [c.args[1:3] for c in acquire.call_args_list if c.args[1] == "a"] == [("a", 2)]
+
+
+def test_parallel_adaptive(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    mocker.patch.object(parallel, "usable_cpus", return_value=3)
+    load = Load(cpus=3, load_average=None, cpu_pressure=None, memory_pressure=50.0)
+    mocker.patch("tox.session.cmd.run.adaptive.read_load", return_value=load)
+    project = tox_project({"tox.toml": 'env_list = ["a", "b"]\n[env_run_base]\npackage = "skip"\n'})
+    outcome = project.run("p", "-p", "adaptive", "-v")
+    outcome.assert_success()
+    assert "adaptive parallel starts with 3 slots" in outcome.out
+    assert "adaptive parallel 3 -> 1: memory pressure 50.0%" in outcome.out
+    assert ", 1 at peak" in outcome.out
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the jobserver needs named pipes")
+def test_parallel_jobserver(tox_project: ToxProjectCreator, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.delenv("MAKEFLAGS", raising=False)
+    toml = """
+    env_list = ["a", "b"]
+    [env_run_base]
+    package = "skip"
+    commands = [["python", "-c", "import os; print('flags', os.environ['MAKEFLAGS'])"]]
+    [env.b]
+    set_env.MAKEFLAGS = "-j1"
+    """
+    project = tox_project({"tox.toml": dedent(toml)})
+    outcome = project.run("p", "-p", "2", "--jobserver", "-v", "--parallel-live")
+    outcome.assert_success()
+    assert "flags -j2 --jobserver-auth=fifo:" in outcome.out
+    assert "flags -j1" in outcome.out  # set_env wins
@@ -136,7 +136,6 @@ def test_result_json_sequential(
         (0, "install_requires"),
         (None, "_optional_hooks"),
         (None, "get_requires_for_build_wheel"),
-        (0, "freeze"),
     ]
     packaging_test = get_cmd_exit_run_id(log_report, ".pkg", "test")
     assert packaging_test == [(None, "build_wheel")]
@@ -148,7 +147,7 @@ def test_result_json_sequential(
     assert result_py == {"success": True, "exit_code": 0, "skipped": False}
 
     py_setup = get_cmd_exit_run_id(log_report, "py", "setup")
-    assert py_setup == [(0, "install_package_deps"), (0, "install_package"), (0, "freeze")]
+    assert py_setup == [(0, "install_package_deps"), (0, "install_package")]
     py_test = get_cmd_exit_run_id(log_report, "py", "test")
     assert py_test == [(1, "commands[0]"), (0, "commands[1]")]
     packaging_installed = log_report["testenvs"]["py"].pop("installed_packages")
@@ -901,3 +900,44 @@ def test_result_json_marks_skipped(tox_project: ToxProjectCreator) -> None:
     outcome.assert_success()
     result = json.loads((project.path / "out.json").read_text())["testenvs"]["a"]["result"]
     assert result == {"success": True, "exit_code": 0, "duration": result["duration"], "skipped": True}
+
+
+def test_run_shard(tox_project: ToxProjectCreator) -> None:
+    toml = """
+    env_list = ["a", "b", "c", "cover"]
+    [env_run_base]
+    package = "skip"
+    commands = [["python", "-c", "print('ran {env_name}')"]]
+    [env.cover]
+    depends = ["a", "b"]
+    """
+    project = tox_project({"tox.toml": dedent(toml)})
+    durations = project.path / ".tox" / ".tox-durations.json"
+    durations.parent.mkdir()
+    durations.write_text(json.dumps({"a": 5, "b": 5, "c": 20, "cover": 1}))
+
+    first = project.run("r", "--shard", "1/2")
+    first.assert_success()
+    assert "shard 1/2 runs 1 of 4 environments, predicted 1=20.0s 2=11.0s" in first.out
+    assert re.findall(r"^ran (\w+)$", first.out, re.MULTILINE) == ["c"]
+
+    durations.write_text(json.dumps({"a": 5, "b": 5, "c": 20, "cover": 1}))  # as another machine sees it
+    second = project.run("r", "--shard", "2/2")
+    second.assert_success()
+    assert re.findall(r"^ran (\w+)$", second.out, re.MULTILINE) == ["a", "b", "cover"]
+
+
+def test_run_shard_by_count_and_empty(tox_project: ToxProjectCreator) -> None:
+    project = tox_project({"tox.toml": 'env_list = ["a"]\n[env_run_base]\npackage = "skip"\n'})
+    outcome = project.run("r", "--shard", "2/2")
+    outcome.assert_success()
+    assert "shard 2/2 runs 0 of 1 environments, predicted by count 1=1 2=0" in outcome.out
+    assert "shard 2/2 has no environments to run" in outcome.out
+
+
+def test_run_shard_from_env_var(tox_project: ToxProjectCreator, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TOX_SHARD", "2/2")
+    project = tox_project({"tox.toml": 'env_list = ["a"]\n[env_run_base]\npackage = "skip"\n'})
+    outcome = project.run("r")
+    outcome.assert_success()
+    assert "shard 2/2 has no environments to run" in outcome.out
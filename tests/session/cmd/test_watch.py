@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import re
+import shutil
+import subprocess
+from textwrap import dedent
+from threading import Event
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox.session.cmd import watch
+from tox.session.cmd.watch import Tree, affected
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+    from tox.pytest import ToxProject, ToxProjectCreator
+
+
+def test_tree_changes(tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("a")
+    (tmp_path / "gone.py").write_text("gone")
+    for ignored in (".git", "__pycache__", ".tox"):
+        (tmp_path / ignored).mkdir()
+    tree = Tree(tmp_path, tmp_path / ".tox")
+    assert tree.changes() == set()
+
+    (tmp_path / "a.py").write_text("aa")
+    (tmp_path / "gone.py").unlink()
+    (tmp_path / "new.py").write_text("new")
+    for ignored in (".git", "__pycache__", ".tox"):
+        (tmp_path / ignored / "x").write_text("x")
+
+    assert tree.changes() == {tmp_path / "a.py", tmp_path / "gone.py", tmp_path / "new.py"}
+    assert tree.changes() == set()
+
+
+GIT = shutil.which("git")
+
+
+@pytest.mark.skipif(GIT is None, reason="needs git")
+def test_tree_honors_git_ignore(tmp_path: Path) -> None:
+    assert GIT is not None
+    subprocess.run([GIT, "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    tree = Tree(tmp_path, tmp_path / "out")
+    (tmp_path / "out").mkdir()
+
+    (tmp_path / "a.py").write_text("a")
+    (tmp_path / "b.log").write_text("b")
+    (tmp_path / "out" / "c.py").write_text("c")
+
+    assert tree.changes() == {tmp_path / "a.py"}
+
+
+def test_tree_lists_files_again_only_when_folders_change(tmp_path: Path, mocker: MockerFixture) -> None:
+    (tmp_path / "a.py").write_text("a")
+    listing = mocker.spy(watch, "project_files")
+    tree = Tree(tmp_path, tmp_path / ".tox")
+
+    (tmp_path / "a.py").write_text("aa")
+    assert tree.changes() == {tmp_path / "a.py"}
+    assert listing.call_count == 1
+
+    (tmp_path / "pkg").mkdir()
+    assert tree.changes() == set()
+    (tmp_path / "pkg" / "b.py").write_text("b")
+    assert tree.changes() == {tmp_path / "pkg" / "b.py"}
+    assert listing.call_count == 3
+
+
+def test_tree_wait_debounces(tmp_path: Path, mocker: MockerFixture) -> None:
+    tree = Tree(tmp_path, tmp_path / ".tox")
+    mocker.patch("tox.session.cmd.watch.POLL", 0.01)
+    found = [set(), {tmp_path / "a"}, {tmp_path / "b"}, *[set()] * 50]
+    changes = mocker.patch.object(tree, "changes", side_effect=found)
+
+    assert tree.wait(0.05) == {tmp_path / "a", tmp_path / "b"}
+    assert changes.call_count > 4
+
+
+def test_tree_wait_stops(tmp_path: Path) -> None:
+    stop = Event()
+    stop.set()
+    assert Tree(tmp_path, tmp_path / ".tox").wait(0, stop) == set()
+
+
+@pytest.fixture
+def project(tox_project: ToxProjectCreator, demo_pkg_inline: Path) -> ToxProject:
+    toml = """
+    env_list = ["test", "docs", "lint"]
+    [env.test]
+    change_dir = "tests"
+    [env.docs]
+    package = "skip"
+    change_dir = "docs"
+    watch_paths = ["README*"]
+    [env.lint]
+    package = "skip"
+    """
+    files = {"tox.toml": dedent(toml), "tests": {"test_a.py": ""}, "docs": {"index.rst": ""}}
+    return tox_project({**files, **{p.name: p.read_text() for p in demo_pkg_inline.iterdir() if p.is_file()}})
+
+
+@pytest.mark.parametrize(
+    ("changed", "envs", "package"),
+    [
+        pytest.param(["tests/test_a.py"], ["test", "lint"], False, id="test"),
+        pytest.param(["docs/index.rst"], ["docs", "lint"], False, id="docs"),
+        pytest.param(["README.md"], ["test", "docs", "lint"], True, id="readme"),
+        pytest.param(["build.py"], ["test", "lint"], True, id="source"),
+    ],
+)
+def test_affected(project: ToxProject, changed: list[str], envs: list[str], package: bool) -> None:
+    state = project.run("c", "-k", "package_env").state
+    assert state is not None
+
+    assert affected(state, {project.path / i for i in changed}) == (envs, package)
+
+
+def test_watch_reruns_affected(project: ToxProject, mocker: MockerFixture) -> None:
+    changes = iter([{project.path / "docs" / "index.rst"}])
+
+    def _wait(self: Tree, debounce: float, stop: Event | None = None) -> set[Path]:  # ruff:ignore[unused-function-argument]
+        if stop is not None:  # no change while running
+            stop.wait()
+            return set()
+        if (found := next(changes, None)) is None:
+            raise KeyboardInterrupt
+        return found
+
+    mocker.patch.object(Tree, "wait", _wait)
+
+    outcome = project.run("w", "-e", "docs,lint")
+
+    outcome.assert_success()
+    assert re.findall(r"^  (\w+): OK", outcome.out, re.MULTILINE) == ["docs", "lint", "docs", "lint"]
+    assert outcome.out.count("watching") == 2
+
+
+def test_watch_interrupts_on_change(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    run = "import pathlib, time; pathlib.Path('started').touch(); time.sleep(60)"
+    slow = f'env_list = ["a"]\n[env.a]\npackage = "skip"\ncommands = [["python", "-c", "{run}"]]\n'
+    project = tox_project({"tox.toml": slow})
+    config, started = project.path / "tox.toml", project.path / "started"
+    rounds = iter([True])
+
+    def _wait(self: Tree, debounce: float, stop: Event | None = None) -> set[Path]:  # ruff:ignore[unused-function-argument]
+        if stop is None:
+            raise KeyboardInterrupt
+        if next(rounds, False):
+            while not started.exists() and not stop.wait(0.01):  # change files once the command runs
+                pass
+            config.write_text(slow.replace("time.sleep(60)", "print('fast')"))
+            return {config}
+        stop.wait()
+        return set()
+
+    mocker.patch.object(Tree, "wait", _wait)
+
+    outcome = project.run("w")
+
+    outcome.assert_success()
+    assert "tox.toml changed, interrupting the run" in outcome.out
+    assert "configuration changed, reloading it" in outcome.out
+    assert "fast" in outcome.out
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from tox.tox_env.python.pip.freeze import frozen, site_locations
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _dist(site: Path, name: str, version: str, direct_url: dict[str, Any] | str | None = None) -> None:
+    info = site / f"{name.replace('-', '_')}-{version}.dist-info"
+    info.mkdir(parents=True)
+    (info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+    if direct_url is not None:
+        text = direct_url if isinstance(direct_url, str) else json.dumps(direct_url)
+        (info / "direct_url.json").write_text(text)
+
+
+def test_frozen_name_version(tmp_path: Path) -> None:
+    site, other = tmp_path / "site", tmp_path / "other"
+    _dist(site, "Zeta", "2.0")
+    _dist(site, "alpha", "1.0.0-rc1")
+    _dist(other, "zeta", "1.0")  # later on the path, shadowed
+
+    assert frozen([site, other, tmp_path / "missing"]) == ["alpha==1.0.0rc1", "Zeta==2.0"]
+
+
+def test_frozen_direct_url(tmp_path: Path) -> None:
+    vcs = {"url": "https://example.com/a.git", "vcs_info": {"vcs": "git", "commit_id": "abc"}, "subdirectory": "s"}
+    archive = {"url": "https://example.com/b-1.0.tar.gz", "archive_info": {"hashes": {"sha256": "f00"}}}
+    legacy_hash = {"url": "file:///c-1.0.tar.gz", "archive_info": {"hash": "md5=ba5"}}
+    folder = {"url": "file:///src/d", "dir_info": {}}
+    for name, direct_url in (("a", vcs), ("b", archive), ("c", legacy_hash), ("d", folder)):
+        _dist(tmp_path, name, "1.0", direct_url)
+
+    assert frozen([tmp_path]) == [
+        "a @ git+https://example.com/a.git@abc#subdirectory=s",
+        "b @ https://example.com/b-1.0.tar.gz#sha256=f00",
+        "c @ file:///c-1.0.tar.gz#md5=ba5",
+        "d @ file:///src/d",
+    ]
+
+
+def test_frozen_editable(tmp_path: Path) -> None:
+    project = tmp_path / "project"
+    project.mkdir()
+    _dist(tmp_path / "site", "demo", "1.0", {"url": project.as_uri(), "dir_info": {"editable": True}})
+
+    assert frozen([tmp_path / "site"]) == [
+        "# Editable install with no version control (demo==1.0)",
+        f"-e {project}",
+    ]
+
+    (tmp_path / ".git").mkdir()  # pip asks git for the requirement
+
+    assert frozen([tmp_path / "site"]) is None
+
+
+def test_frozen_leaves_to_pip(tmp_path: Path) -> None:
+    _dist(tmp_path / "invalid", "a", "1.0", "{")
+    _dist(tmp_path / "two", "b", "1.0", {"url": "file:///b", "dir_info": {}, "archive_info": {}})
+    (tmp_path / "egg").mkdir()
+    (tmp_path / "egg" / "c.egg-link").write_text("/src/c\n.")
+    _dist(tmp_path / "version", "d", "not a version")
+
+    for folder in ("invalid", "two", "egg", "version"):
+        assert frozen([tmp_path / folder]) is None, folder
+
+
+def test_site_locations(tmp_path: Path) -> None:
+    site, added = tmp_path / "site", tmp_path / "added"
+    site.mkdir()
+    added.mkdir()
+    (site / "a.pth").write_text(f"# comment\n\nimport sys\n{added}\n../missing\n")
+
+    assert site_locations([site, site, tmp_path / "gone"]) == [site, added, tmp_path / "gone"]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+from zipfile import ZipFile
+
+import pytest
+from packaging.pylock import Package, PackageWheel
+from packaging.tags import Tag
+from packaging.utils import canonicalize_name
+from packaging.version import Version
+
+from tox.tox_env.python.pip.native import Scheme, install_wheels
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+TAGS = [Tag("py3", "none", "any")]
+
+
+def _wheel(folder: Path, files: dict[str, str], tag: str = "py3-none-any", entry_points: str = "") -> Path:
+    wheel = folder / f"demo-1.0-{tag}.whl"
+    folder.mkdir(parents=True, exist_ok=True)
+    with ZipFile(wheel, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+        archive.writestr("demo-1.0.dist-info/METADATA", "Metadata-Version: 2.1\nName: demo\nVersion: 1.0\n")
+        archive.writestr("demo-1.0.dist-info/WHEEL", "Wheel-Version: 1.0\nRoot-Is-Purelib: true\n")
+        if entry_points:
+            archive.writestr("demo-1.0.dist-info/entry_points.txt", entry_points)
+        archive.writestr("demo-1.0.dist-info/RECORD", "")
+    return wheel
+
+
+def _package(wheel: Path, digest: str | None = None) -> Package:
+    digest = digest or hashlib.sha256(wheel.read_bytes()).hexdigest()
+    locked = PackageWheel(url=f"https://files.example.com/{wheel.name}", hashes={"sha256": digest})
+    return Package(name=canonicalize_name("demo"), version=Version("1.0"), wheels=[locked])
+
+
+@pytest.fixture
+def scheme(tmp_path: Path) -> Scheme:
+    env = tmp_path / "env"
+    site = env / "lib" / "site-packages"
+    return Scheme(purelib=site, platlib=site, scripts=env / "bin", data=env, python=env / "bin" / "python")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="launchers are left to pip on Windows")
+def test_install_wheel(tmp_path: Path, scheme: Scheme) -> None:
+    files = {"demo/__init__.py": "def main():\n    return 0\n", "demo-1.0.data/scripts/run": "#!python\nprint(1)\n"}
+    entry_points = "[console_scripts]\ndemo = demo:main\nDemo-Admin = demo:main\n"
+    wheel = _wheel(tmp_path / "wheels", files, entry_points=entry_points)
+
+    left = install_wheels([_package(wheel)], tmp_path, [wheel.parent], scheme, TAGS)
+
+    assert left == []
+    assert (scheme.purelib / "demo" / "__init__.py").read_text() == files["demo/__init__.py"]
+    assert (scheme.scripts / "run").read_text() == f"#!{scheme.python}\nprint(1)\n"
+    launcher = (scheme.scripts / "demo").read_text()
+    assert launcher.startswith(f"#!{scheme.python}\n")
+    assert "from demo import main" in launcher
+    assert "Demo-Admin" in {path.name for path in scheme.scripts.iterdir()}  # entry point names keep their case
+    assert (scheme.purelib / "demo-1.0.dist-info" / "INSTALLER").read_text() == "tox\n"
+    with (scheme.purelib / "demo-1.0.dist-info" / "RECORD").open() as stream:
+        recorded = {row[0] for row in csv.reader(stream)}
+    assert {"demo/__init__.py", "../../bin/run", "../../bin/demo", "demo-1.0.dist-info/RECORD"} <= recorded
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="launchers are left to pip on Windows")
+def test_install_wheel_launcher_runs(tmp_path: Path, scheme: Scheme) -> None:
+    wheel = _wheel(
+        tmp_path / "wheels",
+        {"demo/__init__.py": "def main():\n    print('hi')\n"},
+        entry_points="[console_scripts]\ndemo = demo:main\n",
+    )
+    install_wheels([_package(wheel)], tmp_path, [wheel.parent], scheme, TAGS)
+
+    script = scheme.scripts / "demo"
+    env = {"PYTHONPATH": str(scheme.purelib)}
+    result = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, env=env, check=True)
+    assert result.stdout == "hi\n"
+
+
+def test_install_wheel_hash_mismatch(tmp_path: Path, scheme: Scheme) -> None:
+    wheel = _wheel(tmp_path / "wheels", {"demo/__init__.py": ""})
+    package = _package(wheel, digest="0" * 64)
+
+    assert install_wheels([package], tmp_path, [wheel.parent], scheme, TAGS) == [package]
+    assert not scheme.purelib.exists()
+
+
+def test_install_wheel_not_local(tmp_path: Path, scheme: Scheme) -> None:
+    wheel = _wheel(tmp_path / "wheels", {"demo/__init__.py": ""})
+    package = _package(wheel)
+
+    assert install_wheels([package], tmp_path, [tmp_path / "elsewhere"], scheme, TAGS) == [package]
+
+
+def test_install_wheel_lock_path(tmp_path: Path, scheme: Scheme) -> None:
+    wheel = _wheel(tmp_path / "wheels", {"demo/__init__.py": ""})
+    digest = hashlib.sha256(wheel.read_bytes()).hexdigest()
+    locked = PackageWheel(path=f"wheels/{wheel.name}", hashes={"sha256": digest})
+    package = Package(name=canonicalize_name("demo"), version=Version("1.0"), wheels=[locked])
+
+    assert install_wheels([package], tmp_path, [], scheme, TAGS) == []
+    assert (scheme.purelib / "demo" / "__init__.py").exists()
+
+
+def test_install_wheel_incompatible_tag(tmp_path: Path, scheme: Scheme) -> None:
+    wheel = _wheel(tmp_path / "wheels", {"demo/__init__.py": ""}, tag="cp399-cp399-win_arm64")
+    package = _package(wheel)
+
+    assert install_wheels([package], tmp_path, [wheel.parent], scheme, TAGS) == [package]
+
+
+def test_install_wheel_outside_of_env(tmp_path: Path, scheme: Scheme) -> None:
+    wheel = _wheel(tmp_path / "wheels", {"demo/__init__.py": "", "../../../escape.py": ""})
+    package = _package(wheel)
+
+    assert install_wheels([package], tmp_path, [wheel.parent], scheme, TAGS) == [package]
+    assert not (scheme.purelib / "demo").exists()
+    assert not (tmp_path / "escape.py").exists()
+
+
+def test_install_wheel_already_installed(tmp_path: Path, scheme: Scheme) -> None:
+    (scheme.purelib / "demo-0.9.dist-info").mkdir(parents=True)
+    wheel = _wheel(tmp_path / "wheels", {"demo/__init__.py": ""})
+    package = _package(wheel)
+
+    assert install_wheels([package], tmp_path, [wheel.parent], scheme, TAGS) == [package]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import sys
+from pathlib import Path
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock
@@ -11,8 +13,7 @@ from packaging.requirements import Requirement
 from tox.tox_env.errors import Fail
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
+    from tox.execute import ExecuteRequest
     from tox.pytest import CaptureFixture, SubRequest, ToxProject, ToxProjectCreator
 
 
@@ -166,6 +167,52 @@ def test_deps_remove_recreate(tox_project: ToxProjectCreator) -> None:
     assert execute_calls.call_count == 2
 
 
+@pytest.mark.skipif(sys.platform == "win32", reason="uses posix paths in the fake install")
+def test_deps_remove_uninstall(tox_project: ToxProjectCreator) -> None:
+    ini = "[testenv]\npackage=skip\nuninstall_removed_deps=true\ndeps=\n a\n b\n"
+    proj = tox_project({"tox.ini": ini})
+
+    def _install(request: ExecuteRequest) -> int | None:
+        if request.run_id == "install_deps":
+            site_packages = next(Path(request.env["VIRTUAL_ENV"]).glob("lib/*/site-packages"))
+            for name, requires in {"a": ["c"], "b": ["c", "d"], "c": [], "d": []}.items():
+                dist_info = site_packages / f"{name}-1.dist-info"
+                dist_info.mkdir(exist_ok=True)
+                deps = "".join(f"Requires-Dist: {req}\n" for req in requires)
+                (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1\n{deps}")
+        return 0
+
+    execute_calls = proj.patch_execute(_install)
+    proj.run("r").assert_success()
+    execute_calls.reset_mock()
+
+    (proj.path / "tox.ini").write_text(ini.replace(" b\n", ""))
+    result = proj.run("r")
+
+    result.assert_success()
+    assert "py: requirements removed: b, uninstall b, d" in result.out, result.out
+    assert "recreate env" not in result.out
+    assert [i[0][3].cmd for i in execute_calls.call_args_list] == [
+        ["python", "-I", "-m", "pip", "uninstall", "--yes", "b", "d"],
+        ["python", "-I", "-m", "pip", "install", "a"],
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses posix paths in the fake install")
+def test_deps_remove_uninstall_cannot_tell(tox_project: ToxProjectCreator) -> None:
+    ini = "[testenv]\npackage=skip\nuninstall_removed_deps=true\ndeps=\n a\n b\n"
+    proj = tox_project({"tox.ini": ini})
+    execute_calls = proj.patch_execute(lambda request: 0)  # ruff:ignore[unused-lambda-argument]
+    proj.run("r").assert_success()
+
+    (proj.path / "tox.ini").write_text(ini.replace(" b\n", ""))
+    result = proj.run("r")
+
+    result.assert_success()
+    assert "py: recreate env because requirements removed: b" in result.out, result.out
+    assert execute_calls.call_count == 2
+
+
 def test_pkg_dep_remove_recreate(tox_project: ToxProjectCreator, demo_pkg_inline: Path) -> None:
     build = (demo_pkg_inline / "build.py").read_text()
     build_with_dep = build.replace("Summary: UNKNOWN\n", "Summary: UNKNOWN\n        Requires-Dist: wheel\n")
@@ -419,20 +466,16 @@ def test_constrain_package_deps(
     execute_calls = proj.patch_execute(lambda r: 0 if "install" in r.run_id else None)
     result_first = proj.run("r")
     result_first.assert_success()
-    exp_run_ids = ["install_deps"]
-    if constrain_package_deps and use_frozen_constraints:
-        exp_run_ids.append("freeze")
-    exp_run_ids.extend(
-        [
-            "install_requires",
-            "_optional_hooks",
-            "get_requires_for_build_wheel",
-            "build_wheel",
-            "install_package_deps",
-            "install_package",
-            "_exit",
-        ],
-    )
+    exp_run_ids = [
+        "install_deps",
+        "install_requires",
+        "_optional_hooks",
+        "get_requires_for_build_wheel",
+        "build_wheel",
+        "install_package_deps",
+        "install_package",
+        "_exit",
+    ]
     run_ids = [i[0][3].run_id for i in execute_calls.call_args_list]
     assert run_ids == exp_run_ids
     constraints_file = proj.path / ".tox" / "py" / "constraints.txt"
@@ -576,3 +619,47 @@ def test_change_constraint_options_recreates(tox_project: ToxProjectCreator, con
     result_second.assert_success()
     assert "recreate env because constraint options changed" in result_second.out
     assert conf_key in result_second.out
+
+
+def test_merge_installs_single_invocation(tox_project: ToxProjectCreator, demo_pkg_inline: Path) -> None:
+    build = (demo_pkg_inline / "build.py").read_text()
+    build_with_dep = build.replace("Summary: UNKNOWN\n", "Summary: UNKNOWN\n        Requires-Dist: wheel\n")
+    proj = tox_project(
+        {
+            "tox.ini": "[testenv]\npackage=wheel\ndeps=a\nmerge_installs=true",
+            "pyproject.toml": (demo_pkg_inline / "pyproject.toml").read_text(),
+            "build.py": build_with_dep,
+        },
+    )
+    execute_calls = proj.patch_execute(lambda r: 0 if "install" in r.run_id else None)
+
+    result_first = proj.run("r")
+    result_first.assert_success()
+    installs = [i[0][3] for i in execute_calls.call_args_list if "install" in i[0][3].run_id]
+    assert [i.run_id for i in installs] == ["install_deps+package_deps+package"]
+    assert installs[0].cmd[-3:-1] == ["a", "wheel"]
+    assert installs[0].cmd[-1].endswith(".whl")
+    execute_calls.reset_mock()
+
+    result_second = proj.run("r")
+    result_second.assert_success()
+    run_ids = [i[0][3].run_id for i in execute_calls.call_args_list if "install" in i[0][3].run_id]
+    assert run_ids == ["install_package"]
+
+
+def test_merge_installs_not_with_constraints(tox_project: ToxProjectCreator, demo_pkg_inline: Path) -> None:
+    proj = tox_project(
+        {
+            "tox.ini": "[testenv]\npackage=wheel\ndeps=a\nconstraints=c.txt\nmerge_installs=true",
+            "c.txt": "b<2",
+            "pyproject.toml": (demo_pkg_inline / "pyproject.toml").read_text(),
+            "build.py": (demo_pkg_inline / "build.py").read_text(),
+        },
+    )
+    execute_calls = proj.patch_execute(lambda r: 0 if "install" in r.run_id else None)
+
+    result = proj.run("r")
+
+    result.assert_success()
+    run_ids = [i[0][3].run_id for i in execute_calls.call_args_list if "install" in i[0][3].run_id]
+    assert run_ids == ["install_deps", "install_package"]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox.tox_env.python.pip.prune import unreachable
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _dist(site_packages: Path, name: str, *requires: str) -> None:
+    dist_info = site_packages / f"{name}-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    metadata = "".join(f"Requires-Dist: {req}\n" for req in requires)
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n{metadata}")
+
+
+@pytest.fixture
+def site_packages(tmp_path: Path) -> Path:
+    _dist(tmp_path, "a", "c")
+    _dist(tmp_path, "b", "c", "d>1", "E; python_version < '3'")
+    _dist(tmp_path, "c")
+    _dist(tmp_path, "d", "pip")
+    _dist(tmp_path, "e")
+    _dist(tmp_path, "pip")
+    return tmp_path
+
+
+def test_unreachable_keeps_shared(site_packages: Path) -> None:
+    assert unreachable([site_packages], ["b>=1"], ["a"]) == ["b", "d", "e"]
+
+
+def test_unreachable_still_required(site_packages: Path) -> None:
+    assert unreachable([site_packages], ["b==1"], ["a", "b>1"]) == []
+
+
+def test_unreachable_removed_not_installed(site_packages: Path) -> None:
+    assert unreachable([site_packages], ["missing"], ["a"]) == []
+
+
+@pytest.mark.parametrize(
+    ("removed", "kept"),
+    [
+        pytest.param(["b"], ["missing"], id="kept-not-installed"),
+        pytest.param(["./local"], ["a"], id="removed-path"),
+        pytest.param(["b"], ["-e ./local"], id="kept-editable"),
+    ],
+)
+def test_unreachable_cannot_tell(site_packages: Path, removed: list[str], kept: list[str]) -> None:
+    assert unreachable([site_packages], removed, kept) is None
+
+
+def test_unreachable_duplicate_metadata(site_packages: Path) -> None:
+    (site_packages / "c-1.0.dist-info").rename(site_packages / "c-2.0.dist-info")
+    _dist(site_packages, "c")
+    assert unreachable([site_packages], ["b"], ["a"]) is None
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox.tox_env.python.pip import snapshot
+from tox.tox_env.python.pip.snapshot import SnapshotStore
+
+if TYPE_CHECKING:
+    from tox.execute import ExecuteRequest
+    from tox.pytest import ToxProjectCreator
+
+
+def _env(root: Path) -> Path:
+    (root / "lib" / "site-packages").mkdir(parents=True)
+    (root / "bin").mkdir()
+    (root / "bin" / "python").symlink_to(sys.executable)
+    (root / "bin" / "pip").write_text(f"#!{root}/bin/python\nfresh\n")
+    return root
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path / "store", 2**20)
+    source = _env(tmp_path / "a")
+    (source / "lib" / "site-packages" / "magic.py").write_text("magic = 1")
+    (source / "bin" / "tool").write_text(f"#!{source}/bin/python\n")
+    (source / "bin" / "pip").write_text(f"#!{source}/bin/python\nupgraded\n")
+    digest = store.digest({"deps": ["magic"]})
+
+    store.save(digest, source, [source / "lib" / "site-packages", source / "bin"])
+    target = _env(tmp_path / "b")
+
+    assert store.restore(digest, target) is True
+    assert (target / "lib" / "site-packages" / "magic.py").read_text() == "magic = 1"
+    assert (target / "bin" / "tool").read_text() == f"#!{target}/bin/python\n"
+    assert (target / "bin" / "pip").read_text() == f"#!{target}/bin/python\nupgraded\n"
+    assert (target / "bin" / "python").readlink() == Path(sys.executable)
+
+
+def test_snapshot_relocates_references_to_the_environment(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path / "store", 2**20)
+    source = _env(tmp_path / "a")
+    site_packages = source / "lib" / "site-packages"
+    (source / "lib" / "extra").mkdir()
+    (source / "lib" / "extra" / "magic.py").write_text("magic = 1")
+    (site_packages / "extra.pth").write_text(f"{source / 'lib' / 'extra'}\n")
+    (site_packages / "__pycache__").mkdir()
+    (site_packages / "__pycache__" / "magic.pyc").write_bytes(f"\0{source}".encode())
+    store.save("digest", source, [source / "lib", source / "bin"])
+    target = _env(tmp_path / "b")
+
+    assert store.restore("digest", target) is True
+    shutil.rmtree(source)
+
+    target_site = str(target / "lib" / "site-packages")
+    cmd = [sys.executable, "-c", f"import site; site.addsitedir({target_site!r}); import magic"]
+    assert subprocess.run(cmd, check=False).returncode == 0
+    assert not (target / "lib" / "site-packages" / "__pycache__" / "magic.pyc").exists()
+
+
+def test_snapshot_not_stored_when_binaries_refer_to_the_environment(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path / "store", 2**20)
+    source = _env(tmp_path / "a")
+    (source / "bin" / "tool.exe").write_bytes(f"MZ\0#!{source}/bin/python".encode())
+
+    store.save("digest", source, [source / "bin"])
+
+    assert store.restore("digest", _env(tmp_path / "b")) is False
+
+
+def test_snapshot_restore_missing(tmp_path: Path) -> None:
+    target = _env(tmp_path / "b")
+    assert SnapshotStore(tmp_path / "store", 2**20).restore("missing", target) is False
+
+
+def test_snapshot_evicts_least_recently_used(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path / "store", 3500)
+    source = _env(tmp_path / "a")
+    folders = [source / "lib" / "site-packages"]
+    for at, name in enumerate(("old", "stale", "new")):
+        (source / "lib" / "site-packages" / "data").write_text(name * (1000 // len(name)))
+        store.save(name, source, folders)
+        os.utime(tmp_path / "store" / name / "meta.json", (at, at))
+    store.restore("old", _env(tmp_path / "b"))  # makes it the most recently used one
+    (store.root / "stale.install.lock").write_text("")
+    (store.root / "failed.install.lock").write_text("")  # an install that stored no snapshot
+
+    (source / "lib" / "site-packages" / "data").write_text("x" * 1000)
+    store.save("newest", source, folders)
+
+    assert sorted(p.name for p in store.root.iterdir() if p.is_dir()) == ["new", "newest", "old"]
+    assert sorted(p.name for p in store.root.glob("*.lock")) == ["new.lock", "newest.lock", "old.lock"]
+    assert json.loads((store.root / "newest" / "meta.json").read_text())["folders"] == ["lib/site-packages"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses posix paths in the fake install")
+def test_deps_restored_from_snapshot(tox_project: ToxProjectCreator, tmp_path: Path) -> None:
+    ini = f"[tox]\nenv_list = a, b\ndeps_snapshot_dir = {tmp_path / 'store'}\n[testenv]\npackage = skip\n"
+    ini += "deps = magic\ndeps_snapshot = true\n"
+    project = tox_project({"tox.ini": ini})
+
+    def _install(request: ExecuteRequest) -> int | None:
+        if request.run_id != "install_deps":
+            return None
+        env_dir = Path(request.env["VIRTUAL_ENV"])
+        next(env_dir.glob("lib/*/site-packages")).joinpath("magic.py").write_text("")
+        return 0
+
+    execute_calls = project.patch_execute(_install)
+
+    outcome = project.run("r")
+
+    outcome.assert_success()
+    assert [i[0][3].run_id for i in execute_calls.call_args_list] == ["install_deps"]
+    assert "b: restored deps from snapshot" in outcome.out
+    assert next((project.path / ".tox" / "b").glob("lib/*/site-packages/magic.py")).exists()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses posix paths in the fake install")
+def test_parallel_envs_share_install(tox_project: ToxProjectCreator) -> None:
+    ini = "[tox]\nenv_list = a, b, c\n[testenv]\npackage = skip\ndeps = magic\n"
+    project = tox_project({"tox.ini": ini})
+
+    def _install(request: ExecuteRequest) -> int | None:
+        if request.run_id != "install_deps":
+            return None
+        for _ in range(200):  # the others wait for this install
+            if sum(snapshot._WAITING.values()) == 2:  # ruff:ignore[private-member-access]
+                break
+            time.sleep(0.05)
+        next(Path(request.env["VIRTUAL_ENV"]).glob("lib/*/site-packages")).joinpath("magic.py").write_text("")
+        return 0
+
+    execute_calls = project.patch_execute(_install)
+
+    outcome = project.run("p", "-p", "3")
+
+    outcome.assert_success()
+    assert [i[0][3].run_id for i in execute_calls.call_args_list] == ["install_deps"]
+    for name in "abc":
+        assert next((project.path / ".tox" / name).glob("lib/*/site-packages/magic.py")).exists()
+    assert not list((project.path / ".tox" / ".tmp").glob("installs-*"))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses posix paths in the fake install")
+@pytest.mark.parametrize(
+    "extra",
+    [
+        pytest.param("set_env = CFLAGS = -O{env_name}\n", id="set_env"),
+        pytest.param("coalesce_installs = false\n", id="disabled"),
+    ],
+)
+def test_parallel_envs_install_on_their_own(tox_project: ToxProjectCreator, extra: str) -> None:
+    ini = f"[tox]\nenv_list = a, b\n[testenv]\npackage = skip\ndeps = magic\n{extra}"
+    project = tox_project({"tox.ini": ini})
+    running: list[str] = []
+
+    def _install(request: ExecuteRequest) -> int | None:
+        if request.run_id != "install_deps":
+            return None
+        running.append(request.env["TOX_ENV_NAME"])
+        for _ in range(200):  # a coalesced install would leave the other waiting instead of installing
+            if len(running) == 2:
+                break
+            time.sleep(0.05)
+        return 0
+
+    execute_calls = project.patch_execute(_install)
+
+    outcome = project.run("p", "-p", "2")
+
+    outcome.assert_success()
+    assert [i[0][3].run_id for i in execute_calls.call_args_list] == ["install_deps", "install_deps"]
+    assert "copied deps" not in outcome.out
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses posix paths in the fake install")
+def test_restored_env_independent_of_snapshot_env(tox_project: ToxProjectCreator, tmp_path: Path) -> None:
+    ini = f"[tox]\nenv_list = a, b\ndeps_snapshot_dir = {tmp_path / 'store'}\n[testenv]\npackage = skip\n"
+    ini += "deps = magic\ndeps_snapshot = true\ncommands = python -c 'import magic; print(magic.__file__)'\n"
+    project = tox_project({"tox.ini": ini})
+
+    def _install(request: ExecuteRequest) -> int | None:  # a .pth file adding a folder of the environment
+        if request.run_id != "install_deps":
+            return None
+        env_dir = Path(request.env["VIRTUAL_ENV"])
+        (env_dir / "extra").mkdir()
+        (env_dir / "extra" / "magic.py").write_text("")
+        next(env_dir.glob("lib/*/site-packages")).joinpath("extra.pth").write_text(f"{env_dir / 'extra'}\n")
+        return 0
+
+    project.patch_execute(_install)
+    project.run("r", "-e", "a").assert_success()
+    shutil.rmtree(project.path / ".tox" / "a")
+
+    outcome = project.run("r", "-e", "b")
+
+    outcome.assert_success()
+    assert "b: restored deps from snapshot" in outcome.out
+    assert str(project.path / ".tox" / "b" / "extra" / "magic.py") in outcome.out
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from packaging.requirements import Requirement
+from packaging.tags import sys_tags
+
+from tox.tox_env.python.pip import wheelhouse
+from tox.tox_env.python.pip.wheelhouse import Wheelhouse
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+    from tox.pytest import ToxProjectCreator
+
+
+def _built(cache: Path, name: str, content: bytes = b"wheel") -> str:
+    filename = f"{name}-1.0-py3-none-any.whl"
+    folder = cache / name
+    folder.mkdir(parents=True)
+    (folder / filename).write_bytes(content)
+    digest = hashlib.sha256(content).hexdigest()
+    return (
+        f"  Created wheel for {name}: filename={filename} size={len(content)} sha256={digest}\n"
+        f"  Stored in directory: {folder}\n"
+    )
+
+
+def test_wheelhouse_capture(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path / "house")
+    output = f"Collecting a\n{_built(tmp_path / 'cache', 'a')}Successfully installed a-1.0\n"
+
+    taken = house.capture(output)
+
+    assert taken == [tmp_path / "house" / "a-1.0-py3-none-any.whl"]
+    assert taken[0].read_bytes() == b"wheel"
+    assert house.capture(output) == []  # already held
+
+
+def test_wheelhouse_capture_skips_direct(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path / "house")
+    output = (
+        "Collecting b @ git+https://example.com/b\n"
+        f"{_built(tmp_path / 'cache', 'b')}"
+        f"Processing ./dist/c-1.0.tar.gz\n{_built(tmp_path / 'cache', 'c')}"
+    )
+
+    assert house.capture(output, ["b-dep", "dist/c-1.0.tar.gz"]) == []
+
+
+def test_wheelhouse_capture_vcs(tmp_path: Path) -> None:
+    house, site, commit = Wheelhouse(tmp_path / "house"), tmp_path / "site", "c" * 40
+    info = site / "b-1.0.dist-info"
+    info.mkdir(parents=True)
+    (info / "METADATA").write_text("Metadata-Version: 2.1\nName: b\nVersion: 1.0\n")
+    direct_url = {"url": "https://example.com/b", "vcs_info": {"vcs": "git", "commit_id": commit}}
+    (info / "direct_url.json").write_text(json.dumps(direct_url))
+    output = f"Collecting b @ git+https://example.com/b@{commit}\n{_built(tmp_path / 'cache', 'b')}"
+
+    taken = house.capture(output, site_packages=[site])
+
+    assert taken == [tmp_path / "house" / "vcs" / f"b-{commit}" / "b-1.0-py3-none-any.whl"]
+    assert [wheel.path for wheel in house.wheels()] == taken
+
+
+GIT = shutil.which("git")
+
+
+@pytest.mark.skipif(GIT is None, reason="needs git")
+def test_wheelhouse_pin_vcs(tmp_path: Path) -> None:
+    assert GIT is not None
+    repo = tmp_path / "repo"
+    subprocess.run([GIT, "init", "-q", "-b", "main", str(repo)], check=True)
+    env = {**os.environ, "GIT_AUTHOR_NAME": "a", "GIT_AUTHOR_EMAIL": "a@b", "GIT_COMMITTER_NAME": "a"}
+    env["GIT_COMMITTER_EMAIL"] = "a@b"
+    subprocess.run([GIT, "-C", str(repo), "commit", "-q", "--allow-empty", "-m", "init"], check=True, env=env)
+    commit = subprocess.run([GIT, "-C", str(repo), "rev-parse", "HEAD"], check=True, capture_output=True, text=True)
+    sha = commit.stdout.strip()
+    house, tags = Wheelhouse(tmp_path / "house"), list(sys_tags())
+    args = ["-r", "req.txt", "a", f"b @ git+{repo.as_uri()}@main", "c @ git+file:///missing@main"]
+
+    assert house.pin_vcs(args, tags) == [*args[:3], str(Requirement(f"b @ git+{repo.as_uri()}@{sha}")), args[4]]
+
+    folder = house.root / "vcs" / f"b-{sha}"
+    folder.mkdir(parents=True)
+    (folder / "b-1.0-xx3-none-any.whl").write_bytes(b"w")  # not installable by this interpreter
+    (folder / "b-1.0-py3-none-any.whl").write_bytes(b"w")
+
+    wheel = (folder / "b-1.0-py3-none-any.whl").as_uri()
+    assert house.pin_vcs(args[3:4], tags) == [str(Requirement(f"b @ {wheel}"))]
+
+
+def test_wheelhouse_pin_vcs_resolves_once(tmp_path: Path, mocker: MockerFixture) -> None:
+    listed = f"{'a' * 40}\trefs/heads/main\n"
+    run = mocker.patch.object(wheelhouse.subprocess, "run", return_value=subprocess.CompletedProcess([], 0, listed))
+    house, arg = Wheelhouse(tmp_path / "house"), "b @ git+https://example.com/b.git@main"
+    wheelhouse.clear_resolved()
+
+    assert house.pin_vcs([arg], []) == house.pin_vcs([arg], [])
+
+    assert run.call_count == 1
+    kwargs = run.call_args.kwargs
+    assert kwargs["stdin"] is subprocess.DEVNULL
+    assert kwargs["env"]["GIT_TERMINAL_PROMPT"] == "0"
+    assert kwargs["timeout"] > 0
+    wheelhouse.clear_resolved()
+    house.pin_vcs([arg], [])
+    assert run.call_count == 2
+
+
+def test_wheelhouse_capture_hash_mismatch(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path / "house")
+    output = _built(tmp_path / "cache", "a")
+    (tmp_path / "cache" / "a" / "a-1.0-py3-none-any.whl").write_bytes(b"changed")
+
+    assert house.capture(output) == []
+
+
+def test_wheelhouse_capture_cache_disabled(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path / "house")
+    output = _built(tmp_path / "cache", "a")
+    (tmp_path / "cache" / "a" / "a-1.0-py3-none-any.whl").unlink()
+
+    assert house.capture(output) == []
+    assert not house.root.exists()
+
+
+def test_wheelhouse_select_and_prune(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path)
+    for name in ("old", "new", "Mixed_Case"):
+        (tmp_path / f"{name}-1.0-py3-none-any.whl").write_bytes(b"w")
+    (tmp_path / "not-a-wheel.whl").write_bytes(b"w")
+    day_ago = time.time() - 24 * 3600
+    os.utime(tmp_path / "old-1.0-py3-none-any.whl", (day_ago, day_ago))
+
+    assert [wheel.path.name for wheel in house.select(older_than=3600)] == ["old-1.0-py3-none-any.whl"]
+    assert [wheel.path.name for wheel in house.select(names=["mixed-case"])] == ["Mixed_Case-1.0-py3-none-any.whl"]
+
+    removed = house.prune(older_than=3600)
+
+    assert [wheel.path.name for wheel in removed] == ["old-1.0-py3-none-any.whl"]
+    assert sorted(wheel.path.name for wheel in house.wheels()) == [
+        "Mixed_Case-1.0-py3-none-any.whl",
+        "new-1.0-py3-none-any.whl",
+    ]
+
+
+def test_wheelhouse_find_links(tox_project: ToxProjectCreator) -> None:
+    proj = tox_project({"tox.ini": "[testenv]\npackage=skip\nwheelhouse=true\ndeps=a\ncommands=python -c 'print(1)'"})
+    execute_calls = proj.patch_execute(lambda r: 0 if "install" in r.run_id else None)
+
+    result = proj.run("r")
+
+    result.assert_success()
+    cmd = execute_calls.call_args_list[-2][0][3].cmd
+    assert cmd[-3:] == ["a", "--find-links", str(proj.path / ".tox" / ".wheelhouse")]
+
+
+def test_cache_list_and_prune(tox_project: ToxProjectCreator) -> None:
+    proj = tox_project({"tox.ini": ""})
+    house = proj.path / ".tox" / ".wheelhouse"
+    house.mkdir(parents=True)
+    (house / "a-1.0-py3-none-any.whl").write_bytes(b"w" * 2048)
+
+    listed = proj.run("cache")
+
+    listed.assert_success()
+    assert "a-1.0-py3-none-any.whl  2.0 KiB  0.0 days old" in listed.out
+    assert f"1 wheel(s) (2.0 KiB) in {house}" in listed.out
+
+    kept = proj.run("cache", "--prune", "--older-than", "1")
+
+    kept.assert_success()
+    assert "removed 0 wheel(s)" in kept.out
+
+    pruned = proj.run("cache", "--prune", "a")
+
+    pruned.assert_success()
+    assert "removed 1 wheel(s) (2.0 KiB)" in pruned.out
+    assert not (house / "a-1.0-py3-none-any.whl").exists()
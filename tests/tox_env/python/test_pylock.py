@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import sys
+from pathlib import Path
 from textwrap import dedent
 from typing import TYPE_CHECKING
+from zipfile import ZipFile
 
 import pytest
 
@@ -10,8 +13,6 @@ from tox.tox_env.errors import Fail
 from tox.tox_env.python.pylock import Pylock
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from tox.pytest import ToxProject, ToxProjectCreator
 
 PYLOCK_TOML = dedent("""\
@@ -609,3 +610,32 @@ def test_pylock_reinstall_on_resolution_env_change(tox_project: ToxProjectCreato
 
     result_second.assert_success()
     assert len(execute_calls.call_args_list) == 1
+
+
+def test_pylock_native_install(tox_project: ToxProjectCreator, pylock_run_base: str) -> None:
+    wheels = {"alpha-1.0.0-py3-none-any.whl": "alpha", "beta-2.0.0-py3-none-any.whl": "beta"}
+    native = 'pylock_native_install = true\npylock_wheel_dirs = ["w"]\n'
+    project = tox_project({"tox.toml": f"{pylock_run_base}{native}"})
+    (project.path / "w").mkdir()
+    lock = 'lock-version = "1.0"\ncreated-by = "test-tool"\n'
+    for filename, name in wheels.items():
+        version = filename.split("-")[1]
+        with ZipFile(project.path / "w" / filename, "w") as archive:
+            archive.writestr(f"{name}.py", "")
+            archive.writestr(f"{name}-{version}.dist-info/METADATA", f"Name: {name}\nVersion: {version}\n")
+            archive.writestr(f"{name}-{version}.dist-info/WHEEL", "Wheel-Version: 1.0\nRoot-Is-Purelib: true\n")
+        digest = hashlib.sha256((project.path / "w" / filename).read_bytes()).hexdigest()
+        lock += f'[[packages]]\nname = "{name}"\nversion = "{version}"\n[[packages.wheels]]\n'
+        lock += f'url = "https://files.example.com/{filename}"\nhashes = {{ sha256 = "{digest}" }}\n'
+    lock += '[[packages]]\nname = "gamma"\nversion = "3.0.0"\n[[packages.wheels]]\n'
+    lock += 'url = "https://files.example.com/gamma-3.0.0-py3-none-any.whl"\nhashes = { sha256 = "abc" }\n'
+    (project.path / "pylock.toml").write_text(lock)
+    execute_calls = project.patch_execute()
+
+    result = project.run("r", "-e", "py")
+
+    result.assert_success()
+    assert [i[0][3].run_id for i in execute_calls.call_args_list] == ["install_pylock"]
+    assert _pylock_txt(project) == "gamma==3.0.0 --hash=sha256:abc"
+    site = Path(execute_calls.call_args_list[0][0][0].env_site_package_dir())
+    assert {p.name for p in site.glob("*.dist-info")} >= {"alpha-1.0.0.dist-info", "beta-2.0.0.dist-info"}
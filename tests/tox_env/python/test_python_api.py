@@ -633,8 +633,11 @@ def test_python_spec_for_path(
 ) -> None:
     info = SimpleNamespace(
         implementation=impl,
-        version_info=SimpleNamespace(major=major, minor=minor, micro=5),
+        version_info=SimpleNamespace(major=major, minor=minor, micro=5, releaselevel="final", serial=0),
+        version=f"{major}.{minor}.5",
         architecture=arch,
+        platform="linux",
+        system_executable="/does/not/matter",
         free_threaded=free_threaded,
         debug_build=debug_build,
         machine=machine,
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import TYPE_CHECKING
+
+from filelock import FileLock
+
+from tox.tox_env.python.virtual_env.package import build_cache
+from tox.tox_env.python.virtual_env.package.build_cache import BuildCache, source_digest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tox.pytest import MonkeyPatch
+
+
+def test_build_cache_store_and_load(tmp_path: Path) -> None:
+    wheel = tmp_path / "demo-1.0-py3-none-any.whl"
+    wheel.write_bytes(b"wheel")
+    cache = BuildCache(tmp_path / "cache")
+    digest = cache.digest({"source": "abc"})
+
+    assert cache.load(digest) is None
+    with cache.exclusive(digest):
+        sha256 = cache.store(digest, wheel, {"metadata": {"name": "demo"}})
+
+    assert sha256 == hashlib.sha256(b"wheel").hexdigest()
+    found = cache.load(digest)
+    assert found is not None
+    path, meta = found
+    assert path.read_bytes() == b"wheel"
+    assert meta == {"file": wheel.name, "metadata": {"name": "demo"}, "sha256": sha256}
+
+
+def test_build_cache_evicts_least_recently_used(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(build_cache, "MAX_ENTRIES", 2)
+    wheel = tmp_path / "demo-1.0-py3-none-any.whl"
+    wheel.write_bytes(b"wheel")
+    cache = BuildCache(tmp_path / "cache")
+    for at, digest in enumerate(("a", "b")):
+        cache.store(digest, wheel, {})
+        os.utime(cache.root / digest / "meta.json", (at, at))
+    assert cache.load("a") is not None  # used, now the most recent
+
+    cache.store("c", wheel, {})
+
+    assert sorted(path.name for path in cache.root.iterdir()) == ["a", "c"]  # no lock of the evicted one left
+
+
+def test_build_cache_sweeps_orphan_locks(tmp_path: Path) -> None:
+    wheel = tmp_path / "demo-1.0-py3-none-any.whl"
+    wheel.write_bytes(b"wheel")
+    cache = BuildCache(tmp_path / "cache")
+    cache.root.mkdir()
+    (cache.root / "failed.lock").write_text("")  # a build that kept nothing
+
+    with FileLock(cache.root / "building.lock"), cache.exclusive("a"):
+        cache.store("a", wheel, {})
+
+    assert sorted(path.name for path in cache.root.iterdir()) == ["a", "a.lock", "building.lock"]
+
+
+def test_source_digest(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("a")
+    (tmp_path / ".tox").mkdir()
+    (tmp_path / ".tox" / "log").write_text("1")
+    first = source_digest(tmp_path, [tmp_path / ".tox"])
+
+    (tmp_path / ".tox" / "log").write_text("2")
+    (tmp_path / "src" / "__pycache__").mkdir()
+    (tmp_path / "src" / "__pycache__" / "a.pyc").write_bytes(b"\0")
+    for folder in ("build/lib", "dist", "src/demo.egg-info", "venv"):
+        (tmp_path / folder).mkdir(parents=True)
+        (tmp_path / folder / "PKG-INFO").write_text("built")
+    (tmp_path / "venv" / "pyvenv.cfg").write_text("home = /usr/bin")
+    assert source_digest(tmp_path, [tmp_path / ".tox"]) == first
+
+    (tmp_path / "src" / "a.py").write_text("b")
+    assert source_digest(tmp_path, [tmp_path / ".tox"]) != first
@@ -740,3 +740,47 @@ def test_build_wheel_via_sdist_restores_root(tox_project: ToxProjectCreator, dem
     result.assert_success()
     pkg = cast("pyproject_pkg.Pep517VenvPackager", result.state.envs[".pkg"])
     assert pkg.root == pkg.conf["package_root"]
+
+
+def test_package_cache_reuses_build(tox_project: ToxProjectCreator, demo_pkg_inline: Path) -> None:
+    ini = "[testenv]\npackage=wheel\n[testenv:.pkg]\npackage_cache=true"
+    proj = tox_project({"tox.ini": ini}, base=demo_pkg_inline)
+    execute_calls = proj.patch_execute(lambda r: 0 if "install" in r.run_id else None)
+
+    first = proj.run("r", "--notest")
+
+    first.assert_success()
+    assert (".pkg", "build_wheel") in [(i[0][0].conf.name, i[0][3].run_id) for i in execute_calls.call_args_list]
+    execute_calls.reset_mock()
+
+    second = proj.run("r", "--notest", "--result-json", str(proj.path / "out.json"))
+
+    second.assert_success()
+    assert "reuse demo_pkg_inline-1.0.0-py3-none-any.whl built from the same inputs" in second.out
+    found_calls = [(i[0][0].conf.name, i[0][3].run_id) for i in execute_calls.call_args_list]
+    assert found_calls == [("py", "install_package")]
+    installed = json.loads((proj.path / "out.json").read_text())["testenvs"]["py"]["installpkg"]
+    cached = next((proj.path / ".tox" / ".package-cache").glob("*/meta.json"))
+    assert installed["sha256"] == json.loads(cached.read_text())["sha256"]
+
+    (proj.path / "build.py").write_text((proj.path / "build.py").read_text() + "\n")
+    execute_calls.reset_mock()
+
+    changed = proj.run("r", "--notest")
+
+    changed.assert_success()
+    assert (".pkg", "build_wheel") in [(i[0][0].conf.name, i[0][3].run_id) for i in execute_calls.call_args_list]
+
+
+def test_package_cache_reads_sources_once(
+    tox_project: ToxProjectCreator, demo_pkg_inline: Path, mocker: MockerFixture
+) -> None:
+    ini = "[tox]\nenv_list = a, b\n[testenv]\npackage=wheel\n[testenv:.pkg]\npackage_cache=true"
+    proj = tox_project({"tox.ini": ini}, base=demo_pkg_inline)
+    proj.patch_execute(lambda r: 0 if "install" in r.run_id else None)
+    digest = mocker.spy(pyproject_pkg, "source_digest")
+
+    result = proj.run("r", "--notest")
+
+    result.assert_success()
+    assert digest.call_count == 1
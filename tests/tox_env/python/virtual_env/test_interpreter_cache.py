@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tox.tox_env.python.api import PythonInfo, VersionInfo
+from tox.tox_env.python.virtual_env import api
+from tox.tox_env.python.virtual_env.api import VirtualEnv
+from tox.tox_env.python.virtual_env.interpreter_cache import InterpreterCache, interpreter_cache
+from tox.tox_env.python.virtual_env.subprocess_adapter import probe_python
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _info(executable: Path) -> PythonInfo:
+    return PythonInfo(
+        implementation="CPython",
+        version_info=VersionInfo(3, 13, 1, "final", 0),
+        version="3.13.1 (main)",
+        is_64=True,
+        platform="linux",
+        extra={"executable": executable},
+        machine="x86_64",
+    )
+
+
+def test_interpreter_cache_persists(tmp_path: Path) -> None:
+    executable = tmp_path / "python"
+    executable.write_text("")
+    InterpreterCache(tmp_path / "cache").put(executable, _info(executable))
+
+    assert InterpreterCache(tmp_path / "cache").get(executable) == _info(executable)
+
+
+def test_interpreter_cache_changed_binary(tmp_path: Path) -> None:
+    executable = tmp_path / "python"
+    executable.write_text("")
+    cache = InterpreterCache(tmp_path / "cache")
+    cache.put(executable, _info(executable))
+
+    os.utime(executable, ns=(1, 1))
+
+    assert cache.get(executable) is None
+    assert InterpreterCache(tmp_path / "cache").get(executable) is None
+
+
+def test_interpreter_cache_resolves_links(tmp_path: Path) -> None:
+    executable = tmp_path / "python3.13"
+    executable.write_text("")
+    (tmp_path / "python").symlink_to(executable)
+    cache = InterpreterCache(None)
+
+    cache.put(tmp_path / "python", _info(executable))
+
+    assert cache.get(executable) == _info(executable)
+
+
+def test_interpreter_cache_missing_binary(tmp_path: Path) -> None:
+    cache = InterpreterCache(tmp_path / "cache")
+    cache.put(tmp_path / "python", _info(tmp_path / "python"))
+
+    assert cache.get(tmp_path / "python") is None
+    assert not (tmp_path / "cache").exists()
+
+
+def test_python_spec_for_path_inspects_once(mocker: MockerFixture) -> None:
+    inspect = mocker.spy(VirtualEnv, "get_virtualenv_py_info")
+
+    first = VirtualEnv.python_spec_for_path(Path(sys.executable))
+    interpreter_cache.cache_clear()  # as the next tox invocation
+    second = VirtualEnv.python_spec_for_path(Path(sys.executable))
+
+    assert inspect.call_count == 1
+    assert str(first) == str(second)
+
+
+def test_subprocess_probe_shared(mocker: MockerFixture) -> None:
+    probe = mocker.MagicMock(side_effect=probe_python)
+
+    first = api._probe_cached(sys.executable, probe)  # ruff:ignore[private-member-access]
+    second = api._probe_cached(sys.executable, probe)  # ruff:ignore[private-member-access]
+
+    assert probe.call_count == 1
+    assert first is not None
+    assert second is not None
+    assert second.version_info.major == first.version_info.major
+    assert second.version_info.minor == first.version_info.minor
+    assert second.machine == first.machine
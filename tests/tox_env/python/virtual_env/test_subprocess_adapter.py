@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import re
 import sys
 import textwrap
 from pathlib import Path
@@ -179,7 +181,7 @@ def test_bootstrap_path_deterministic(tmp_path: Path) -> None:
     path3 = _bootstrap_path(tmp_path, "virtualenv<21.0.0")
     assert path1 == path2
     assert path1 != path3
-    assert path1.parent == tmp_path / ".virtualenv-bootstrap"
+    assert path1.parent == tmp_path
 
 
 def test_has_correct_virtualenv_nonexistent(tmp_path: Path) -> None:
@@ -220,14 +222,19 @@ def test_has_correct_virtualenv_subprocess_error(tmp_path: Path, mocker: MockerF
     assert _has_correct_virtualenv(python, "virtualenv<20.22.0") is False
 
 
+def _fake_venv(path: str, **_: object) -> None:
+    bin_dir = Path(path) / ("Scripts" if sys.platform == "win32" else "bin")
+    bin_dir.mkdir(parents=True)
+    (bin_dir / ("python.exe" if sys.platform == "win32" else "python")).write_text("")
+
+
 def test_ensure_bootstrap_creates_and_caches(tmp_path: Path, mocker: MockerFixture) -> None:
-    venv_create = mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.venv.create")
+    venv_create = mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.venv.create", side_effect=_fake_venv)
     run_mock = mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.subprocess.run")
     run_mock.return_value = mocker.MagicMock(returncode=0, stdout="20.21.1\n")
-
     has_correct = mocker.patch(
         "tox.tox_env.python.virtual_env.subprocess_adapter._has_correct_virtualenv",
-        side_effect=[False, False, True],
+        return_value=True,
     )
 
     result = ensure_bootstrap(tmp_path, "virtualenv<20.22.0")
@@ -237,16 +244,60 @@ def test_ensure_bootstrap_creates_and_caches(tmp_path: Path, mocker: MockerFixtu
 
     result2 = ensure_bootstrap(tmp_path, "virtualenv<20.22.0")
     assert result == result2
-    assert has_correct.call_count == 3
+    venv_create.assert_called_once()
+    assert has_correct.call_count == 1
+
+
+def test_ensure_bootstrap_rebuilds_changed(tmp_path: Path, mocker: MockerFixture) -> None:
+    venv_create = mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.venv.create", side_effect=_fake_venv)
+    run_mock = mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.subprocess.run")
+    run_mock.return_value = mocker.MagicMock(returncode=0)
+    mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter._has_correct_virtualenv", return_value=True)
+    python = ensure_bootstrap(tmp_path, "virtualenv<20.22.0")
+
+    python.write_text("changed")
+
+    assert ensure_bootstrap(tmp_path, "virtualenv<20.22.0") == python
+    assert venv_create.call_count == 2
 
 
 def test_ensure_bootstrap_race_inside_lock(tmp_path: Path, mocker: MockerFixture) -> None:
+    venv_create = mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.venv.create")
     mocker.patch(
-        "tox.tox_env.python.virtual_env.subprocess_adapter._has_correct_virtualenv",
+        "tox.tox_env.python.virtual_env.subprocess_adapter._bootstrap_intact",
         side_effect=[False, True],
     )
     result = ensure_bootstrap(tmp_path, "virtualenv<20.22.0")
     assert result.name == ("python.exe" if sys.platform == "win32" else "python")
+    venv_create.assert_not_called()
+
+
+def test_ensure_bootstrap_wrong_version_installed(tmp_path: Path, mocker: MockerFixture) -> None:
+    mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.venv.create", side_effect=_fake_venv)
+    run_mock = mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.subprocess.run")
+    run_mock.return_value = mocker.MagicMock(returncode=0)
+    mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter._has_correct_virtualenv", return_value=False)
+
+    with pytest.raises(RuntimeError, match=re.escape("does not satisfy virtualenv<20.22.0")):
+        ensure_bootstrap(tmp_path, "virtualenv<20.22.0")
+    assert not (_bootstrap_path(tmp_path, "virtualenv<20.22.0") / "tox-bootstrap.json").exists()
+
+
+def test_ensure_bootstrap_evicts_least_recently_used(tmp_path: Path, mocker: MockerFixture) -> None:
+    mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.venv.create", side_effect=_fake_venv)
+    run_mock = mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter.subprocess.run")
+    run_mock.return_value = mocker.MagicMock(returncode=0)
+    mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter._has_correct_virtualenv", return_value=True)
+    mocker.patch("tox.tox_env.python.virtual_env.subprocess_adapter._BOOTSTRAP_KEEP", 3)
+    for at, spec in enumerate(("virtualenv<20", "virtualenv<21", "virtualenv<22")):
+        ensure_bootstrap(tmp_path, spec)
+        os.utime(_bootstrap_path(tmp_path, spec) / "tox-bootstrap.json", (at, at))
+    ensure_bootstrap(tmp_path, "virtualenv<20")  # makes it the most recently used one
+
+    ensure_bootstrap(tmp_path, "virtualenv<23")
+
+    kept = {p.name for p in tmp_path.iterdir() if p.is_dir()}
+    assert kept == {_bootstrap_path(tmp_path, f"virtualenv<{v}").name for v in (20, 22, 23)}
 
 
 def test_ensure_bootstrap_removes_stale_base(tmp_path: Path, mocker: MockerFixture) -> None:
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tox.tox_env.python.virtual_env.template import TEMPLATES_DIR, UNUSED_DAYS, can_clone, clone, ensure_template
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from tox.pytest import ToxProjectCreator
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="templates are not used on Windows")
+
+
+def _build(template: Path) -> None:
+    (template / "bin").mkdir(parents=True)
+    (template / "pyvenv.cfg").write_text(f"home = /usr/bin\ncommand = python -m virtualenv {template}\n")
+    (template / "bin" / "pip").write_text(f"#!{template}/bin/python\n")
+    (template / "bin" / "activate.csh").write_text(f"setenv VIRTUAL_ENV {template}\nset prompt = '(''0123abcd'') '\n")
+    (template / "bin" / "python").symlink_to(sys.executable)
+    (template / "lib" / "__pycache__").mkdir(parents=True)
+    (template / "lib" / "__pycache__" / "magic.pyc").write_bytes(f"\0{template}/lib/magic.py".encode())
+
+
+def test_clone_fixes_up_paths(tmp_path: Path) -> None:
+    template = tmp_path / "t" / "0123abcd"
+    referring = ensure_template(template, {}, _build)
+    env_dir = tmp_path / "env"
+
+    assert referring is not None
+    clone(template, env_dir, referring)
+
+    assert (env_dir / "pyvenv.cfg").read_text().endswith(f"-m virtualenv {env_dir}\n")
+    assert (env_dir / "bin" / "pip").read_text() == f"#!{env_dir}/bin/python\n"
+    csh = f"setenv VIRTUAL_ENV {env_dir}\nset prompt = '(''env'') '\n"
+    assert (env_dir / "bin" / "activate.csh").read_text() == csh
+    assert (env_dir / "bin" / "python").readlink() == Path(sys.executable)
+    assert not (env_dir / "lib" / "__pycache__" / "magic.pyc").exists()
+    assert (template / "bin" / "pip").read_text() == f"#!{template}/bin/python\n"
+
+
+def test_template_with_binary_referring_to_it_not_cloned(tmp_path: Path) -> None:
+    def _build_binary(template: Path) -> None:
+        template.mkdir()
+        (template / "tool").write_bytes(f"\0{template}".encode())
+
+    assert ensure_template(tmp_path / "abc", {}, _build_binary) is None
+
+
+def test_ensure_template_builds_once(tmp_path: Path, mocker: MockerFixture) -> None:
+    template = tmp_path / "abc"
+    build = mocker.MagicMock(side_effect=lambda path: path.mkdir())
+
+    assert ensure_template(template, {"a": 1}, build) == []
+    assert ensure_template(template, {"a": 1}, build) == []
+
+    build.assert_called_once_with(template)
+    assert json.loads((tmp_path / "abc.json").read_text()) == {"key": {"a": 1}, "referring": []}
+
+
+def test_ensure_template_rebuilds_incomplete(tmp_path: Path, mocker: MockerFixture) -> None:
+    template = tmp_path / "abc"
+    (template / "left").mkdir(parents=True)
+    build = mocker.MagicMock(side_effect=lambda path: path.mkdir())
+
+    ensure_template(template, {}, build)
+
+    build.assert_called_once_with(template)
+    assert not (template / "left").exists()
+
+
+def test_ensure_template_prunes_unused(tmp_path: Path) -> None:
+    for name in ("used", "unused"):
+        ensure_template(tmp_path / name, {}, lambda path: path.mkdir())
+    old = time.time() - (UNUSED_DAYS + 1) * 24 * 3600
+    for name in ("used", "unused"):
+        os.utime(tmp_path / f"{name}.json", (old, old))
+    ensure_template(tmp_path / "used", {}, lambda path: path.mkdir())  # cloning it marks it as used
+
+    ensure_template(tmp_path / "new", {}, lambda path: path.mkdir())
+
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == ["new", "used"]
+    assert not (tmp_path / "unused.json").exists()
+
+
+@pytest.mark.parametrize(("path", "result"), [("/a/.tox/py-3.11", True), ("/a b/.tox/py", False), ("/a'/py", False)])
+def test_can_clone(path: str, result: bool) -> None:
+    assert can_clone(Path(path)) is result
+
+
+def test_envs_share_a_template(tox_project: ToxProjectCreator) -> None:
+    ini = "[tox]\nenv_list = a, b\n[testenv]\npackage = skip\ncommands = pip --version\n"
+    project = tox_project({"tox.ini": ini})
+
+    outcome = project.run("r")
+
+    outcome.assert_success()
+    templates = [path for path in (project.path / ".tox" / TEMPLATES_DIR).iterdir() if path.is_dir()]
+    assert len(templates) == 1
+    for name in ("a", "b"):
+        env_dir = project.path / ".tox" / name
+        assert f"from {env_dir}" in outcome.out
+        info = json.loads((env_dir / ".tox-info.json").read_text())
+        assert info["Python"]["venv template"] == templates[0].name
+
+
+def test_venv_template_disabled(tox_project: ToxProjectCreator) -> None:
+    project = tox_project({"tox.ini": "[testenv]\npackage = skip\nvenv_template = false\n"})
+
+    outcome = project.run("r", "-e", "py")
+
+    outcome.assert_success()
+    assert not (project.path / ".tox" / TEMPLATES_DIR).exists()
+    assert "venv template" not in json.loads((project.path / ".tox" / "py" / ".tox-info.json").read_text())["Python"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 import sys
 from pathlib import Path
@@ -12,6 +13,7 @@ from virtualenv import __version__ as virtualenv_version
 from virtualenv import session_via_cli
 from virtualenv.config.cli.parser import VirtualEnvOptions
 
+from tox.tox_env.python.virtual_env import api
 from tox.tox_env.python.virtual_env.api import VirtualEnv
 
 if TYPE_CHECKING:
@@ -184,6 +186,15 @@ def test_list_dependencies_command(tox_project: ToxProjectCreator) -> None:
     assert request.cmd == ["python", "-m", "pip", "freeze"]
 
 
+def test_list_dependencies_from_metadata(tox_project: ToxProjectCreator) -> None:
+    proj = tox_project({"tox.ini": "[testenv]\npackage=skip"})
+    execute_calls = proj.patch_execute(lambda r: 0 if "install" in r.run_id else None)
+    result = proj.run("r", "--list-dependencies")
+    result.assert_success()
+    assert "pip==" in result.out
+    assert "freeze" not in [call[0][3].run_id for call in execute_calls.call_args_list]
+
+
 def test_posargs_colon_in_inactive_env_does_not_crash(tox_project: ToxProjectCreator) -> None:
     project = tox_project({
         "tox.toml": """
@@ -370,3 +381,56 @@ def test_virtualenv_spec_subprocess_missing_interpreter(
     result.assert_failed()
     assert "could not find python interpreter" in result.out
     ensure_bootstrap.assert_not_called()  # a missing interpreter must skip without bootstrapping
+
+
+def test_unchanged_env_skips_setup(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    proj = tox_project({"tox.ini": "[testenv]\npackage=skip\ndeps=magic\ncommands=python -c 'print(1)'"})
+    execute_calls = proj.patch_execute(lambda r: 0 if "install" in r.run_id else None)
+    proj.run("r", "-e", "py").assert_success()
+    session = mocker.spy(api, "session_via_cli")
+    execute_calls.reset_mock()
+
+    result = proj.run("r", "-e", "py")
+
+    result.assert_success()
+    assert session.call_count == 0
+    assert [i[0][3].run_id for i in execute_calls.call_args_list] == ["commands[0]"]
+
+
+def test_changed_deps_redo_setup(tox_project: ToxProjectCreator) -> None:
+    proj = tox_project({"tox.ini": "[testenv]\npackage=skip\ndeps=magic"})
+    execute_calls = proj.patch_execute(lambda r: 0 if "install" in r.run_id else None)
+    proj.run("r", "-e", "py").assert_success()
+    (proj.path / "tox.ini").write_text("[testenv]\npackage=skip\ndeps=magic\n  other")
+    execute_calls.reset_mock()
+
+    result = proj.run("r", "-e", "py")
+
+    result.assert_success()
+    assert execute_calls.call_args[0][3].cmd[-1] == "other"
+
+
+def test_changed_interpreter_redo_discovery(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    proj = tox_project({"tox.ini": "[testenv]\npackage=skip"})
+    proj.run("r", "-e", "py").assert_success()
+    info_file = proj.path / ".tox" / "py" / ".tox-info.json"
+    info = json.loads(info_file.read_text())
+    info["setup"]["state"]["executable"][0] += 1  # as if the interpreter was upgraded in place
+    info_file.write_text(json.dumps(info))
+    session = mocker.spy(api, "session_via_cli")
+
+    proj.run("r", "-e", "py").assert_success()
+
+    assert session.call_count == 1
+
+
+def test_changed_pyvenv_cfg_redo_setup(tox_project: ToxProjectCreator, mocker: MockerFixture) -> None:
+    proj = tox_project({"tox.ini": "[testenv]\npackage=skip"})
+    proj.run("r", "-e", "py").assert_success()
+    pyvenv_cfg = proj.path / ".tox" / "py" / "pyvenv.cfg"
+    pyvenv_cfg.write_text(f"{pyvenv_cfg.read_text()}include-system-site-packages = true\n")
+    session = mocker.spy(api, "session_via_cli")
+
+    proj.run("r", "-e", "py").assert_success()
+
+    assert session.call_count == 1
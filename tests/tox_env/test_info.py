@@ -38,3 +38,43 @@ def test_info_non_dict_section_self_heals(tmp_path: Path) -> None:
         assert (eq, old) == (False, None)
 
     assert json.loads((tmp_path / ".tox-info.json").read_text()) == {"PythonRun": {"deps": ["six"]}}
+
+
+def test_info_batch_writes_once(tmp_path: Path) -> None:
+    info = Info(tmp_path)
+    with info.batch():
+        with info.compare({"name": "py"}, "ToxEnv"):
+            pass
+        with info.compare(["six"], "PythonRun", "deps"):
+            pass
+        assert not (tmp_path / ".tox-info.json").exists()
+
+    assert (tmp_path / ".tox-info.json").read_text() == '{"ToxEnv":{"name":"py"},"PythonRun":{"deps":["six"]}}'
+    assert [p.name for p in tmp_path.iterdir()] == [".tox-info.json"]
+
+
+def test_info_batch_writes_when_raised(tmp_path: Path) -> None:
+    info = Info(tmp_path)
+
+    def _set_up() -> None:
+        with info.batch():
+            with info.compare({"name": "py"}, "ToxEnv"):
+                pass
+            with info.compare(["six"], "PythonRun", "deps"):
+                msg = "install failed"
+                raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="install failed"):
+        _set_up()
+
+    assert json.loads((tmp_path / ".tox-info.json").read_text()) == {"ToxEnv": {"name": "py"}}
+
+
+def test_info_read_once(tmp_path: Path) -> None:
+    (tmp_path / ".tox-info.json").write_text('{"ToxEnv": {"name": "py"}}')
+    info = Info(tmp_path)
+    (tmp_path / ".tox-info.json").unlink()
+
+    with info.compare({"name": "py"}, "ToxEnv") as (eq, _):
+        assert eq is True
+    assert not (tmp_path / ".tox-info.json").exists()
@@ -3,11 +3,18 @@ from __future__ import annotations
 import multiprocessing
 from typing import TYPE_CHECKING
 
-from tox.util.cpu import auto_detect_cpus
+import pytest
+
+from tox.util import cpu
+from tox.util.cpu import Load, auto_detect_cpus, cgroup_cpu_limit, pressure, read_load, usable_cpus
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_mock import MockerFixture
 
+_PRESSURE = "some avg10={} avg60=0.00 avg300=0.00 total=0"
+
 
 def test_auto_detect_cpus() -> None:
     num_cpus_actual = multiprocessing.cpu_count()
@@ -17,3 +24,58 @@ def test_auto_detect_cpus() -> None:
 def test_auto_detect_cpus_returns_one_when_cpu_count_throws(mocker: MockerFixture) -> None:
     mocker.patch.object(multiprocessing, "cpu_count", side_effect=NotImplementedError)
     assert auto_detect_cpus() == 1
+
+
+def test_usable_cpus_affinity(mocker: MockerFixture) -> None:
+    mocker.patch.object(cpu.os, "sched_getaffinity", return_value={0, 1, 2}, create=True)
+    mocker.patch.object(cpu, "cgroup_cpu_limit", return_value=None)
+    assert usable_cpus() == 3
+
+
+def test_usable_cpus_cgroup_quota(mocker: MockerFixture) -> None:
+    mocker.patch.object(cpu.os, "sched_getaffinity", return_value={0, 1, 2, 3}, create=True)
+    mocker.patch.object(cpu, "cgroup_cpu_limit", return_value=2.5)
+    assert usable_cpus() == 2
+
+
+def test_usable_cpus_small_quota(mocker: MockerFixture) -> None:
+    mocker.patch.object(cpu.os, "sched_getaffinity", return_value={0, 1}, create=True)
+    mocker.patch.object(cpu, "cgroup_cpu_limit", return_value=0.5)
+    assert usable_cpus() == 1
+
+
+def test_cgroup_cpu_limit_tightest(tmp_path: Path, mocker: MockerFixture) -> None:
+    leaf = tmp_path / "a" / "b"
+    leaf.mkdir(parents=True)
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    (tmp_path / "a" / "cpu.max").write_text("150000 100000\n")
+    (leaf / "cpu.max").write_text("300000 100000\n")
+    mocker.patch.object(cpu, "CGROUP_ROOT", tmp_path)
+    mocker.patch.object(cpu, "_cgroup_dir", return_value=leaf)
+    assert cgroup_cpu_limit() == pytest.approx(1.5)
+
+
+def test_cgroup_cpu_limit_none(tmp_path: Path, mocker: MockerFixture) -> None:
+    mocker.patch.object(cpu, "CGROUP_ROOT", tmp_path)
+    mocker.patch.object(cpu, "_cgroup_dir", return_value=tmp_path)
+    assert cgroup_cpu_limit() is None
+
+
+def test_pressure_prefers_cgroup(tmp_path: Path, mocker: MockerFixture) -> None:
+    (tmp_path / "proc").mkdir()
+    (tmp_path / "proc" / "cpu").write_text(f"{_PRESSURE.format(1.5)}\n")
+    (tmp_path / "cpu.pressure").write_text(f"{_PRESSURE.format(42.25)}\nfull avg10=1.00 avg60=0.00 avg300=0 total=0\n")
+    mocker.patch.object(cpu, "PRESSURE_ROOT", tmp_path / "proc")
+    mocker.patch.object(cpu, "_cgroup_dir", return_value=tmp_path)
+    assert pressure("cpu") == pytest.approx(42.25)
+    mocker.patch.object(cpu, "_cgroup_dir", return_value=None)
+    assert pressure("cpu") == pytest.approx(1.5)
+    assert pressure("memory") is None
+
+
+def test_read_load(mocker: MockerFixture) -> None:
+    mocker.patch.object(cpu, "usable_cpus", return_value=2)
+    mocker.patch.object(cpu, "auto_detect_cpus", return_value=4)
+    mocker.patch.object(cpu.os, "getloadavg", return_value=(2.0, 1.0, 0.5), create=True)
+    mocker.patch.object(cpu, "pressure", side_effect=[3.0, None])
+    assert read_load() == Load(cpus=2, load_average=0.5, cpu_pressure=3.0, memory_pressure=None)
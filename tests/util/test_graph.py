@@ -4,7 +4,7 @@ from collections import OrderedDict
 
 import pytest
 
-from tox.util.graph import stable_topological_sort
+from tox.util.graph import ReadySet, critical_path, stable_topological_sort
 
 
 def test_topological_order_empty() -> None:
@@ -70,3 +70,57 @@ def test_two_sub_graph_circle() -> None:
     graph["C"] = set()
     with pytest.raises(ValueError, match=r"^A \| B$"):
         stable_topological_sort(graph)
+
+
+def test_critical_path() -> None:
+    graph: dict[str, set[str]] = OrderedDict()
+    graph["A"] = set()
+    graph["B"] = set()
+    graph["C"] = {"A"}
+    graph["D"] = {"C"}
+    order = stable_topological_sort(graph)
+    result = critical_path(graph, order, {"A": 1.0, "B": 5.0, "C": 2.0, "D": 3.0})
+    assert result == {"A": 6.0, "B": 5.0, "C": 5.0, "D": 3.0}
+
+
+def test_critical_path_missing_weight() -> None:
+    graph: dict[str, set[str]] = OrderedDict()
+    graph["A"] = set()
+    graph["B"] = {"A"}
+    result = critical_path(graph, ["A", "B"], {"B": 2.0})
+    assert result == {"A": 2.0, "B": 2.0}
+
+
+def test_topological_order_keeps_original_order_of_ready_nodes() -> None:
+    graph: dict[str, set[str]] = OrderedDict()
+    graph["C"] = {"A"}
+    graph["B"] = set()
+    graph["A"] = set()
+    graph["D"] = set()
+    assert stable_topological_sort(graph) == ["B", "A", "C", "D"]
+
+
+def test_topological_order_long_chain() -> None:
+    graph: dict[str, set[str]] = OrderedDict((f"n{i}", {f"n{i - 1}"} if i else set()) for i in range(5000))
+    assert stable_topological_sort(dict(reversed(graph.items()))) == list(graph)
+
+
+def test_ready_set() -> None:
+    graph = {"A": set(), "B": set(), "C": {"A", "B"}, "D": {"A"}}
+    ready = ReadySet(graph, ["A", "B", "C", "D"])
+    assert ready.pop() == ["A", "B"]
+    assert ready.pop() == []
+    ready.complete("B")
+    assert ready.pop() == []
+    ready.complete("A")
+    ready.complete("A")  # completing twice does not release dependants twice
+    assert ready
+    assert ready.pop() == ["C", "D"]
+    assert not ready
+
+
+def test_ready_set_ignores_outside_nodes() -> None:
+    ready = ReadySet({"A": {"X"}}, ["A"])
+    ready.complete("X")
+    assert ready.pop() == ["A"]
+    assert repr(ready) == "ReadySet(nodes=1, handed_out=1)"
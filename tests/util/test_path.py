@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from tox.util.path import ensure_cachedir_tag, ensure_empty_dir, ensure_gitignore
+from tox.util.path import clone_file, ensure_cachedir_tag, ensure_empty_dir, ensure_gitignore
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -85,3 +85,14 @@ def test_ensure_gitignore_idempotent(tmp_path: Path) -> None:
     ensure_gitignore(target)
     ensure_gitignore(target)
     assert (target / ".gitignore").read_text(encoding="utf-8") == "*\n"
+
+
+def test_clone_file_keeps_mode(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    source.write_text("content", encoding="utf-8")
+    source.chmod(0o750)
+    clone_file(str(source), str(tmp_path / "target"))
+    source.write_text("changed", encoding="utf-8")
+
+    assert (tmp_path / "target").read_text(encoding="utf-8") == "content"
+    assert (tmp_path / "target").stat().st_mode == source.stat().st_mode
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from tox.util import trash
+from tox.util.trash import TRASH_DIR, empty_dir, reap
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _wait_deleted(path: Path) -> bool:
+    for _ in range(200):
+        if not path.exists() or not list(path.iterdir()):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_empty_dir_moves_into_trash(tmp_path: Path, mocker: MockerFixture) -> None:
+    schedule = mocker.patch("tox.util.trash._schedule")
+    env_dir = tmp_path / "py"
+    (env_dir / "lib" / "site-packages").mkdir(parents=True)
+    (env_dir / "file.lock").write_text("")
+    (env_dir / "pyvenv.cfg").write_text("")
+
+    empty_dir(env_dir, tmp_path, except_filename="file.lock")
+
+    assert [p.name for p in env_dir.iterdir()] == ["file.lock"]
+    batch = schedule.call_args[0][0]
+    assert batch.parent == tmp_path / TRASH_DIR
+    assert sorted(p.name for p in batch.iterdir()) == ["lib", "pyvenv.cfg"]
+
+
+def test_empty_dir_deletes_in_background(tmp_path: Path) -> None:
+    env_dir = tmp_path / "py"
+    (env_dir / "lib").mkdir(parents=True)
+
+    empty_dir(env_dir, tmp_path)
+
+    assert env_dir.is_dir()
+    assert not list(env_dir.iterdir())
+    assert _wait_deleted(tmp_path / TRASH_DIR)
+
+
+def test_empty_dir_file(tmp_path: Path) -> None:
+    dest = tmp_path / "a"
+    dest.write_text("")
+    empty_dir(dest, tmp_path)
+    assert dest.is_dir()
+    assert not (tmp_path / TRASH_DIR).exists()
+
+
+def test_empty_dir_cannot_move(tmp_path: Path, mocker: MockerFixture) -> None:
+    mocker.patch.object(Path, "rename", side_effect=OSError("cross-device link"))
+    env_dir = tmp_path / "py"
+    (env_dir / "lib").mkdir(parents=True)
+    (env_dir / "pyvenv.cfg").write_text("")
+
+    empty_dir(env_dir, tmp_path)
+
+    assert not list(env_dir.iterdir())
+
+
+def test_reap_left_behind(tmp_path: Path) -> None:
+    (tmp_path / TRASH_DIR / "interrupted" / "lib").mkdir(parents=True)
+
+    reap(tmp_path)
+
+    assert _wait_deleted(tmp_path / TRASH_DIR)
+
+
+def test_detach_deletes_what_is_left(tmp_path: Path, mocker: MockerFixture) -> None:
+    batch = tmp_path / TRASH_DIR / "left"
+    (batch / "lib").mkdir(parents=True)
+    mocker.patch.object(trash, "_PENDING", {batch})
+
+    trash._detach()  # ruff:ignore[private-member-access]
+
+    assert _wait_deleted(tmp_path / TRASH_DIR)